@@ -1,25 +1,51 @@
-from flask import Flask, request, jsonify, render_template, session, redirect, url_for
+import time
+_MODULE_LOAD_START = time.perf_counter()
+
+import click
+from flask import Flask, request, jsonify, render_template, session, redirect, url_for, Response, stream_with_context, g
 from flask_cors import CORS
-import pandas as pd
 import numpy as np
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
 import re
 import os
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import logging
 import sqlite3
 from pathlib import Path
 import json
-from textblob import TextBlob
-from transformers import pipeline
-import torch
+import math
+import importlib
+import threading
+import contextvars
+import bisect
+import multiprocessing
+import queue
+import contextlib
+import concurrent.futures
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import textstat
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urljoin, urlencode
 import hashlib
-import time
+import zlib
+import unicodedata
+import uuid
+import atexit
+import base64
+import csv
+import io
+import collections
+from collections import OrderedDict
+import sys
+import hmac
+import marshal
+import cProfile
+import pstats
+
+# Schwere Abhängigkeiten (transformers, torch, nltk, textblob, textstat)
+# werden erst bei Bedarf über lazy_import() geladen.
 
 # Flask App Setup
 app = Flask(__name__)
@@ -31,7 +57,467 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Database Setup
-DATABASE_PATH = 'credibility_database.db'
+DATABASE_PATH = os.environ.get('DATABASE_PATH', 'credibility_database.db')
+
+# SQLite-Tuning für gepoolte Verbindungen
+SQLITE_POOL_SIZE = int(os.environ.get('SQLITE_POOL_SIZE', 8))
+SQLITE_CACHE_SIZE_KB = int(os.environ.get('SQLITE_CACHE_SIZE_KB', 64 * 1024))
+SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+
+# Batch-Analyse
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', 500))
+
+# Write-Behind-Queue für das Speichern von Analysen
+WRITE_BEHIND_ENABLED = os.environ.get('WRITE_BEHIND', '1') == '1'
+WRITE_BEHIND_QUEUE_SIZE = int(os.environ.get('WRITE_BEHIND_QUEUE_SIZE', 1000))
+WRITE_BEHIND_BATCH_SIZE = int(os.environ.get('WRITE_BEHIND_BATCH_SIZE', 100))
+WRITE_BEHIND_FLUSH_MS = float(os.environ.get('WRITE_BEHIND_FLUSH_MS', 200))
+WRITE_BEHIND_PUT_TIMEOUT = float(os.environ.get('WRITE_BEHIND_PUT_TIMEOUT', 2.0))
+
+# Export
+EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE', 500))
+
+# Dokument-Speicher: Kompression der Texte (zlib, zstd mit Paket zstandard, none)
+DOCUMENT_CODEC = os.environ.get('DOCUMENT_CODEC', 'zlib').lower()
+DOCUMENT_COMPRESSION_LEVEL = int(os.environ.get('DOCUMENT_COMPRESSION_LEVEL', 6))
+
+# Web-Scraping: Parallelität, Höflichkeit pro Host, Verbindungspool, Retries
+SCRAPER_MAX_WORKERS = int(os.environ.get('SCRAPER_MAX_WORKERS', 16))
+SCRAPER_PER_HOST_LIMIT = int(os.environ.get('SCRAPER_PER_HOST_LIMIT', 2))
+SCRAPER_HOST_INTERVAL_MS = float(os.environ.get('SCRAPER_HOST_INTERVAL_MS', 250))
+SCRAPER_CONNECT_TIMEOUT = float(os.environ.get('SCRAPER_CONNECT_TIMEOUT', 5))
+SCRAPER_READ_TIMEOUT = float(os.environ.get('SCRAPER_READ_TIMEOUT', 10))
+SCRAPER_RETRIES = int(os.environ.get('SCRAPER_RETRIES', 2))
+SCRAPER_BACKOFF = float(os.environ.get('SCRAPER_BACKOFF', 0.5))
+MAX_URL_BATCH_SIZE = int(os.environ.get('MAX_URL_BATCH_SIZE', 200))
+SCRAPER_MAX_BYTES = int(os.environ.get('SCRAPER_MAX_BYTES', 5 * 1024 * 1024))
+SCRAPER_PARSER = os.environ.get('SCRAPER_PARSER', 'auto').lower()  # auto, lxml, bs4
+
+# HTTP-Cache des Scrapers (leerer Pfad deaktiviert ihn)
+SCRAPER_CACHE_PATH = os.environ.get(
+    'SCRAPER_CACHE_PATH', os.path.join(os.path.dirname(DATABASE_PATH), 'scraper_cache.db')
+)
+SCRAPER_CACHE_MAX_BYTES = int(os.environ.get('SCRAPER_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+
+# Hintergrund-Jobs
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 4))
+JOB_QUEUE_SIZE = int(os.environ.get('JOB_QUEUE_SIZE', 1000))
+JOB_TTL = float(os.environ.get('JOB_TTL', 3600))
+JOB_POLL_INTERVAL_MS = float(os.environ.get('JOB_POLL_INTERVAL_MS', 250))
+# Server-Sent Events belegen einen Worker-Thread für die ganze Stream-Dauer;
+# nur mit gthread-/gevent-Workern aktivieren (sonst fragen Clients per Polling)
+JOB_EVENTS_ENABLED = os.environ.get('JOB_EVENTS', '0') == '1'
+JOB_STREAM_TIMEOUT = float(os.environ.get('JOB_STREAM_TIMEOUT', 300))
+
+# Domain-Reputation: CSV/JSON-Datei mit bewerteten Domains (leer = nur Standardliste)
+DOMAIN_REPUTATION_PATH = os.environ.get('DOMAIN_REPUTATION_PATH', '')
+DOMAIN_REPUTATION_RELOAD_INTERVAL = float(os.environ.get('DOMAIN_REPUTATION_RELOAD_INTERVAL', 30))
+
+# Metriken: Histogramm-Grenzen in Sekunden für Stage- und Request-Latenzen (/metrics)
+METRICS_BUCKETS = tuple(float(bound) for bound in os.environ.get(
+    'METRICS_BUCKETS', '0.0005,0.001,0.0025,0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10').split(','))
+
+# Profiling einzelner Requests (Header X-Profile bzw. ?profile=); nur mit PROFILING_ENABLED=1
+# und PROFILING_TOKEN (X-Profile-Token muss übereinstimmen)
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', '0') == '1'
+PROFILING_TOKEN = os.environ.get('PROFILING_TOKEN', '')
+PROFILING_MODE = os.environ.get('PROFILING_MODE', 'cprofile').lower()  # cprofile, sample
+PROFILING_SAMPLE_INTERVAL_MS = float(os.environ.get('PROFILING_SAMPLE_INTERVAL_MS', 5))
+PROFILING_KEEP = int(os.environ.get('PROFILING_KEEP', 20))  # langsamste Requests mit Profil
+PROFILING_DIR = os.environ.get('PROFILING_DIR', '')  # Artefakte zusätzlich als Dateien ablegen
+
+# Profile verraten Code-Pfade und Laufzeiten; ohne Token bleibt Profiling aus
+if PROFILING_ENABLED and not PROFILING_TOKEN:
+    logger.warning("⚠️ PROFILING_ENABLED=1 ohne PROFILING_TOKEN, Profiling bleibt deaktiviert")
+    PROFILING_ENABLED = False
+
+# Suche: maximale Seitengröße
+SEARCH_MAX_LIMIT = int(os.environ.get('SEARCH_MAX_LIMIT', 500))
+
+# Version der Scoring-Logik; bei Änderungen an Heuristiken erhöhen (invalidiert den Ergebnis-Cache)
+ANALYSIS_VERSION = '1.3'
+
+# Ergebnis-Cache (In-Memory-LRU + SQLite)
+RESULT_CACHE_SIZE = int(os.environ.get('RESULT_CACHE_SIZE', 1024))
+RESULT_CACHE_TTL = int(os.environ.get('RESULT_CACHE_TTL', 7 * 24 * 3600))
+RESULT_CACHE_MAX_ROWS = int(os.environ.get('RESULT_CACHE_MAX_ROWS', 50000))
+# last_access nur aktualisieren, wenn älter als N Sekunden (spart Schreibsperren bei Treffern)
+RESULT_CACHE_TOUCH_INTERVAL = float(os.environ.get('RESULT_CACHE_TOUCH_INTERVAL', 3600))
+# Größenbasierte Verdrängung nur alle N Schreibvorgänge statt bei jedem
+RESULT_CACHE_TRIM_EVERY = max(1, int(os.environ.get('RESULT_CACHE_TRIM_EVERY', 100)))
+
+# Analyzer-Modus: 'full' (mit Transformer-Modell) oder 'lite' (ohne torch/transformers)
+ANALYZER_MODE = os.environ.get('CREDIBILITY_MODE', 'full').lower()
+
+# Modelle und Sprachressourcen beim Import vorladen (z.B. mit gunicorn --preload)
+WARMUP_ON_START = os.environ.get('CREDIBILITY_WARMUP', '0') == '1'
+
+# Ausführung der Heuristiken: 'inline' (im Request-Thread) oder 'process' (Prozess-Pool, umgeht den GIL)
+ANALYSIS_BACKEND = os.environ.get('ANALYSIS_BACKEND', 'inline').lower()
+ANALYSIS_PROCESSES = int(os.environ.get('ANALYSIS_PROCESSES', os.cpu_count() or 1))
+ANALYSIS_CHUNK_SIZE = int(os.environ.get('ANALYSIS_CHUNK_SIZE', 8))
+ANALYSIS_START_METHOD = os.environ.get('ANALYSIS_START_METHOD', 'forkserver')
+
+# Sehr lange Dokumente: satzbündige Chunks ab dieser Länge, Größen- und Zeitbudget pro Dokument
+ANALYSIS_STREAM_THRESHOLD = int(os.environ.get('ANALYSIS_STREAM_THRESHOLD', 100000))
+ANALYSIS_STREAM_CHUNK_CHARS = int(os.environ.get('ANALYSIS_STREAM_CHUNK_CHARS', 32768))
+ANALYSIS_MAX_CHARS = int(os.environ.get('ANALYSIS_MAX_CHARS', 2000000))
+ANALYSIS_TIME_BUDGET = float(os.environ.get('ANALYSIS_TIME_BUDGET', 10))
+
+# Standard-Detailstufe der Analyse-APIs: 'score' (nur Scores), 'summary' (plus Kennzahlen,
+# Empfehlungen, Issues) oder 'full' (plus detailed_analysis); pro Request über ``detail``
+ANALYSIS_DETAIL_LEVEL = os.environ.get('ANALYSIS_DETAIL_LEVEL', 'full').lower()
+
+# Modell-Inferenz mit Micro-Batching
+INFERENCE_MAX_BATCH_SIZE = int(os.environ.get('INFERENCE_MAX_BATCH_SIZE', 16))
+INFERENCE_MAX_WAIT_MS = float(os.environ.get('INFERENCE_MAX_WAIT_MS', 10))
+INFERENCE_MAX_CHARS = int(os.environ.get('INFERENCE_MAX_CHARS', 2000))
+INFERENCE_TIMEOUT = float(os.environ.get('INFERENCE_TIMEOUT', 30))
+
+# Startzeit-Bericht (über /api/health abrufbar)
+STARTUP_REPORT = {
+    'mode': ANALYZER_MODE,
+    'module_load_seconds': None,
+    'warmup_seconds': None,
+    'lazy_loads': {}
+}
+
+_lazy_modules = {}
+_lazy_import_lock = threading.Lock()
+
+def lazy_import(module_name):
+    """Importiert ein schweres Modul erst bei der ersten Verwendung"""
+    module = _lazy_modules.get(module_name)
+    if module is None:
+        with _lazy_import_lock:
+            module = _lazy_modules.get(module_name)
+            if module is None:
+                start = time.perf_counter()
+                module = importlib.import_module(module_name)
+                _lazy_modules[module_name] = module
+                STARTUP_REPORT['lazy_loads'][module_name] = round(time.perf_counter() - start, 3)
+                logger.info(f"📦 Modul {module_name} nachgeladen")
+    return module
+
+class _Span:
+    """Misst einen Block mit perf_counter_ns (siehe StageMetrics.span)"""
+    
+    __slots__ = ('metrics', 'stage', 'start')
+    
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+    
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.metrics.observe(self.stage, time.perf_counter_ns() - self.start)
+        return False
+
+class StageMetrics:
+    """Latenz-Histogramme je Verarbeitungsschritt und Endpoint im Prometheus-Textformat.
+    
+    ``span(stage)`` misst einen Block mit perf_counter_ns und zählt ihn in das
+    Histogramm des Schritts sowie in die Aufschlüsselung des laufenden Requests
+    (``breakdown()``). Die Werte gelten pro Prozess.
+    """
+    
+    # Familie -> (Metrikname, Label, Beschreibung)
+    FAMILIES = {
+        'stage': ('credibility_stage_duration_seconds', 'stage', 'Dauer einzelner Verarbeitungsschritte'),
+        'request': ('credibility_http_request_duration_seconds', 'endpoint', 'Dauer von HTTP-Requests je Endpoint')
+    }
+    
+    def __init__(self, buckets=METRICS_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._bounds_ns = [int(bound * 1e9) for bound in self.buckets]
+        # (Familie, Label-Wert) -> [Bucket-Zähler, Summe in ns, Anzahl]
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._breakdown = contextvars.ContextVar('stage_breakdown', default=None)
+    
+    def span(self, stage):
+        return _Span(self, stage)
+    
+    def observe(self, stage, duration_ns, family='stage'):
+        """Zählt eine Messung (ns) in das Histogramm und ggf. in die Request-Aufschlüsselung"""
+        index = bisect.bisect_left(self._bounds_ns, duration_ns)
+        with self._lock:
+            histogram = self._histograms.get((family, stage))
+            if histogram is None:
+                histogram = self._histograms[(family, stage)] = [[0] * (len(self._bounds_ns) + 1), 0, 0]
+            histogram[0][index] += 1
+            histogram[1] += duration_ns
+            histogram[2] += 1
+        
+        if family == 'stage':
+            breakdown = self._breakdown.get()
+            if breakdown is not None:
+                breakdown[stage] = breakdown.get(stage, 0) + duration_ns
+    
+    def record(self, stages):
+        """Übernimmt anderswo gemessene Schritte (z.B. aus Scoring-Prozessen)"""
+        for stage, duration_ns in stages.items():
+            self.observe(stage, duration_ns)
+    
+    def start_breakdown(self):
+        """Beginnt eine neue Aufschlüsselung für den aktuellen Kontext (Request)"""
+        self._breakdown.set({})
+    
+    def stop_breakdown(self):
+        self._breakdown.set(None)
+    
+    @contextlib.contextmanager
+    def collect(self):
+        """Sammelt die Schritte eines Blocks (ns) in einem eigenen dict"""
+        stages = {}
+        token = self._breakdown.set(stages)
+        try:
+            yield stages
+        finally:
+            self._breakdown.reset(token)
+    
+    def breakdown(self):
+        """Aufschlüsselung des laufenden Requests in Millisekunden"""
+        stages = self._breakdown.get() or {}
+        return {stage: round(duration_ns / 1e6, 3) for stage, duration_ns in stages.items()}
+    
+    def render(self, gauges=None, counters=None):
+        """Prometheus-Textformat: Histogramme plus optionale Gauges und Zähler (Name -> (Beschreibung, Wert)).
+        
+        Zähler erhalten das Suffix ``_total``.
+        """
+        with self._lock:
+            snapshot = {key: (list(counts), total, count) for key, (counts, total, count) in self._histograms.items()}
+        
+        lines = []
+        bounds = [format(bound, 'g') for bound in self.buckets] + ['+Inf']
+        for family, (name, label, help_text) in self.FAMILIES.items():
+            series = sorted((value, data) for (series_family, value), data in snapshot.items() if series_family == family)
+            if not series:
+                continue
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for value, (counts, total, count) in series:
+                cumulative = 0
+                for bound, bucket_count in zip(bounds, counts):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{label}="{value}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_sum{{{label}="{value}"}} {total / 1e9}')
+                lines.append(f'{name}_count{{{label}="{value}"}} {count}')
+        
+        for name, (help_text, value) in sorted((gauges or {}).items()):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} gauge')
+            lines.append(f'{name} {value}')
+        
+        for name, (help_text, value) in sorted((counters or {}).items()):
+            lines.append(f'# HELP {name}_total {help_text}')
+            lines.append(f'# TYPE {name}_total counter')
+            lines.append(f'{name}_total {value}')
+        
+        return '\n'.join(lines) + '\n'
+
+metrics = StageMetrics()
+
+class _StackSampler:
+    """Sampling-Profiler: liest in festem Intervall den Stack eines Threads (sys._current_frames)"""
+    
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = collections.Counter()
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                break
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            self.samples[';'.join(reversed(stack))] += 1
+    
+    def collapsed(self):
+        """Collapsed Stacks (eine Zeile pro Stack: ``a;b;c Anzahl``) für flamegraph.pl/speedscope"""
+        return ''.join(f'{stack} {count}\n' for stack, count in self.samples.most_common())
+    
+    def top(self, limit):
+        """Funktionen mit den meisten eigenen Samples"""
+        total = sum(self.samples.values()) or 1
+        own = collections.Counter()
+        inclusive = collections.Counter()
+        for stack, count in self.samples.items():
+            frames = stack.split(';')
+            own[frames[-1]] += count
+            for function in set(frames):
+                inclusive[function] += count
+        return [{
+            'function': function,
+            'own_samples': count,
+            'samples': inclusive[function],
+            'percent': round(inclusive[function] / total * 100, 1)
+        } for function, count in own.most_common(limit)]
+
+class RequestProfiler:
+    """Profiling einzelner Requests auf Anforderung (cProfile oder Sampling).
+    
+    ``start()`` profiliert den aktuellen Thread, ``stop()`` wertet aus und behält
+    die ``keep`` langsamsten Profile samt Artefakt: pstats-Dump bei ``cprofile``
+    (``python -m pstats``), Collapsed Stacks bei ``sample``. Das jeweils neueste
+    Profil bleibt bis zum nächsten abrufbar. Es läuft höchstens ein Profil
+    gleichzeitig; weitere Anforderungen bleiben ohne Profil.
+    """
+    
+    MODES = ('cprofile', 'sample')
+    TOP_FUNCTIONS = 25
+    REPORT_LINES = 60
+    
+    def __init__(self, mode=PROFILING_MODE, keep=PROFILING_KEEP, directory=PROFILING_DIR,
+                 interval=PROFILING_SAMPLE_INTERVAL_MS / 1000.0):
+        self.mode = mode if mode in self.MODES else 'cprofile'
+        self.keep = max(1, keep)
+        self.directory = directory
+        self.interval = interval
+        self._active = threading.Lock()
+        self._lock = threading.Lock()
+        # ID -> (Eintrag, Artefakt, Textbericht)
+        self._profiles = {}
+        self.stats = {'profiled': 0, 'busy': 0, 'failed': 0}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def start(self, mode=None):
+        """Startet ein Profil im aktuellen Thread; None, falls bereits eines läuft"""
+        if not self._active.acquire(blocking=False):
+            self.stats['busy'] += 1
+            return None
+        mode = mode if mode in self.MODES else self.mode
+        try:
+            if mode == 'cprofile':
+                profiler = cProfile.Profile()
+                profiler.enable()
+            else:
+                profiler = _StackSampler(threading.get_ident(), self.interval)
+                profiler.start()
+        except Exception as e:
+            # z.B. bereits aktiver Profiler/Debugger
+            self._active.release()
+            self.stats['failed'] += 1
+            logger.warning(f"⚠️ Profiling nicht möglich: {e}")
+            return None
+        return {'mode': mode, 'profiler': profiler, 'start_ns': time.perf_counter_ns()}
+    
+    def _halt(self, session):
+        try:
+            if session['mode'] == 'cprofile':
+                session['profiler'].disable()
+            else:
+                session['profiler'].stop()
+        finally:
+            self._active.release()
+    
+    def cancel(self, session):
+        """Beendet ein Profil, ohne es zu behalten"""
+        self._halt(session)
+    
+    def stop(self, session, **info):
+        """Beendet ein Profil, behält es bei Bedarf und liefert seine ID"""
+        duration_ns = time.perf_counter_ns() - session['start_ns']
+        self._halt(session)
+        
+        profiler = session['profiler']
+        if session['mode'] == 'cprofile':
+            profiler.create_stats()
+            artifact = marshal.dumps(profiler.stats)
+            top = self._top_functions(profiler.stats)
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(self.REPORT_LINES)
+            report = stream.getvalue()
+        else:
+            report = profiler.collapsed()
+            artifact = report.encode('utf-8')
+            top = profiler.top(self.TOP_FUNCTIONS)
+        
+        profile_id = uuid.uuid4().hex[:16]
+        entry = {
+            'id': profile_id,
+            'mode': session['mode'],
+            'duration_ms': round(duration_ns / 1e6, 3),
+            'created_at': datetime.now().isoformat(),
+            **info,
+            'top': top
+        }
+        
+        evicted = None
+        with self._lock:
+            self.stats['profiled'] += 1
+            if len(self._profiles) >= self.keep:
+                evicted = min(self._profiles, key=lambda key: self._profiles[key][0]['duration_ms'])
+                del self._profiles[evicted]
+            self._profiles[profile_id] = (entry, artifact, report)
+        
+        if self.directory:
+            try:
+                with open(os.path.join(self.directory, self.filename(entry)), 'wb') as f:
+                    f.write(artifact)
+                if evicted:
+                    for extension in ('prof', 'collapsed'):
+                        with contextlib.suppress(FileNotFoundError):
+                            os.unlink(os.path.join(self.directory, f'{evicted}.{extension}'))
+            except OSError as e:
+                logger.warning(f"⚠️ Profil {profile_id} nicht gespeichert: {e}")
+        
+        logger.info(f"🔬 Profil {profile_id} ({session['mode']}): {info.get('path')} in {entry['duration_ms']:.1f}ms")
+        return profile_id
+    
+    def _top_functions(self, stats):
+        """Funktionen mit der höchsten kumulierten Zeit aus cProfile-Statistiken"""
+        rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:self.TOP_FUNCTIONS]
+        return [{
+            'function': name if filename == '~' else f'{name} ({os.path.basename(filename)}:{line})',
+            'calls': calls,
+            'own_ms': round(own * 1000, 3),
+            'cumulative_ms': round(cumulative * 1000, 3)
+        } for (filename, line, name), (_, calls, own, cumulative, _) in rows]
+    
+    @staticmethod
+    def filename(entry):
+        return f"{entry['id']}.{'prof' if entry['mode'] == 'cprofile' else 'collapsed'}"
+    
+    def list(self, limit=None):
+        """Behaltene Profile ohne Artefakt, langsamste zuerst"""
+        with self._lock:
+            entries = [entry for entry, _, _ in self._profiles.values()]
+        entries.sort(key=lambda entry: entry['duration_ms'], reverse=True)
+        return entries[:limit]
+    
+    def get(self, profile_id):
+        """(Eintrag, Artefakt, Textbericht) oder None"""
+        with self._lock:
+            return self._profiles.get(profile_id)
+    
+    def get_stats(self):
+        with self._lock:
+            retained = len(self._profiles)
+        return {'enabled': PROFILING_ENABLED, 'mode': self.mode, 'retained': retained, **self.stats}
+
+request_profiler = RequestProfiler()
 
 # Sprachkonfiguration (4 Sprachen)
 LANGUAGES = {
@@ -252,14 +738,88 @@ LANGUAGES = {
 class DatabaseManager:
     """Verwaltet die SQLite-Datenbank für Credibility-Analysen"""
     
-    def __init__(self, db_path=DATABASE_PATH):
+    def __init__(self, db_path=DATABASE_PATH, pool_size=SQLITE_POOL_SIZE):
         self.db_path = db_path
+        self.pool_size = pool_size
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        self._pool_pid = os.getpid()
+        self._pool_lock = threading.Lock()
         self.init_database()
     
+    def _connect(self):
+        """Öffnet eine neue Verbindung mit WAL-Journal und optimierten Pragmas"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=SQLITE_BUSY_TIMEOUT_MS / 1000.0,
+            check_same_thread=False,
+            cached_statements=256  # Prepared Statements pro Verbindung wiederverwenden
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}')
+        conn.execute(f'PRAGMA mmap_size={SQLITE_MMAP_SIZE}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute(f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}')
+        self._register_functions(conn)
+        return conn
+    
+    def _register_functions(self, conn):
+        """Registriert SQL-Funktionen, die Views und Trigger benötigen"""
+        conn.create_function('decompress_document', 2, decode_document, deterministic=True)
+    
+    def _content_sql(self, row):
+        """SQL-Ausdruck für den Text einer Analyse-Zeile (Dokument oder Altbestand)"""
+        return (
+            f'COALESCE((SELECT decompress_document(documents.codec, documents.body) '
+            f'FROM documents WHERE documents.hash = {row}.content_hash), {row}.content)'
+        )
+    
+    def _select_sql(self, columns, table='credibility_analyses'):
+        """SELECT-Liste für Analyse-Spalten; ``content`` wird aus documents gelesen"""
+        return ', '.join(
+            f'{self._content_sql(table)} AS content' if column == 'content' else f'{table}.{column}'
+            for column in columns
+        )
+    
+    @contextlib.contextmanager
+    def connection(self):
+        """Leiht eine Verbindung aus dem Pool (pro Prozess) aus"""
+        # Nach einem Fork (z.B. gunicorn --preload) keine geerbten Verbindungen nutzen
+        if self._pool_pid != os.getpid():
+            with self._pool_lock:
+                if self._pool_pid != os.getpid():
+                    self._pool = queue.LifoQueue(maxsize=self.pool_size)
+                    self._pool_pid = os.getpid()
+        
+        pool = self._pool
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        
+        try:
+            yield conn
+        finally:
+            # Nicht abgeschlossene Transaktionen (z.B. nach Fehlern) verwerfen
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+    
+    def close(self):
+        """Schließt alle Verbindungen im Pool"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+    
     def init_database(self):
         """Initialisiert die Datenbank mit erweiterten Tabellen für Credibility Analysis"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
                 # Haupttabelle für Credibility-Analysen
@@ -300,11 +860,82 @@ class DatabaseManager:
                     tags TEXT,
                     notes TEXT,
                     recommendations TEXT,
-                    issues_detected TEXT
+                    issues_detected TEXT,
+                    idempotency_key TEXT,
+                    content_hash TEXT
+                )
+                ''')
+                
+                # Spalten nachrüsten, die in älteren Datenbanken fehlen
+                self._add_missing_columns(cursor, 'credibility_analyses', {
+                    'idempotency_key': 'TEXT',
+                    'content_hash': 'TEXT'
+                })
+                
+                cursor.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_analyses_idempotency_key
+                ON credibility_analyses(idempotency_key)
+                ''')
+                
+                # Keyset-Paginierung nach Erstellungszeit
+                cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_analyses_created_at
+                ON credibility_analyses(created_at, id)
+                ''')
+                
+                # Gefilterte Suche: Gleichheitsspalte zuerst, dann die Sortierung
+                # (created_at, id), danach die Bereichsfilter, damit diese ohne
+                # Tabellenzugriff im Index geprüft werden können
+                cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_analyses_classification_created
+                ON credibility_analyses(classification, created_at, id, credibility_score, word_count)
+                ''')
+                cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_analyses_domain_created
+                ON credibility_analyses(domain, created_at, id, credibility_score, word_count)
+                ''')
+                cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_analyses_score
+                ON credibility_analyses(credibility_score, created_at, word_count)
+                ''')
+                cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_analyses_word_count
+                ON credibility_analyses(word_count, created_at, credibility_score)
+                ''')
+                
+                # Inhalts-adressierte Dokumente: jeder normalisierte Text wird
+                # genau einmal (komprimiert) gespeichert, Analysen verweisen per Hash
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS documents (
+                    hash TEXT PRIMARY KEY,
+                    codec TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_size INTEGER NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
                 ''')
                 
-                # Volltext-Suchindex für bessere Performance
+                cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_analyses_content_hash
+                ON credibility_analyses(content_hash)
+                ''')
+                
+                # Kontentloser Volltext-Index (content=''): speichert nur die Postings,
+                # der Text liegt ausschließlich (dedupliziert, komprimiert) in documents.
+                # Ältere Datenbanken (eigene Textkopie bzw. External Content) werden
+                # einmalig umgebaut.
+                cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'credibility_fts'")
+                fts_row = cursor.fetchone()
+                rebuild_fts = fts_row is not None and re.search(r"content\s*=\s*''", fts_row[0]) is None
+                if rebuild_fts:
+                    logger.info("🔄 Volltext-Index wird auf kontentlosen Index umgestellt...")
+                    for trigger in ('credibility_fts_insert', 'credibility_fts_delete', 'credibility_fts_update'):
+                        cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+                    cursor.execute('DROP TABLE credibility_fts')
+                cursor.execute('DROP VIEW IF EXISTS credibility_fts_source')
+                
+                # Volltext-Suchindex für bessere Performance (rowid = Analyse-ID)
                 cursor.execute('''
                 CREATE VIRTUAL TABLE IF NOT EXISTS credibility_fts USING fts5(
                     content, 
@@ -314,83 +945,167 @@ class DatabaseManager:
                     classification, 
                     tags, 
                     notes,
-                    content='credibility_analyses',
-                    content_rowid='id'
+                    content=''
+                )
+                ''')
+                
+                # Einträge eines kontentlosen Index lassen sich nur mit den
+                # ursprünglich indizierten Werten entfernen. Die Trigger merken sich
+                # daher die alten Werte (Text über content_hash); _sync_fts wendet
+                # sie an. So bleiben die Trigger reines SQL.
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS credibility_fts_pending (
+                    id INTEGER PRIMARY KEY,
+                    content_hash TEXT,
+                    content TEXT,
+                    title TEXT,
+                    author TEXT,
+                    domain TEXT,
+                    classification TEXT,
+                    tags TEXT,
+                    notes TEXT
                 )
                 ''')
                 
-                # Trigger für automatisches Update des FTS-Index
+                # Zeilen mit content_hash indiziert _insert_analysis selbst mit dem
+                # Klartext; der Trigger deckt nur Zeilen mit Text in content ab
                 cursor.execute('''
-                CREATE TRIGGER IF NOT EXISTS credibility_fts_insert AFTER INSERT ON credibility_analyses BEGIN
+                CREATE TRIGGER IF NOT EXISTS credibility_fts_insert AFTER INSERT ON credibility_analyses
+                WHEN new.content_hash IS NULL BEGIN
                     INSERT INTO credibility_fts(rowid, content, title, author, domain, classification, tags, notes) 
                     VALUES (new.id, new.content, new.title, new.author, new.domain, new.classification, new.tags, new.notes);
                 END
                 ''')
                 
+                # Nur der erste Eintrag je ID enthält die indizierten Werte (OR IGNORE)
+                for trigger, event in (('credibility_fts_delete', 'DELETE'),
+                                       ('credibility_fts_update', 'UPDATE OF content, content_hash, title, author, '
+                                                                  'domain, classification, tags, notes')):
+                    cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS {trigger} AFTER {event} ON credibility_analyses BEGIN
+                        INSERT OR IGNORE INTO credibility_fts_pending
+                            (id, content_hash, content, title, author, domain, classification, tags, notes)
+                        VALUES (old.id, old.content_hash, old.content, old.title, old.author, old.domain,
+                                old.classification, old.tags, old.notes);
+                    END
+                    ''')
+                
+                if rebuild_fts:
+                    self._rebuild_fts(cursor)
+                else:
+                    self._sync_fts(cursor)
+                
+                # Laufende Aggregate für Statistiken (per Trigger gepflegt)
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'analysis_stats'")
+                stats_table_exists = cursor.fetchone() is not None
+                
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS analysis_stats (
+                    classification TEXT PRIMARY KEY,
+                    analysis_count INTEGER NOT NULL DEFAULT 0,
+                    sum_credibility REAL NOT NULL DEFAULT 0,
+                    sum_confidence REAL NOT NULL DEFAULT 0,
+                    sum_word_count REAL NOT NULL DEFAULT 0,
+                    word_count_values INTEGER NOT NULL DEFAULT 0,
+                    sum_sources REAL NOT NULL DEFAULT 0,
+                    sources_values INTEGER NOT NULL DEFAULT 0
+                )
+                ''')
+                
+                # Histogramm der Credibility-Scores (10 Buckets à 0.1)
                 cursor.execute('''
-                CREATE TRIGGER IF NOT EXISTS credibility_fts_delete AFTER DELETE ON credibility_analyses BEGIN
-                    DELETE FROM credibility_fts WHERE rowid = old.id;
+                CREATE TABLE IF NOT EXISTS analysis_score_histogram (
+                    bucket INTEGER PRIMARY KEY,
+                    analysis_count INTEGER NOT NULL DEFAULT 0
+                )
+                ''')
+                
+                cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS analysis_stats_insert AFTER INSERT ON credibility_analyses BEGIN
+                    {self._stats_add_sql('new')}
                 END
                 ''')
                 
-                cursor.execute('''
-                CREATE TRIGGER IF NOT EXISTS credibility_fts_update AFTER UPDATE ON credibility_analyses BEGIN
-                    DELETE FROM credibility_fts WHERE rowid = old.id;
-                    INSERT INTO credibility_fts(rowid, content, title, author, domain, classification, tags, notes) 
-                    VALUES (new.id, new.content, new.title, new.author, new.domain, new.classification, new.tags, new.notes);
+                cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS analysis_stats_delete AFTER DELETE ON credibility_analyses BEGIN
+                    {self._stats_remove_sql('old')}
+                END
+                ''')
+                
+                cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS analysis_stats_update
+                AFTER UPDATE OF classification, credibility_score, confidence, word_count, sources_found
+                ON credibility_analyses BEGIN
+                    {self._stats_remove_sql('old')}
+                    {self._stats_add_sql('new')}
                 END
                 ''')
                 
+                # Backfill, wenn die Aggregat-Tabellen neu angelegt wurden
+                if not stats_table_exists:
+                    self._rebuild_statistics(cursor)
+                
+                # Hintergrund-Jobs (Status für alle Worker-Prozesse sichtbar)
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS analysis_jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    progress TEXT,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+                ''')
+                
+                # Aufräumen nach finished_at, nie abgeschlossene Jobs nach created_at
+                cursor.execute('DROP INDEX IF EXISTS idx_analysis_jobs_finished')
+                cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_analysis_jobs_purge ON analysis_jobs(finished_at, created_at)
+                ''')
+                
+                # Persistente Stufe des Ergebnis-Caches
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    version TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                ''')
+                
+                cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_analysis_cache_access ON analysis_cache(last_access)
+                ''')
+                
                 conn.commit()
+                
+                # Planer-Statistiken für die Such-Indizes aktualisieren
+                cursor.execute('PRAGMA optimize')
                 logger.info("✅ Credibility-Datenbank erfolgreich initialisiert")
                 
         except Exception as e:
             logger.error(f"❌ Datenbankfehler: {e}")
     
+    def _add_missing_columns(self, cursor, table, columns):
+        """Ergänzt fehlende Spalten einer bestehenden Tabelle"""
+        cursor.execute(f'PRAGMA table_info({table})')
+        existing = {row[1] for row in cursor.fetchall()}
+        for name, definition in columns.items():
+            if name not in existing:
+                cursor.execute(f'ALTER TABLE {table} ADD COLUMN {name} {definition}')
+                logger.info(f"🔧 Spalte {table}.{name} ergänzt")
+    
     def save_analysis(self, analysis_data):
         """Speichert eine Credibility-Analyse in der Datenbank"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with metrics.span('db_save'), self.connection() as conn:
                 cursor = conn.cursor()
-                
-                cursor.execute('''
-                INSERT INTO credibility_analyses (
-                    content, url, title, author, publication_date, domain,
-                    credibility_score, content_quality_score, factual_accuracy_score, source_reliability_score,
-                    classification, confidence,
-                    word_count, sentence_count, char_count, sources_found, claims_verified,
-                    readability_score, bias_level, processing_time, language,
-                    tags, notes, recommendations, issues_detected
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    analysis_data['content'],
-                    analysis_data.get('url', ''),
-                    analysis_data.get('title', ''),
-                    analysis_data.get('author', ''),
-                    analysis_data.get('publication_date', ''),
-                    analysis_data.get('domain', ''),
-                    analysis_data['credibility_score'],
-                    analysis_data.get('content_quality_score', 0),
-                    analysis_data.get('factual_accuracy_score', 0),
-                    analysis_data.get('source_reliability_score', 0),
-                    analysis_data['classification'],
-                    analysis_data['confidence'],
-                    analysis_data.get('word_count', 0),
-                    analysis_data.get('sentence_count', 0),
-                    analysis_data.get('char_count', 0),
-                    analysis_data.get('sources_found', 0),
-                    analysis_data.get('claims_verified', 0),
-                    analysis_data.get('readability_score', 0),
-                    analysis_data.get('bias_level', 0),
-                    analysis_data.get('processing_time', 0),
-                    analysis_data.get('language', 'de'),
-                    analysis_data.get('tags', ''),
-                    analysis_data.get('notes', ''),
-                    json.dumps(analysis_data.get('recommendations', [])),
-                    json.dumps(analysis_data.get('issues_detected', []))
-                ))
-                
-                analysis_id = cursor.lastrowid
+                analysis_id = self._insert_analysis(cursor, analysis_data)
+                self._sync_fts(cursor)
                 conn.commit()
                 
                 logger.info(f"💾 Credibility-Analyse gespeichert mit ID: {analysis_id}")
@@ -400,87 +1115,771 @@ class DatabaseManager:
             logger.error(f"❌ Fehler beim Speichern: {e}")
             return None
     
-    def search_content(self, query, filters=None):
-        """Sucht in gespeicherten Inhalten mit erweiterten Filtern"""
+    def save_analyses(self, analyses):
+        """Speichert mehrere Analysen in einer Transaktion und liefert ihre IDs"""
+        with metrics.span('db_save'), self.connection() as conn:
+            cursor = conn.cursor()
+            analysis_ids = [self._insert_analysis(cursor, analysis_data) for analysis_data in analyses]
+            self._sync_fts(cursor)
+            conn.commit()
+            return analysis_ids
+    
+    def _rebuild_fts(self, cursor):
+        """Füllt den Volltext-Index aus allen gespeicherten Analysen neu"""
+        cursor.execute("INSERT INTO credibility_fts(credibility_fts) VALUES ('delete-all')")
+        cursor.execute('DELETE FROM credibility_fts_pending')
+        cursor.execute(f'''
+        INSERT INTO credibility_fts(rowid, {self.FTS_COLUMNS})
+        SELECT id, {self._content_sql('credibility_analyses')}, title, author, domain, classification, tags, notes
+        FROM credibility_analyses
+        ''')
+    
+    def _sync_fts(self, cursor, batch_size=EXPORT_BATCH_SIZE):
+        """Wendet gelöschte/geänderte Analysen (credibility_fts_pending) auf den Volltext-Index an.
+        
+        Entfernt die alten Einträge mit dem FTS5-Befehl 'delete', indiziert noch
+        vorhandene (geänderte) Analysen neu und löscht danach Dokumente, auf die
+        keine Analyse mehr verweist. Liefert die Anzahl verarbeiteter Einträge.
+        """
+        processed = 0
+        while True:
+            cursor.execute(f'''
+            SELECT id, content_hash, {self._content_sql('credibility_fts_pending')},
+                   title, author, domain, classification, tags, notes
+            FROM credibility_fts_pending
+            ORDER BY id
+            LIMIT ?
+            ''', (batch_size,))
+            rows = cursor.fetchall()
+            if not rows:
+                return processed
+            
+            ids = [row[0] for row in rows]
+            placeholders = ', '.join('?' * len(ids))
+            cursor.executemany(
+                f"INSERT INTO credibility_fts(credibility_fts, rowid, {self.FTS_COLUMNS}) "
+                f"VALUES ('delete', ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(row[0],) + tuple(row[2:]) for row in rows]
+            )
+            cursor.execute(f'''
+            INSERT INTO credibility_fts(rowid, {self.FTS_COLUMNS})
+            SELECT id, {self._content_sql('credibility_analyses')}, title, author, domain, classification, tags, notes
+            FROM credibility_analyses
+            WHERE id IN ({placeholders})
+            ''', ids)
+            cursor.execute(f'DELETE FROM credibility_fts_pending WHERE id IN ({placeholders})', ids)
+            
+            hashes = list({row[1] for row in rows if row[1]})
+            if hashes:
+                cursor.execute(f'''
+                DELETE FROM documents
+                WHERE hash IN ({', '.join('?' * len(hashes))})
+                  AND NOT EXISTS (SELECT 1 FROM credibility_analyses WHERE content_hash = documents.hash)
+                  AND NOT EXISTS (SELECT 1 FROM credibility_fts_pending WHERE content_hash = documents.hash)
+                ''', hashes)
+            processed += len(rows)
+    
+    def _store_document(self, cursor, content):
+        """Speichert den normalisierten Text einmalig in documents; liefert (Hash, Text)"""
+        text = normalize_content(content)
+        digest = document_hash(text)
+        
+        cursor.execute('SELECT 1 FROM documents WHERE hash = ?', (digest,))
+        if cursor.fetchone() is None:
+            codec, body = encode_document(text)
+            cursor.execute('''
+            INSERT OR IGNORE INTO documents (hash, codec, body, size, stored_size)
+            VALUES (?, ?, ?, ?, ?)
+            ''', (digest, codec, body, len(text.encode('utf-8')), len(body)))
+        return digest, text
+    
+    def _insert_analysis(self, cursor, analysis_data):
+        """Fügt eine Analyse ein; bei bekanntem Idempotenz-Schlüssel wird die bestehende ID geliefert"""
+        idempotency_key = analysis_data.get('idempotency_key')
+        content_hash, text = self._store_document(cursor, analysis_data['content'])
+        
+        # Nur Konflikte beim Idempotenz-Schlüssel ignorieren; NOT NULL/CHECK-Fehler schlagen durch
+        cursor.execute('''
+        INSERT INTO credibility_analyses (
+            content, url, title, author, publication_date, domain,
+            credibility_score, content_quality_score, factual_accuracy_score, source_reliability_score,
+            classification, confidence,
+            word_count, sentence_count, char_count, sources_found, claims_verified,
+            readability_score, bias_level, processing_time, language,
+            tags, notes, recommendations, issues_detected, idempotency_key, content_hash
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(idempotency_key) DO NOTHING
+        ''', (
+            '',  # Text liegt in documents (content_hash)
+            analysis_data.get('url', ''),
+            analysis_data.get('title', ''),
+            analysis_data.get('author', ''),
+            analysis_data.get('publication_date', ''),
+            analysis_data.get('domain', ''),
+            analysis_data['credibility_score'],
+            analysis_data.get('content_quality_score', 0),
+            analysis_data.get('factual_accuracy_score', 0),
+            analysis_data.get('source_reliability_score', 0),
+            analysis_data['classification'],
+            analysis_data['confidence'],
+            analysis_data.get('word_count', 0),
+            analysis_data.get('sentence_count', 0),
+            analysis_data.get('char_count', 0),
+            analysis_data.get('sources_found', 0),
+            analysis_data.get('claims_verified', 0),
+            analysis_data.get('readability_score', 0),
+            analysis_data.get('bias_level', 0),
+            analysis_data.get('processing_time', 0),
+            analysis_data.get('language', 'de'),
+            analysis_data.get('tags', ''),
+            analysis_data.get('notes', ''),
+            json.dumps(analysis_data.get('recommendations', [])),
+            json.dumps(analysis_data.get('issues_detected', [])),
+            idempotency_key,
+            content_hash
+        ))
+        
+        if cursor.rowcount == 0:
+            # Bereits gespeichert (Wiederholung mit gleichem Schlüssel)
+            cursor.execute('''
+            SELECT id FROM credibility_analyses WHERE idempotency_key = ?
+            ''', (idempotency_key,))
+            return cursor.fetchone()[0]
+        
+        # Volltext-Index mit dem Klartext (der Trigger sieht nur den Hash); der
+        # Index speichert nur Postings, keine zweite Kopie des Texts
+        analysis_id = cursor.lastrowid
+        cursor.execute(f'''
+        INSERT INTO credibility_fts(rowid, {self.FTS_COLUMNS})
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            analysis_id,
+            text,
+            analysis_data.get('title', ''),
+            analysis_data.get('author', ''),
+            analysis_data.get('domain', ''),
+            analysis_data['classification'],
+            analysis_data.get('tags', ''),
+            analysis_data.get('notes', '')
+        ))
+        return analysis_id
+    
+    def get_analysis_id(self, idempotency_key):
+        """Ermittelt die ID einer gespeicherten Analyse über ihren Idempotenz-Schlüssel"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
+                cursor.execute('''
+                SELECT id FROM credibility_analyses WHERE idempotency_key = ?
+                ''', (idempotency_key,))
+                row = cursor.fetchone()
+                return row[0] if row else None
                 
-                if not query and not filters:
-                    # Alle Analysen zurückgeben
-                    cursor.execute('''
-                    SELECT * FROM credibility_analyses 
-                    ORDER BY created_at DESC 
-                    LIMIT 100
-                    ''')
-                elif query:
-                    # Volltext-Suche
-                    cursor.execute('''
-                    SELECT credibility_analyses.* 
-                    FROM credibility_analyses 
-                    JOIN credibility_fts ON credibility_analyses.id = credibility_fts.rowid
-                    WHERE credibility_fts MATCH ?
-                    ORDER BY credibility_analyses.created_at DESC
-                    LIMIT 100
-                    ''', (query,))
-                else:
-                    # Nur Filter ohne Suchbegriff
-                    cursor.execute('''
-                    SELECT * FROM credibility_analyses 
-                    WHERE 1=1
-                    ORDER BY created_at DESC 
-                    LIMIT 100
-                    ''')
-                
+        except Exception as e:
+            logger.error(f"❌ Fehler bei der ID-Abfrage: {e}")
+            return None
+    
+    SEARCH_LIMIT = 100
+    CLASSIFICATIONS = ('high', 'medium', 'low', 'questionable')
+    
+    def _parse_timestamp(self, value, end_of_range=False):
+        """Wandelt ISO-Datum/-Zeit in das Speicherformat von created_at um"""
+        try:
+            parsed = datetime.fromisoformat(str(value).strip().replace('Z', '+00:00'))
+        except ValueError:
+            raise ValueError(f'Ungültiges Datum: {value}')
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        if end_of_range and len(str(value).strip()) == 10:
+            # Reines Datum als Obergrenze schließt den ganzen Tag ein
+            parsed += timedelta(days=1)
+            return parsed.strftime('%Y-%m-%d %H:%M:%S'), '<'
+        return parsed.strftime('%Y-%m-%d %H:%M:%S'), '<=' if end_of_range else '>='
+    
+    def _build_search_filters(self, filters, table='credibility_analyses'):
+        """Erzeugt parametrisierte WHERE-Bedingungen aus den Suchfiltern.
+        
+        Ungültige Werte lösen ``ValueError`` aus, leere Werte werden ignoriert.
+        """
+        clauses, params = [], []
+        filters = {key: value for key, value in (filters or {}).items() if value not in (None, '')}
+        
+        classification = filters.get('credibility') or filters.get('classification')
+        if classification:
+            values = [value.strip().lower() for value in str(classification).split(',') if value.strip()]
+            unknown = [value for value in values if value not in self.CLASSIFICATIONS]
+            if unknown:
+                raise ValueError(f'Unbekannte Klassifikation: {", ".join(unknown)}')
+            clauses.append(f'{table}.classification IN ({", ".join("?" * len(values))})')
+            params.extend(values)
+        
+        if 'date_from' in filters:
+            value, operator = self._parse_timestamp(filters['date_from'])
+            clauses.append(f'{table}.created_at {operator} ?')
+            params.append(value)
+        if 'date_to' in filters:
+            value, operator = self._parse_timestamp(filters['date_to'], end_of_range=True)
+            clauses.append(f'{table}.created_at {operator} ?')
+            params.append(value)
+        
+        for key, column, operator, cast in (
+            ('min_words', 'word_count', '>=', int),
+            ('max_words', 'word_count', '<=', int),
+            ('min_score', 'credibility_score', '>=', float),
+            ('max_score', 'credibility_score', '<=', float)
+        ):
+            if key in filters:
+                try:
+                    value = cast(filters[key])
+                except (TypeError, ValueError):
+                    raise ValueError(f'Ungültiger Wert für {key}: {filters[key]}')
+                # nan/inf würden still keine bzw. alle Zeilen liefern
+                if not math.isfinite(value):
+                    raise ValueError(f'Ungültiger Wert für {key}: {filters[key]}')
+                clauses.append(f'{table}.{column} {operator} ?')
+                params.append(value)
+        
+        if 'domain' in filters:
+            domain = str(filters['domain']).strip().lower()
+            if domain.startswith('www.'):
+                domain = domain[4:]
+            clauses.append(f'{table}.domain IN (?, ?)')
+            params.extend([domain, f'www.{domain}'])
+        
+        return clauses, params
+    
+    # Spalten des Volltext-Index und ihre Gewichte für bm25() (gleiche Reihenfolge)
+    FTS_COLUMNS = 'content, title, author, domain, classification, tags, notes'
+    FTS_WEIGHTS = (1.0, 10.0, 2.0, 2.0, 0.0, 3.0, 1.0)
+    SNIPPET_TOKENS = 24
+    SNIPPET_CHARS = 200
+    
+    # Erlaubte Felder für ``fields=`` (Whitelist, Reihenfolge wie im Schema)
+    ANALYSIS_COLUMNS = (
+        'id', 'content', 'url', 'title', 'author', 'publication_date', 'domain',
+        'credibility_score', 'content_quality_score', 'factual_accuracy_score', 'source_reliability_score',
+        'classification', 'confidence',
+        'word_count', 'sentence_count', 'char_count', 'sources_found', 'claims_verified',
+        'readability_score', 'bias_level', 'processing_time', 'language', 'created_at',
+        'tags', 'notes', 'recommendations', 'issues_detected', 'idempotency_key', 'content_hash'
+    )
+    
+    # Große Textspalten, die nur die Detailansicht liefert
+    DETAIL_COLUMNS = ('content', 'notes', 'recommendations', 'issues_detected')
+    JSON_COLUMNS = ('recommendations', 'issues_detected')
+    
+    # Listenansicht: alle Spalten außer den großen Textspalten
+    LIST_COLUMNS = (
+        'id', 'url', 'title', 'author', 'publication_date', 'domain',
+        'credibility_score', 'content_quality_score', 'factual_accuracy_score', 'source_reliability_score',
+        'classification', 'confidence',
+        'word_count', 'sentence_count', 'char_count', 'sources_found', 'claims_verified',
+        'readability_score', 'bias_level', 'processing_time', 'language', 'created_at', 'tags'
+    )
+    
+    def resolve_fields(self, fields, default, required=('id',)):
+        """Wandelt einen ``fields``-Parameter (kommagetrennt) in geprüfte Spalten um.
+        
+        Unbekannte Felder lösen ``ValueError`` aus; ``required`` (z.B. die
+        Keyset-Spalten) wird immer ergänzt.
+        """
+        if not fields:
+            columns = list(default)
+        else:
+            columns = [field.strip() for field in fields.split(',') if field.strip()]
+            unknown = [column for column in columns if column not in self.ANALYSIS_COLUMNS]
+            if unknown:
+                raise ValueError(f'Unbekannte Felder: {", ".join(unknown)}')
+        for column in required:
+            if column not in columns:
+                columns.append(column)
+        return tuple(dict.fromkeys(columns))
+    
+    def _search_sql(self, query, filters, limit=SEARCH_LIMIT, after=None, columns=LIST_COLUMNS):
+        """Baut die Such-Abfrage samt Parametern (gemeinsam für Suche und Query-Plan).
+        
+        Volltext-Treffer werden nach bm25-Relevanz sortiert (kleiner ist besser),
+        reine Filterabfragen nach Erstellungszeit absteigend. Das Snippet der
+        Volltext-Treffer ergänzt search_content (der Index speichert keinen Text). ``after`` ist die
+        Keyset-Position der letzten Zeile der vorherigen Seite.
+        """
+        clauses, params = self._build_search_filters(filters)
+        columns = self._select_sql(self.resolve_fields(None, columns, ('id',) if query else ('id', 'created_at')))
+        
+        if query:
+            weights = ', '.join(str(weight) for weight in self.FTS_WEIGHTS)
+            sql = f'''
+            WITH hits AS (
+                SELECT rowid, bm25(credibility_fts, {weights}) AS rank
+                FROM credibility_fts
+                WHERE credibility_fts MATCH ?
+            )
+            SELECT {columns}, NULL AS snippet, hits.rank AS rank
+            FROM hits
+            JOIN credibility_analyses ON credibility_analyses.id = hits.rowid
+            WHERE 1=1
+            '''
+            params = [query] + params
+            if after is not None:
+                clauses.append('(hits.rank, credibility_analyses.id) > (?, ?)')
+                params.extend([float(after['rank']), int(after['id'])])
+            order_by = 'hits.rank, credibility_analyses.id'
+        else:
+            sql = f'''
+            SELECT {columns}, substr({self._content_sql('credibility_analyses')}, 1, {self.SNIPPET_CHARS}) AS snippet
+            FROM credibility_analyses
+            WHERE 1=1
+            '''
+            if after is not None:
+                clauses.append('(credibility_analyses.created_at, credibility_analyses.id) < (?, ?)')
+                params.extend([str(after['created_at']), int(after['id'])])
+            order_by = 'credibility_analyses.created_at DESC, credibility_analyses.id DESC'
+        
+        for clause in clauses:
+            sql += f'AND {clause}\n'
+        sql += f'''
+            ORDER BY {order_by}
+            LIMIT ?
+            '''
+        params.append(limit)
+        return sql, params
+    
+    def search_position(self, row, query):
+        """Keyset-Position einer Ergebniszeile für den nächsten Seiten-Cursor"""
+        if query:
+            return {'rank': row['rank'], 'id': row['id']}
+        return {'created_at': row['created_at'], 'id': row['id']}
+    
+    def _validate_search_position(self, after, query):
+        if after is None:
+            return
+        required = ('rank', 'id') if query else ('created_at', 'id')
+        try:
+            if not all(after.get(key) is not None for key in required):
+                raise ValueError
+            int(after['id'])
+            if query:
+                float(after['rank'])
+        except (TypeError, ValueError):
+            raise ValueError('Cursor passt nicht zu dieser Suche')
+    
+    def search_content(self, query, filters=None, limit=SEARCH_LIMIT, after=None, columns=LIST_COLUMNS):
+        """Sucht in gespeicherten Inhalten mit erweiterten Filtern.
+        
+        Filter: ``credibility`` (Klassifikation, kommagetrennt), ``date_from``/``date_to``
+        (ISO-Datum), ``min_words``/``max_words``, ``min_score``/``max_score``, ``domain``.
+        Statt des vollständigen Texts enthält jede Zeile ein ``snippet``;
+        ``columns`` bestimmt die übrigen Felder (Standard: Listenansicht).
+        Ungültige Filterwerte, Cursor oder FTS5-Ausdrücke lösen ``ValueError`` aus.
+        """
+        self._validate_search_position(after, query)
+        sql, params = self._search_sql(query, filters, limit, after, columns)
+        try:
+            with metrics.span('fts_search'), self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(sql, params)
                 results = cursor.fetchall()
                 
                 # Konvertiere zu Dictionary für bessere Handhabung
                 columns = [description[0] for description in cursor.description]
-                return [dict(zip(columns, row)) for row in results]
+                rows = [dict(zip(columns, row)) for row in results]
+                if query and rows:
+                    self._attach_snippets(cursor, rows, query)
+                return rows
                 
+        except sqlite3.OperationalError as e:
+            # Fehler im FTS5-Ausdruck ("foo, a:b, -x) sind Eingabefehler (SQLITE_ERROR),
+            # gesperrte/ausgelastete Datenbank (BUSY/LOCKED) dagegen nicht
+            # (sqlite_errorcode erst ab Python 3.11, sonst anhand der Meldung)
+            code = getattr(e, 'sqlite_errorcode', None)
+            query_error = code == 1 if code is not None else re.search(r'locked|busy', str(e)) is None
+            if query and query_error:
+                raise ValueError(f'Ungültige Suchanfrage: {e}')
+            logger.error(f"❌ Suchfehler: {e}")
+            return []
         except Exception as e:
             logger.error(f"❌ Suchfehler: {e}")
             return []
     
-    def get_statistics(self):
-        """Holt Statistiken aus der Datenbank"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
+    def _attach_snippets(self, cursor, rows, query):
+        """Baut die Snippets aus den dekomprimierten Texten, nur für die Treffer dieser Seite"""
+        ids = [row['id'] for row in rows]
+        cursor.execute(f'''
+        SELECT id, {self._content_sql('credibility_analyses')}
+        FROM credibility_analyses
+        WHERE id IN ({', '.join('?' * len(ids))})
+        ''', ids)
+        texts = dict(cursor.fetchall())
+        terms = fts_query_terms(query)
+        for row in rows:
+            row['snippet'] = highlight_snippet(texts.get(row['id']) or '', terms, self.SNIPPET_TOKENS)
+    
+    def explain_search(self, query, filters=None, limit=SEARCH_LIMIT, after=None):
+        """Liefert den Query-Plan (EXPLAIN QUERY PLAN) einer Suche als Textzeilen"""
+        self._validate_search_position(after, query)
+        sql, params = self._search_sql(query, filters, limit, after)
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return [row[-1] for row in cursor.fetchall()]
+    
+    EXPORT_ORDERS = ('id', 'created_at')
+    
+    def iter_analyses(self, after=None, order='id', limit=None, batch_size=EXPORT_BATCH_SIZE, columns=ANALYSIS_COLUMNS):
+        """Iteriert gespeicherte Analysen mit Keyset-Paginierung in konstantem Speicher.
+        
+        ``after`` ist die Position der zuletzt gelieferten Zeile, z.B.
+        ``{'id': 42}`` bzw. ``{'created_at': '...', 'id': 42}``. Jeder Batch
+        wird mit einer eigenen kurzen Abfrage geladen, sodass während langer
+        Exporte keine Lese-Transaktion offen bleibt. ``columns`` begrenzt die
+        gelesenen Spalten; die Keyset-Spalten werden immer mitgeladen.
+        """
+        if order not in self.EXPORT_ORDERS:
+            raise ValueError(f'Unbekannte Sortierung: {order}')
+        
+        select = self._select_sql(self.resolve_fields(None, columns, ('id', 'created_at') if order == 'created_at' else ('id',)))
+        after = after or {}
+        remaining = limit
+        
+        while remaining is None or remaining > 0:
+            page_size = batch_size if remaining is None else min(batch_size, remaining)
+            
+            with self.connection() as conn:
                 cursor = conn.cursor()
+                if order == 'id':
+                    cursor.execute(f'''
+                    SELECT {select} FROM credibility_analyses
+                    WHERE id > ?
+                    ORDER BY id
+                    LIMIT ?
+                    ''', (after.get('id', 0), page_size))
+                elif 'created_at' in after:
+                    cursor.execute(f'''
+                    SELECT {select} FROM credibility_analyses
+                    WHERE (created_at, id) > (?, ?)
+                    ORDER BY created_at, id
+                    LIMIT ?
+                    ''', (after['created_at'], after.get('id', 0), page_size))
+                else:
+                    cursor.execute(f'''
+                    SELECT {select} FROM credibility_analyses
+                    ORDER BY created_at, id
+                    LIMIT ?
+                    ''', (page_size,))
+                
+                columns = [description[0] for description in cursor.description]
+                rows = cursor.fetchall()
+            
+            for row in rows:
+                yield dict(zip(columns, row))
+            
+            if len(rows) < page_size:
+                return
+            
+            last = dict(zip(columns, rows[-1]))
+            after = {'id': last['id']} if order == 'id' else {'created_at': last['created_at'], 'id': last['id']}
+            if remaining is not None:
+                remaining -= len(rows)
+    
+    def get_analysis(self, analysis_id, columns=ANALYSIS_COLUMNS):
+        """Lädt eine gespeicherte Analyse (Detailansicht) mit dekodierten JSON-Feldern"""
+        select = self._select_sql(self.resolve_fields(None, columns))
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'SELECT {select} FROM credibility_analyses WHERE id = ?', (analysis_id,))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            analysis = dict(zip([description[0] for description in cursor.description], row))
+        
+        for column in self.JSON_COLUMNS:
+            if analysis.get(column):
+                try:
+                    analysis[column] = json.loads(analysis[column])
+                except ValueError:
+                    pass
+        return analysis
+    
+    JOB_FIELDS = ('status', 'progress', 'result', 'error', 'started_at', 'finished_at')
+    
+    def create_job(self, job_id, kind, created_at):
+        with self.connection() as conn:
+            conn.execute(
+                "INSERT INTO analysis_jobs (id, kind, status, created_at) VALUES (?, ?, 'queued', ?)",
+                (job_id, kind, created_at)
+            )
+            conn.commit()
+    
+    def update_job(self, job_id, **fields):
+        """Aktualisiert Job-Felder; progress und result werden als JSON gespeichert"""
+        for name in ('progress', 'result'):
+            if name in fields:
+                fields[name] = json.dumps(fields[name])
+        assignments = ', '.join(f'{name} = ?' for name in fields if name in self.JOB_FIELDS)
+        with self.connection() as conn:
+            conn.execute(f'UPDATE analysis_jobs SET {assignments} WHERE id = ?',
+                         [value for name, value in fields.items() if name in self.JOB_FIELDS] + [job_id])
+            conn.commit()
+    
+    def get_job(self, job_id, include_result=True):
+        columns = 'id, kind, status, progress, error, created_at, started_at, finished_at'
+        if include_result:
+            columns += ', result'
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'SELECT {columns} FROM analysis_jobs WHERE id = ?', (job_id,))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            job = dict(zip([description[0] for description in cursor.description], row))
+        
+        for name in ('progress', 'result'):
+            if job.get(name) is not None:
+                job[name] = json.loads(job[name])
+        return job
+    
+    def purge_jobs(self, before):
+        """Entfernt Jobs, deren Ergebnis älter als die Aufbewahrungszeit ist.
+        
+        Nie abgeschlossene Jobs (Prozess beendet, während sie wartend oder
+        laufend waren) werden nach ihrer Erstellungszeit entfernt.
+        """
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+            DELETE FROM analysis_jobs
+            WHERE finished_at < ? OR (finished_at IS NULL AND created_at < ?)
+            ''', (before, before))
+            conn.commit()
+            return cursor.rowcount
+    
+    def count_jobs(self, status):
+        with self.connection() as conn:
+            return conn.execute('SELECT COUNT(*) FROM analysis_jobs WHERE status = ?', (status,)).fetchone()[0]
+    
+    def get_column_types(self, table='credibility_analyses'):
+        """Liefert die deklarierten Spaltentypen einer Tabelle"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'PRAGMA table_info({table})')
+            return {row[1]: (row[2] or 'TEXT').upper() for row in cursor.fetchall()}
+    
+    STATS_HISTOGRAM_BUCKETS = 10
+    
+    def _stats_bucket_sql(self, row):
+        return f"MAX(0, MIN({self.STATS_HISTOGRAM_BUCKETS - 1}, CAST({row}.credibility_score * {self.STATS_HISTOGRAM_BUCKETS} AS INTEGER)))"
+    
+    def _stats_add_sql(self, row):
+        """Trigger-SQL: Zeile zu den laufenden Aggregaten hinzufügen"""
+        return f'''
+                    INSERT INTO analysis_stats (
+                        classification, analysis_count, sum_credibility, sum_confidence,
+                        sum_word_count, word_count_values, sum_sources, sources_values
+                    ) VALUES (
+                        {row}.classification, 1, {row}.credibility_score, {row}.confidence,
+                        COALESCE({row}.word_count, 0), {row}.word_count IS NOT NULL,
+                        COALESCE({row}.sources_found, 0), {row}.sources_found IS NOT NULL
+                    )
+                    ON CONFLICT(classification) DO UPDATE SET
+                        analysis_count = analysis_count + 1,
+                        sum_credibility = sum_credibility + excluded.sum_credibility,
+                        sum_confidence = sum_confidence + excluded.sum_confidence,
+                        sum_word_count = sum_word_count + excluded.sum_word_count,
+                        word_count_values = word_count_values + excluded.word_count_values,
+                        sum_sources = sum_sources + excluded.sum_sources,
+                        sources_values = sources_values + excluded.sources_values;
+                    INSERT INTO analysis_score_histogram (bucket, analysis_count)
+                    VALUES ({self._stats_bucket_sql(row)}, 1)
+                    ON CONFLICT(bucket) DO UPDATE SET analysis_count = analysis_count + 1;'''
+    
+    def _stats_remove_sql(self, row):
+        """Trigger-SQL: Zeile aus den laufenden Aggregaten entfernen"""
+        return f'''
+                    UPDATE analysis_stats SET
+                        analysis_count = analysis_count - 1,
+                        sum_credibility = sum_credibility - {row}.credibility_score,
+                        sum_confidence = sum_confidence - {row}.confidence,
+                        sum_word_count = sum_word_count - COALESCE({row}.word_count, 0),
+                        word_count_values = word_count_values - ({row}.word_count IS NOT NULL),
+                        sum_sources = sum_sources - COALESCE({row}.sources_found, 0),
+                        sources_values = sources_values - ({row}.sources_found IS NOT NULL)
+                    WHERE classification = {row}.classification;
+                    UPDATE analysis_score_histogram SET analysis_count = analysis_count - 1
+                    WHERE bucket = {self._stats_bucket_sql(row)};'''
+    
+    def _rebuild_statistics(self, cursor):
+        """Berechnet die Aggregat-Tabellen vollständig aus credibility_analyses neu"""
+        cursor.execute('DELETE FROM analysis_stats')
+        cursor.execute('DELETE FROM analysis_score_histogram')
+        cursor.execute('''
+        INSERT INTO analysis_stats (
+            classification, analysis_count, sum_credibility, sum_confidence,
+            sum_word_count, word_count_values, sum_sources, sources_values
+        )
+        SELECT classification, COUNT(*), TOTAL(credibility_score), TOTAL(confidence),
+               TOTAL(word_count), COUNT(word_count), TOTAL(sources_found), COUNT(sources_found)
+        FROM credibility_analyses
+        GROUP BY classification
+        ''')
+        cursor.execute(f'''
+        INSERT INTO analysis_score_histogram (bucket, analysis_count)
+        SELECT {self._stats_bucket_sql('credibility_analyses')} AS bucket, COUNT(*)
+        FROM credibility_analyses
+        GROUP BY bucket
+        ''')
+    
+    def rebuild_statistics(self):
+        """Baut die Statistik-Aggregate neu auf (z.B. nach Backfills oder Massenimporten)"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            self._rebuild_statistics(cursor)
+            conn.commit()
+        logger.info("📊 Statistik-Aggregate neu aufgebaut")
+    
+    def migrate_documents(self, batch_size=EXPORT_BATCH_SIZE, vacuum=False):
+        """Überführt Texte aus credibility_analyses.content in die documents-Tabelle.
+        
+        Arbeitet in kurzen Transaktionen pro Batch und kann jederzeit erneut
+        gestartet werden; bereits migrierte Zeilen (mit content_hash) werden
+        übersprungen. Mit ``vacuum`` wird der freie Platz anschließend an das
+        Dateisystem zurückgegeben.
+        """
+        file_size_before = self._file_size()
+        migrated = 0
+        last_id = 0
+        
+        while True:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                SELECT id, content FROM credibility_analyses
+                WHERE id > ? AND content_hash IS NULL
+                ORDER BY id
+                LIMIT ?
+                ''', (last_id, batch_size))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                
+                for analysis_id, content in rows:
+                    digest, _ = self._store_document(cursor, content or '')
+                    cursor.execute(
+                        "UPDATE credibility_analyses SET content = '', content_hash = ? WHERE id = ?",
+                        (digest, analysis_id)
+                    )
+                # Alte Index-Einträge (Rohtext) durch den normalisierten Text ersetzen
+                self._sync_fts(cursor)
+                conn.commit()
+            
+            last_id = rows[-1][0]
+            migrated += len(rows)
+            logger.info(f"📦 {migrated} Analysen in documents überführt...")
+        
+        pruned = self.prune_documents()
+        
+        if vacuum:
+            with self.connection() as conn:
+                # FTS-Segmente zusammenführen, dann Datei verkleinern
+                conn.execute("INSERT INTO credibility_fts(credibility_fts) VALUES ('optimize')")
+                conn.commit()
+                conn.execute('VACUUM')
+        
+        report = self.get_document_stats()
+        report.update({
+            'migrated': migrated,
+            'pruned': pruned,
+            'file_size_before': file_size_before,
+            'file_size_after': self._file_size()
+        })
+        logger.info(f"✅ Dokument-Migration abgeschlossen: {report}")
+        return report
+    
+    def _file_size(self):
+        """Dateigröße nach einem WAL-Checkpoint (sonst liegen Änderungen noch im -wal)"""
+        with self.connection() as conn:
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        return os.path.getsize(self.db_path)
+    
+    def prune_documents(self):
+        """Löscht Dokumente, auf die keine Analyse mehr verweist"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            # Offene Index-Löschungen (credibility_fts_pending) brauchen den alten Text noch
+            cursor.execute('''
+            DELETE FROM documents
+            WHERE NOT EXISTS (
+                SELECT 1 FROM credibility_analyses WHERE credibility_analyses.content_hash = documents.hash
+            )
+            AND NOT EXISTS (
+                SELECT 1 FROM credibility_fts_pending WHERE credibility_fts_pending.content_hash = documents.hash
+            )
+            ''')
+            conn.commit()
+            return cursor.rowcount
+    
+    def get_document_stats(self):
+        """Kennzahlen des Dokument-Speichers (Deduplizierung und Kompression)"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM documents')
+            documents, raw_bytes, stored_bytes = cursor.fetchone()
+            cursor.execute('''
+            SELECT COUNT(*), COALESCE(SUM(documents.size), 0)
+            FROM credibility_analyses JOIN documents ON documents.hash = credibility_analyses.content_hash
+            ''')
+            references, referenced_bytes = cursor.fetchone()
+            cursor.execute('SELECT COUNT(*) FROM credibility_analyses WHERE content_hash IS NULL')
+            unmigrated = cursor.fetchone()[0]
+        
+        return {
+            'documents': documents,
+            'analyses_with_documents': references,
+            'analyses_unmigrated': unmigrated,
+            'raw_bytes': raw_bytes,
+            'stored_bytes': stored_bytes,
+            'logical_bytes': referenced_bytes,
+            'compression_ratio': round(raw_bytes / stored_bytes, 2) if stored_bytes else None,
+            'dedup_ratio': round(referenced_bytes / raw_bytes, 2) if raw_bytes else None
+        }
+    
+    def get_statistics(self):
+        """Holt Statistiken aus den laufend gepflegten Aggregat-Tabellen"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                SELECT classification, analysis_count, sum_credibility, sum_confidence,
+                       sum_word_count, word_count_values, sum_sources, sources_values
+                FROM analysis_stats
+                WHERE analysis_count > 0
+                ''')
+                rows = cursor.fetchall()
+                
+                # Credibility-Verteilung
+                credibility_distribution = {row[0]: row[1] for row in rows}
+                total_analyses = sum(credibility_distribution.values())
+                
+                # Durchschnittliche Scores
+                word_count_values = sum(row[5] for row in rows)
+                sources_values = sum(row[7] for row in rows)
+                
+                # Histogramm
+                histogram = [0] * self.STATS_HISTOGRAM_BUCKETS
+                cursor.execute('SELECT bucket, analysis_count FROM analysis_score_histogram')
+                for bucket, count in cursor.fetchall():
+                    histogram[bucket] = count
+                
+                return {
+                    'total_analyses': total_analyses,
+                    'credibility_distribution': credibility_distribution,
+                    'average_credibility': sum(row[2] for row in rows) / total_analyses if total_analyses else 0.5,
+                    'average_confidence': sum(row[3] for row in rows) / total_analyses if total_analyses else 0.0,
+                    'average_word_count': sum(row[4] for row in rows) / word_count_values if word_count_values else 0,
+                    'average_sources': sum(row[6] for row in rows) / sources_values if sources_values else 0,
+                    'credibility_histogram': histogram
+                }
                 
-                # Gesamt-Analysen
-                cursor.execute('SELECT COUNT(*) FROM credibility_analyses')
-                result = cursor.fetchone()
-                total_analyses = result[0] if result else 0
-                
-                # Credibility-Verteilung
-                cursor.execute('''
-                SELECT classification, COUNT(*) 
-                FROM credibility_analyses 
-                GROUP BY classification
-                ''')
-                credibility_distribution = dict(cursor.fetchall())
-                
-                # Durchschnittliche Scores
-                cursor.execute('''
-                SELECT 
-                    AVG(credibility_score) as avg_credibility,
-                    AVG(confidence) as avg_confidence,
-                    AVG(word_count) as avg_words,
-                    AVG(sources_found) as avg_sources
-                FROM credibility_analyses
-                ''')
-                averages = cursor.fetchone()
-                
-                return {
-                    'total_analyses': total_analyses,
-                    'credibility_distribution': credibility_distribution,
-                    'average_credibility': averages[0] if averages and averages[0] is not None else 0.5,
-                    'average_confidence': averages[1] if averages and averages[1] is not None else 0.0,
-                    'average_word_count': averages[2] if averages and averages[2] is not None else 0,
-                    'average_sources': averages[3] if averages and averages[3] is not None else 0
-                }
-                
         except Exception as e:
             logger.error(f"❌ Statistikfehler: {e}")
             return {
@@ -489,39 +1888,855 @@ class DatabaseManager:
                 'average_credibility': 0.5,
                 'average_confidence': 0.0,
                 'average_word_count': 0,
-                'average_sources': 0
+                'average_sources': 0,
+                'credibility_histogram': [0] * self.STATS_HISTOGRAM_BUCKETS
             }
+    
+    def get_cached_result(self, cache_key, touch_interval=RESULT_CACHE_TOUCH_INTERVAL):
+        """Liest ein gültiges Cache-Ergebnis (oder None).
+        
+        ``last_access`` (für die LRU-Verdrängung) wird nur geschrieben, wenn
+        der Wert älter als ``touch_interval`` Sekunden ist; die meisten
+        Treffer kommen so ohne Schreibsperre aus.
+        """
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                now = time.time()
+                
+                cursor.execute('''
+                SELECT result, last_access FROM analysis_cache WHERE cache_key = ? AND expires_at > ?
+                ''', (cache_key, now))
+                row = cursor.fetchone()
+                
+                if row:
+                    if now - (row[1] or 0) >= touch_interval:
+                        cursor.execute('''
+                        UPDATE analysis_cache SET last_access = ? WHERE cache_key = ?
+                        ''', (now, cache_key))
+                        conn.commit()
+                    return json.loads(row[0])
+                return None
+                
+        except Exception as e:
+            logger.error(f"❌ Cache-Lesefehler: {e}")
+            return None
+    
+    def store_cached_result(self, cache_key, version, result, ttl):
+        """Speichert ein Ergebnis im Cache (Verdrängung: trim_cached_results)"""
+        try:
+            with self.connection() as conn:
+                now = time.time()
+                conn.execute('''
+                INSERT OR REPLACE INTO analysis_cache (cache_key, version, result, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?)
+                ''', (cache_key, version, json.dumps(result), now + ttl, now))
+                conn.commit()
+                
+        except Exception as e:
+            logger.error(f"❌ Cache-Schreibfehler: {e}")
+    
+    def trim_cached_results(self, max_rows):
+        """Entfernt die am längsten nicht genutzten Einträge über ``max_rows`` (LRU über last_access)"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT COUNT(*) FROM analysis_cache')
+                overflow = cursor.fetchone()[0] - max_rows
+                evicted = 0
+                if overflow > 0:
+                    cursor.execute('''
+                    DELETE FROM analysis_cache WHERE cache_key IN (
+                        SELECT cache_key FROM analysis_cache ORDER BY last_access LIMIT ?
+                    )
+                    ''', (overflow,))
+                    evicted = cursor.rowcount
+                
+                conn.commit()
+                return evicted
+                
+        except Exception as e:
+            logger.error(f"❌ Cache-Verdrängungsfehler: {e}")
+            return 0
+    
+    def purge_cached_results(self, current_version):
+        """Entfernt abgelaufene Einträge und Einträge älterer Scoring-Versionen"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                DELETE FROM analysis_cache WHERE version != ? OR expires_at <= ?
+                ''', (current_version, time.time()))
+                conn.commit()
+                return cursor.rowcount
+                
+        except Exception as e:
+            logger.error(f"❌ Cache-Bereinigungsfehler: {e}")
+            return 0
+
+def normalize_content(content):
+    """Normalisiert Text für Analyse und Cache-Schlüssel (Unicode NFC, Zeilenenden, Rand-Whitespace)"""
+    return unicodedata.normalize('NFC', content).replace('\r\n', '\n').strip()
+
+def document_hash(text):
+    """Inhalts-Adresse eines (normalisierten) Texts"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def encode_document(text, codec=None):
+    """Komprimiert einen Text für die documents-Tabelle; liefert (codec, body)"""
+    codec = codec or DOCUMENT_CODEC
+    raw = text.encode('utf-8')
+    
+    if codec == 'zstd':
+        try:
+            body = lazy_import('zstandard').ZstdCompressor(level=DOCUMENT_COMPRESSION_LEVEL).compress(raw)
+        except ImportError:
+            codec = 'zlib'
+    if codec == 'zlib':
+        body = zlib.compress(raw, min(DOCUMENT_COMPRESSION_LEVEL, 9))
+    
+    # Kurze Texte lohnen die Kompression nicht
+    if codec not in ('zstd', 'zlib') or len(body) >= len(raw):
+        return 'none', raw
+    return codec, body
+
+def decode_document(codec, body):
+    """Gegenstück zu encode_document (auch als SQL-Funktion registriert)"""
+    if body is None:
+        return None
+    if codec == 'zlib':
+        return zlib.decompress(body).decode('utf-8')
+    if codec == 'zstd':
+        return lazy_import('zstandard').ZstdDecompressor().decompress(body).decode('utf-8')
+    return bytes(body).decode('utf-8')
+
+# Tokenisierung wie der unicode61-Tokenizer von FTS5: Buchstaben und Ziffern,
+# ohne Groß-/Kleinschreibung und Diakritika
+FTS_TOKEN = re.compile(r'[^\W_]+')
+FTS_OPERATORS = {'AND', 'OR', 'NOT', 'NEAR'}
+
+def fold_token(token):
+    """Vergleichsform eines Tokens (Kleinschreibung, ohne Diakritika)"""
+    decomposed = unicodedata.normalize('NFKD', token.lower())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+def fts_query_terms(query):
+    """Suchbegriffe eines FTS5-Ausdrucks als (Token, Präfix?) – ohne Operatoren und Spaltenfilter"""
+    query = re.sub(r'[\w{} ]+:', ' ', query)
+    terms = []
+    for match in re.finditer(r'([^\W_]+)(\*?)', query):
+        if match.group(1) in FTS_OPERATORS:
+            continue
+        terms.append((fold_token(match.group(1)), bool(match.group(2))))
+    return terms
+
+def highlight_snippet(text, terms, tokens=24, start_mark='<mark>', end_mark='</mark>', ellipsis='…'):
+    """Textausschnitt mit hervorgehobenen Suchbegriffen (wie FTS5 snippet()).
+
+    Wählt das Fenster aus ``tokens`` Wörtern mit den meisten Treffern; ohne
+    Treffer im Text (z.B. nur im Titel) den Textanfang.
+    """
+    words = list(FTS_TOKEN.finditer(text))
+    if not words:
+        return ''
+
+    def matches(word):
+        folded = fold_token(word)
+        return any(folded.startswith(term) if prefix else folded == term for term, prefix in terms)
+
+    hits = [index for index, word in enumerate(words) if matches(word.group())]
+    start = 0
+    best = 0
+    for hit in hits:
+        # Fenster beginnt kurz vor dem Treffer, damit etwas Kontext sichtbar ist
+        candidate = max(0, min(hit - 2, len(words) - tokens))
+        count = bisect.bisect_left(hits, candidate + tokens) - bisect.bisect_left(hits, candidate)
+        if count > best:
+            start, best = candidate, count
+    end = min(len(words), start + tokens)
+
+    marked = set(hits)
+    parts = [ellipsis] if start > 0 else []
+    position = words[start].start()
+    for index in range(start, end):
+        word = words[index]
+        parts.append(text[position:word.start()])
+        parts.append(f'{start_mark}{word.group()}{end_mark}' if index in marked else word.group())
+        position = word.end()
+    if end < len(words):
+        parts.append(ellipsis)
+    return ''.join(parts)
+
+class ResultCache:
+    """Zweistufiger Ergebnis-Cache: In-Memory-LRU vor einer persistenten SQLite-Tabelle.
+    
+    Schlüssel enthalten die Scoring-Version, sodass Änderungen an Logik oder
+    Gewichten alte Einträge automatisch ungültig machen.
+    """
+    
+    def __init__(self, db_manager, version, max_entries=RESULT_CACHE_SIZE,
+                 ttl=RESULT_CACHE_TTL, max_rows=RESULT_CACHE_MAX_ROWS, source_version=None,
+                 trim_every=RESULT_CACHE_TRIM_EVERY):
+        self.db_manager = db_manager
+        self.version = version
+        # Liefert die aktuelle Version der Domain-Bewertung (Teil aller Schlüssel mit URL)
+        self.source_version = source_version or (lambda: '')
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.trim_every = trim_every
+        self._writes = 0
+        self.stats = {'hits': 0, 'memory_hits': 0, 'db_hits': 0, 'misses': 0, 'evictions': 0}
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        
+        purged = self.db_manager.purge_cached_results(version)
+        if purged:
+            logger.info(f"🧹 {purged} veraltete Cache-Einträge entfernt")
+        self.stats['evictions'] += self.db_manager.trim_cached_results(max_rows)
+    
+    def content_key(self, content, url=None, detail='full'):
+        """Schlüssel für Text-Analysen (normalisierter Inhalt + optionale Quell-URL)"""
+        return self._key(detail, 'content', normalize_content(content), url or '',
+                         self.source_version() if url else '')
+    
+    def url_key(self, url, validator, detail='full'):
+        """Schlüssel für URL-Analysen (URL + ETag/Last-Modified bzw. Inhalts-Hash)"""
+        return self._key(detail, 'url', url, validator or '', self.source_version())
+    
+    def _key(self, detail, *parts):
+        # Detailstufe nur außerhalb von 'full', damit bestehende Einträge gültig bleiben
+        if detail != 'full':
+            parts += (detail,)
+        return hashlib.sha256('\0'.join((self.version,) + parts).encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        """Liefert eine Kopie des gecachten Ergebnisses oder None"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats['hits'] += 1
+                    self.stats['memory_hits'] += 1
+                    return dict(result)
+                del self._memory[key]
+        
+        result = self.db_manager.get_cached_result(key)
+        with self._lock:
+            if result is None:
+                self.stats['misses'] += 1
+                return None
+            self.stats['hits'] += 1
+            self.stats['db_hits'] += 1
+            self._remember(key, result, now)
+        return dict(result)
+    
+    def set(self, key, result):
+        """Speichert ein Ergebnis in beiden Stufen (ohne den Inhalt selbst)"""
+        if 'error' in result:
+            return
+        result = {k: v for k, v in result.items() if k != 'content'}
+        with self._lock:
+            self._remember(key, result, time.time())
+        self.db_manager.store_cached_result(key, self.version, result, self.ttl)
+        with self._lock:
+            self._writes += 1
+            trim = self._writes % self.trim_every == 0
+        if trim:
+            # Die Tabelle darf zwischendurch um bis zu trim_every Zeilen überlaufen
+            evicted = self.db_manager.trim_cached_results(self.max_rows)
+            with self._lock:
+                self.stats['evictions'] += evicted
+    
+    def _remember(self, key, result, now):
+        self._memory[key] = (now + self.ttl, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats['evictions'] += 1
+    
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['memory_entries'] = len(self._memory)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        stats['version'] = self.version
+        return stats
+
+class WriteBehindQueue:
+    """Speichert Analysen asynchron in gebündelten Transaktionen.
+    
+    Analysen landen in einer begrenzten Queue; ein Hintergrund-Thread schreibt
+    sie alle N Einträge oder spätestens nach T Millisekunden. Ist die Queue
+    voll, wartet der Aufrufer kurz (Back-Pressure) und schreibt danach
+    synchron. Jede Analyse trägt einen Idempotenz-Schlüssel, über den die
+    vergebene ID später abgefragt werden kann.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, db_manager, max_size=WRITE_BEHIND_QUEUE_SIZE, batch_size=WRITE_BEHIND_BATCH_SIZE,
+                 flush_ms=WRITE_BEHIND_FLUSH_MS, put_timeout=WRITE_BEHIND_PUT_TIMEOUT):
+        self.db_manager = db_manager
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_ms / 1000.0
+        self.put_timeout = put_timeout
+        self.stats = {'queued': 0, 'written': 0, 'batches': 0, 'failed': 0, 'sync_fallbacks': 0}
+        self._pending = set()
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+    
+    def submit(self, analysis_data, idempotency_key=None):
+        """Reiht eine Analyse zum Speichern ein und liefert ihren Idempotenz-Schlüssel"""
+        key = idempotency_key or uuid.uuid4().hex
+        record = dict(analysis_data, idempotency_key=key)
+        self._ensure_worker()
+        
+        with self._lock:
+            self._pending.add(key)
+        try:
+            self._queue.put(record, timeout=self.put_timeout)
+            self.stats['queued'] += 1
+        except queue.Full:
+            # Back-Pressure: Queue bleibt voll, daher synchron schreiben
+            self.stats['sync_fallbacks'] += 1
+            self._write([record])
+        return key
+    
+    def is_pending(self, idempotency_key):
+        with self._lock:
+            return idempotency_key in self._pending
+    
+    def depth(self):
+        return self._queue.qsize() if self._queue is not None else 0
+    
+    def _ensure_worker(self):
+        """Startet den Writer-Thread (auch neu nach einem Fork)"""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._pending = set()
+                self._queue = queue.Queue(maxsize=self.max_size)
+                self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+                self._thread.start()
+    
+    def _run(self):
+        work_queue = self._queue
+        while True:
+            item = work_queue.get()
+            if item is self._STOP:
+                return
+            
+            batch = [item]
+            deadline = time.perf_counter() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = work_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            
+            self._write(batch)
+            if stop:
+                return
+    
+    def _write(self, batch):
+        try:
+            self.db_manager.save_analyses(batch)
+            self.stats['written'] += len(batch)
+            self.stats['batches'] += 1
+        except Exception as e:
+            # Einzeln nachschreiben, damit ein fehlerhafter Eintrag nicht den ganzen Batch verwirft
+            logger.warning(f"⚠️ Batch-Speicherung fehlgeschlagen, schreibe einzeln: {e}")
+            for record in batch:
+                if self.db_manager.save_analysis(record) is None:
+                    self.stats['failed'] += 1
+                else:
+                    self.stats['written'] += 1
+        finally:
+            with self._lock:
+                self._pending.difference_update(record['idempotency_key'] for record in batch)
+        
+        logger.info(f"💾 {len(batch)} Analysen gespeichert (Write-Behind)")
+    
+    def shutdown(self, timeout=10.0):
+        """Schreibt alle ausstehenden Analysen und beendet den Writer-Thread"""
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            return
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+    
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats['depth'] = self.depth()
+        stats['enabled'] = WRITE_BEHIND_ENABLED
+        return stats
+
+class JobManager:
+    """Führt lang laufende Analysen (z.B. URL-Analysen) auf einem begrenzten Worker-Pool aus.
+    
+    ``submit`` liefert sofort eine Job-ID; Status, Fortschritt und Ergebnis
+    liegen in der Tabelle analysis_jobs und sind damit von jedem Worker-Prozess
+    abrufbar. Nimmt die Warteschlange keine Jobs mehr an, wird ``queue.Full``
+    ausgelöst.
+    """
+    
+    FINISHED = ('done', 'failed')
+    
+    def __init__(self, db_manager, max_workers=JOB_WORKERS, max_queue=JOB_QUEUE_SIZE, ttl=JOB_TTL):
+        self.db_manager = db_manager
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.ttl = ttl
+        self.stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'rejected': 0}
+        self._waits = collections.deque(maxlen=1000)
+        self._runtimes = collections.deque(maxlen=1000)
+        self._queued = 0
+        self._running = 0
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+    
+    def _get_executor(self):
+        """Worker-Pool (auch neu nach einem Fork)"""
+        if self._executor is None or self._pid != os.getpid():
+            with self._lock:
+                if self._executor is None or self._pid != os.getpid():
+                    self._pid = os.getpid()
+                    self._queued = self._running = 0
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='job')
+        return self._executor
+    
+    def submit(self, kind, runner, *args):
+        """Reiht ``runner(*args, progress)`` als Job ein und liefert die Job-ID"""
+        executor = self._get_executor()
+        with self._lock:
+            if self._queued >= self.max_queue:
+                self.stats['rejected'] += 1
+                raise queue.Full
+            self._queued += 1
+        
+        job_id = uuid.uuid4().hex
+        created_at = time.time()
+        try:
+            self.db_manager.create_job(job_id, kind, created_at)
+            executor.submit(self._run, job_id, created_at, runner, args)
+        except Exception:
+            # Platz in der Warteschlange wieder freigeben
+            with self._lock:
+                self._queued -= 1
+            raise
+        self.stats['submitted'] += 1
+        self.db_manager.purge_jobs(created_at - self.ttl)
+        return job_id
+    
+    def _run(self, job_id, created_at, runner, args):
+        started_at = time.time()
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        self._waits.append(started_at - created_at)
+        
+        def progress(done, total):
+            self.db_manager.update_job(job_id, progress={'done': done, 'total': total})
+        
+        try:
+            self.db_manager.update_job(job_id, status='running', started_at=started_at)
+            result = runner(*args, progress)
+            self.db_manager.update_job(job_id, status='done', result=result, finished_at=time.time())
+            self.stats['completed'] += 1
+        except Exception as e:
+            logger.error(f"❌ Job {job_id} fehlgeschlagen: {e}")
+            self.db_manager.update_job(job_id, status='failed', error=str(e), finished_at=time.time())
+            self.stats['failed'] += 1
+        finally:
+            self._runtimes.append(time.time() - started_at)
+            with self._lock:
+                self._running -= 1
+    
+    def get(self, job_id, include_result=True):
+        return self.db_manager.get_job(job_id, include_result)
+    
+    def events(self, job_id, poll_interval=JOB_POLL_INTERVAL_MS / 1000.0, timeout=JOB_STREAM_TIMEOUT):
+        """Server-Sent Events: Status-/Fortschrittsänderungen bis zum Ergebnis"""
+        deadline = time.monotonic() + timeout
+        last_state = None
+        last_sent = time.monotonic()
+        
+        while time.monotonic() < deadline:
+            job = self.get(job_id, include_result=False)
+            if job is None:
+                yield f'event: failed\ndata: {json.dumps({"error": "Job nicht gefunden"})}\n\n'
+                return
+            
+            state = (job['status'], json.dumps(job['progress']))
+            if state != last_state:
+                last_state = state
+                last_sent = time.monotonic()
+                if job['status'] in self.FINISHED:
+                    job = self.get(job_id)
+                    yield f'event: {"result" if job["status"] == "done" else "failed"}\ndata: {json.dumps(job)}\n\n'
+                    return
+                yield f'event: status\ndata: {json.dumps(job)}\n\n'
+            elif time.monotonic() - last_sent > 15:
+                # Keep-Alive für Proxies
+                last_sent = time.monotonic()
+                yield ': keep-alive\n\n'
+            
+            time.sleep(poll_interval)
+        
+        yield f'event: timeout\ndata: {json.dumps({"job_id": job_id})}\n\n'
+    
+    @staticmethod
+    def _summary(values):
+        if not values:
+            return {'avg': None, 'p50': None, 'p95': None, 'max': None}
+        ordered = sorted(values)
+        return {
+            'avg': round(sum(ordered) / len(ordered), 3),
+            'p50': round(ordered[len(ordered) // 2], 3),
+            'p95': round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)], 3),
+            'max': round(ordered[-1], 3)
+        }
+    
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats, queue_depth=self._queued, running=self._running)
+        stats['workers'] = self.max_workers
+        stats['max_queue'] = self.max_queue
+        stats['wait_seconds'] = self._summary(list(self._waits))
+        stats['run_seconds'] = self._summary(list(self._runtimes))
+        stats['queued_all_workers'] = self.db_manager.count_jobs('queued')
+        return stats
+
+class HttpCache:
+    """Persistenter HTTP-Cache des Scrapers (eigene SQLite-Datei).
+    
+    Speichert pro URL die Validatoren (ETag/Last-Modified), die Frische laut
+    ``Cache-Control: max-age`` sowie den bereits extrahierten Inhalt und die
+    Metadaten. Die Gesamtgröße ist begrenzt; verdrängt wird nach LRU.
+    """
+    
+    def __init__(self, path=SCRAPER_CACHE_PATH, max_bytes=SCRAPER_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.stats = {'fresh_hits': 0, 'revalidated': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        self._bytes = 0
+    
+    def _connection(self):
+        """Eine Verbindung pro Prozess, Zugriffe über den Lock serialisiert"""
+        if self._conn is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._conn = sqlite3.connect(self.path, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000.0, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                expires_at REAL NOT NULL,
+                codec TEXT NOT NULL,
+                content BLOB NOT NULL,
+                metadata TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            ''')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_http_cache_access ON http_cache(last_access)')
+            self._conn.commit()
+            self._bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM http_cache').fetchone()[0]
+        return self._conn
+    
+    @staticmethod
+    def freshness(headers):
+        """Ablaufzeitpunkt aus Cache-Control; ``None`` bei no-store (nicht speichern)"""
+        directives = {}
+        for part in headers.get('Cache-Control', '').lower().split(','):
+            name, _, value = part.strip().partition('=')
+            if name:
+                directives[name] = value.strip('"')
+        
+        if 'no-store' in directives:
+            return None
+        now = time.time()
+        if 'no-cache' in directives:
+            return now
+        try:
+            max_age = int(directives.get('max-age', 0))
+            age = int(headers.get('Age', 0))
+        except ValueError:
+            return now
+        return now + max(max_age - age, 0)
+    
+    def get(self, url):
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute('''
+            SELECT etag, last_modified, expires_at, codec, content, metadata
+            FROM http_cache WHERE url = ?
+            ''', (url,)).fetchone()
+            if row is None:
+                return None
+            conn.execute('UPDATE http_cache SET last_access = ? WHERE url = ?', (time.time(), url))
+            conn.commit()
+        
+        etag, last_modified, expires_at, codec, content, metadata = row
+        return {
+            'etag': etag,
+            'last_modified': last_modified,
+            'expires_at': expires_at,
+            'content': decode_document(codec, content),
+            'metadata': json.loads(metadata)
+        }
+    
+    def set(self, url, entry, expires_at):
+        codec, body = encode_document(entry['content'])
+        metadata = json.dumps(entry['metadata'])
+        size = len(body) + len(metadata) + len(url)
+        
+        with self._lock:
+            conn = self._connection()
+            previous = conn.execute('SELECT size FROM http_cache WHERE url = ?', (url,)).fetchone()
+            conn.execute('''
+            INSERT OR REPLACE INTO http_cache
+                (url, etag, last_modified, expires_at, codec, content, metadata, size, last_access)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (url, entry.get('etag'), entry.get('last_modified'), expires_at,
+                  codec, body, metadata, size, time.time()))
+            self.stats['stores'] += 1
+            self._bytes += size - (previous[0] if previous else 0)
+            if self._bytes > self.max_bytes:
+                self._evict(conn)
+            conn.commit()
+    
+    def refresh(self, url, expires_at):
+        """Nach einer 304-Antwort: nur die Frische verlängern"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute('UPDATE http_cache SET expires_at = ?, last_access = ? WHERE url = ?',
+                         (expires_at, time.time(), url))
+            conn.commit()
+    
+    def delete(self, url):
+        with self._lock:
+            conn = self._connection()
+            previous = conn.execute('SELECT size FROM http_cache WHERE url = ?', (url,)).fetchone()
+            if previous:
+                conn.execute('DELETE FROM http_cache WHERE url = ?', (url,))
+                conn.commit()
+                self._bytes -= previous[0]
+    
+    def _evict(self, conn):
+        """Verdrängt die am längsten nicht genutzten Einträge oberhalb von max_bytes"""
+        # Andere Worker-Prozesse schreiben in dieselbe Datei: Summe neu ermitteln
+        self._bytes = conn.execute('SELECT COALESCE(SUM(size), 0) FROM http_cache').fetchone()[0]
+        if self._bytes <= self.max_bytes:
+            return
+        
+        excess = self._bytes - self.max_bytes
+        victims = []
+        for url, size in conn.execute('SELECT url, size FROM http_cache ORDER BY last_access'):
+            victims.append((url,))
+            excess -= size
+            self._bytes -= size
+            if excess <= 0:
+                break
+        conn.executemany('DELETE FROM http_cache WHERE url = ?', victims)
+        self.stats['evictions'] += len(victims)
+    
+    def get_stats(self):
+        stats = dict(self.stats, max_bytes=self.max_bytes)
+        with self._lock:
+            stats['entries'], stats['bytes'] = self._connection().execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache'
+            ).fetchone()
+        return stats
 
 class WebScraper:
-    """Web-Scraping für URL-Analyse"""
+    """Web-Scraping für URL-Analyse.
     
-    def __init__(self):
+    Alle Abrufe teilen sich eine Session mit Verbindungspool und Retries.
+    ``scrape_many`` lädt mehrere URLs parallel (global begrenzt durch
+    ``max_workers``) und hält pro Host höchstens ``per_host_limit`` gleichzeitige
+    Anfragen mit einem Mindestabstand von ``host_interval_ms`` ein.
+    """
+    
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+    
+    def __init__(self, max_workers=SCRAPER_MAX_WORKERS, per_host_limit=SCRAPER_PER_HOST_LIMIT,
+                 host_interval_ms=SCRAPER_HOST_INTERVAL_MS, retries=SCRAPER_RETRIES, backoff=SCRAPER_BACKOFF,
+                 cache=None, max_bytes=SCRAPER_MAX_BYTES, parser=SCRAPER_PARSER):
+        self.cache = cache
+        self.max_bytes = max_bytes
+        self.parser = parser
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.host_interval = host_interval_ms / 1000.0
+        self.timeout = (SCRAPER_CONNECT_TIMEOUT, SCRAPER_READ_TIMEOUT)
+        self.stats = {'requests': 0, 'errors': 0, 'host_waits': 0, 'truncated': 0}
+        
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'CredibilityGuard/1.0 (Content Analysis Bot)'
         })
+        
+        # Pool groß genug für alle Worker, Retries mit exponentiellem Backoff
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=self.RETRY_STATUS,
+            allowed_methods=('GET', 'HEAD'),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        self._hosts = {}
+        self._hosts_lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+    
+    @contextlib.contextmanager
+    def _host_slot(self, url):
+        """Begrenzt gleichzeitige Anfragen und Anfragerate pro Host"""
+        host = urlparse(url).netloc.lower()
+        with self._hosts_lock:
+            slot = self._hosts.get(host)
+            if slot is None:
+                slot = self._hosts[host] = {
+                    'semaphore': threading.BoundedSemaphore(self.per_host_limit),
+                    'lock': threading.Lock(),
+                    'next_request': 0.0
+                }
+        
+        with slot['semaphore']:
+            with slot['lock']:
+                now = time.monotonic()
+                wait = slot['next_request'] - now
+                slot['next_request'] = max(now, slot['next_request']) + self.host_interval
+            if wait > 0:
+                self.stats['host_waits'] += 1
+                time.sleep(wait)
+            yield
+    
+    def _get_executor(self):
+        """Thread-Pool für parallele Abrufe (auch neu nach einem Fork)"""
+        if self._executor is None or self._pid != os.getpid():
+            with self._hosts_lock:
+                if self._executor is None or self._pid != os.getpid():
+                    self._pid = os.getpid()
+                    self._hosts = {}
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scraper')
+        return self._executor
+    
+    def scrape_many(self, urls):
+        """Lädt mehrere URLs parallel; liefert ``(url, result)`` in Fertigstellungs-Reihenfolge.
+        
+        Doppelte URLs werden nur einmal geladen. Da die Ergebnisse geliefert
+        werden, sobald sie vorliegen, kann der Aufrufer schon analysieren,
+        während weitere Seiten noch geladen werden.
+        """
+        executor = self._get_executor()
+        # Je Abruf eine Kopie des Kontexts, damit scrape_fetch/html_parse in der
+        # Request-Aufschlüsselung (?timings=1) landen
+        pending = {executor.submit(contextvars.copy_context().run, self.scrape_article, url): url
+                   for url in dict.fromkeys(urls)}
+        try:
+            for future in concurrent.futures.as_completed(pending):
+                yield pending[future], future.result()
+        finally:
+            # Abbruch durch den Aufrufer: noch nicht gestartete Abrufe verwerfen
+            for future in pending:
+                future.cancel()
     
     def scrape_article(self, url):
-        """Scrapet Artikel-Inhalt von einer URL"""
+        """Scrapet Artikel-Inhalt von einer URL.
+        
+        Mit HTTP-Cache: frische Einträge werden ohne Anfrage geliefert, sonst
+        wird mit If-None-Match/If-Modified-Since revalidiert; bei 304 entfallen
+        Download und erneute Extraktion.
+        """
         try:
+            cached = self.cache.get(url) if self.cache else None
+            if cached and cached['expires_at'] > time.time():
+                self.cache.stats['fresh_hits'] += 1
+                return self._scrape_result(url, cached, 'fresh')
+            
+            headers = {}
+            if cached:
+                if cached['etag']:
+                    headers['If-None-Match'] = cached['etag']
+                if cached['last_modified']:
+                    headers['If-Modified-Since'] = cached['last_modified']
+            
             # Timeout und Error Handling
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            self.stats['requests'] += 1
+            fetch_start = time.perf_counter_ns()
+            # Die Antwort belegt den Host-Slot bis der Body gelesen (bzw. die
+            # Verbindung geschlossen) ist, sonst begrenzt SCRAPER_PER_HOST_LIMIT
+            # nur den Verbindungsaufbau, nicht die Downloads
+            with self._host_slot(url):
+                response = self.session.get(url, timeout=self.timeout, headers=headers, stream=True)
+                with response:
+                    not_modified = response.status_code == 304 and cached
+                    if not not_modified:
+                        response.raise_for_status()
+                        # Gestreamter Download, begrenzt auf max_bytes
+                        raw, truncated = self._read_body(response)
+            metrics.observe('scrape_fetch', time.perf_counter_ns() - fetch_start)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if not_modified:
+                self.cache.stats['revalidated'] += 1
+                expires_at = HttpCache.freshness(response.headers)
+                self.cache.refresh(url, expires_at if expires_at is not None else 0)
+                return self._scrape_result(url, cached, 'revalidated')
+            with metrics.span('html_parse'):
+                content, metadata = self.extract(raw, url, encoding=self._declared_encoding(response))
             
             # Content-Extraktion
-            content = self._extract_content(soup)
-            metadata = self._extract_metadata(soup, url)
-            
-            return {
-                'success': True,
+            entry = {
                 'content': content,
                 'metadata': metadata,
-                'url': url
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
             }
+            if truncated:
+                logger.warning(f"⚠️ Seite nach {self.max_bytes} Bytes abgeschnitten: {url}")
+            
+            if self.cache:
+                self.cache.stats['misses'] += 1
+                expires_at = HttpCache.freshness(response.headers)
+                if expires_at is None:
+                    self.cache.delete(url)
+                elif entry['etag'] or entry['last_modified'] or expires_at > time.time():
+                    self.cache.set(url, entry, expires_at)
+            
+            return self._scrape_result(url, entry, 'miss' if self.cache else None)
             
         except requests.RequestException as e:
+            self.stats['errors'] += 1
             logger.error(f"❌ Scraping-Fehler für {url}: {e}")
             return {
                 'success': False,
@@ -529,6 +2744,7 @@ class WebScraper:
                 'url': url
             }
         except Exception as e:
+            self.stats['errors'] += 1
             logger.error(f"❌ Unerwarteter Fehler beim Scraping: {e}")
             return {
                 'success': False,
@@ -536,6 +2752,178 @@ class WebScraper:
                 'url': url
             }
     
+    def _read_body(self, response):
+        """Liest den Body in Blöcken bis max_bytes; liefert (bytes, abgeschnitten)"""
+        chunks = []
+        size = 0
+        truncated = False
+        try:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= self.max_bytes:
+                    truncated = size > self.max_bytes
+                    break
+        finally:
+            response.close()
+        
+        if truncated:
+            self.stats['truncated'] += 1
+        return b''.join(chunks)[:self.max_bytes], truncated
+    
+    @staticmethod
+    def _declared_encoding(response):
+        """Zeichensatz aus dem Content-Type-Header (sonst erkennt ihn der Parser)"""
+        content_type = response.headers.get('Content-Type', '')
+        match = re.search(r'charset=["\']?([\w-]+)', content_type, re.IGNORECASE)
+        return match.group(1) if match else None
+    
+    def extract(self, raw, url, encoding=None, parser=None):
+        """Extrahiert (Inhalt, Metadaten) aus HTML-Bytes; lxml wenn verfügbar, sonst BeautifulSoup"""
+        parser = parser or self.parser
+        if parser != 'bs4':
+            try:
+                return self._extract_with_lxml(raw, url, encoding)
+            except ImportError:
+                if parser == 'lxml':
+                    raise
+        return self._extract_with_bs4(raw, url)
+    
+    def _extract_with_bs4(self, raw, url):
+        """Bisheriger Pfad: BeautifulSoup mit html.parser"""
+        soup = BeautifulSoup(raw, 'html.parser')
+        # Metadaten zuerst, da die Inhalts-Extraktion <script> (JSON-LD) entfernt
+        metadata = self._extract_metadata(soup, url)
+        return self._extract_content(soup), metadata
+    
+    # Störelemente und Inhalts-Container in der Priorität von _extract_content
+    SKIP_TAGS = frozenset(['script', 'style', 'nav', 'footer', 'aside', 'advertisement'])
+    CONTAINER_CLASSES = ('content', 'article-content', 'post-content', 'entry-content')
+    
+    def _extract_with_lxml(self, raw, url, encoding=None):
+        """Schneller Pfad: ein einziger Durchlauf über den lxml-Baum.
+        
+        Sammelt Titel, Meta-Tags, JSON-LD, Inhalts-Container und Absätze
+        gemeinsam und liefert dasselbe Ergebnis wie der BeautifulSoup-Pfad.
+        """
+        lxml_html = lazy_import('lxml.html')
+        if not raw or not raw.strip():
+            return '', self._empty_metadata(url)
+        
+        encoding = encoding or self._sniff_encoding(raw)
+        html_parser = lxml_html.HTMLParser(encoding=encoding) if encoding else None
+        try:
+            root = lxml_html.document_fromstring(raw, parser=html_parser)
+        except (ValueError, LookupError):
+            root = lxml_html.document_fromstring(raw)
+        
+        metadata = self._empty_metadata(url)
+        title = None
+        json_ld = []
+        # Treffer je Selektor in Dokument-Reihenfolge (Index = Priorität)
+        containers = [[] for _ in range(3 + len(self.CONTAINER_CLASSES))]
+        paragraphs = []
+        
+        # (Element, innerhalb eines Störelements): dort nur noch Metadaten sammeln
+        stack = [(root, False)]
+        while stack:
+            element, skipped = stack.pop()
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue  # Kommentare, Processing Instructions
+            tag = tag.lower()
+            
+            if tag == 'script' and (element.get('type') or '').strip().lower() == 'application/ld+json':
+                json_ld.append(element.text or '')
+            elif tag == 'title' and title is None:
+                title = element
+            elif tag == 'meta':
+                self._apply_meta(metadata, element.get('name'), element.get('property'), element.get('content'))
+            
+            if skipped or tag in self.SKIP_TAGS:
+                stack.extend((child, True) for child in reversed(element))
+                continue
+            
+            if tag == 'article':
+                containers[0].append(element)
+            if element.get('role') == 'main':
+                containers[1].append(element)
+            classes = (element.get('class') or '').split()
+            for index, name in enumerate(self.CONTAINER_CLASSES):
+                if name in classes:
+                    containers[2 + index].append(element)
+            if tag == 'main':
+                containers[-1].append(element)
+            if tag == 'p':
+                paragraphs.append(element)
+            
+            stack.extend((child, False) for child in reversed(element))
+        
+        if title is not None:
+            metadata['title'] = self._element_text(title, skip=False)
+        for script in json_ld:
+            self._apply_json_ld(metadata, script)
+        
+        content = ''
+        for elements in containers:
+            if elements:
+                content = ' '.join(self._element_text(element) for element in elements)
+                break
+        if not content:
+            content = ' '.join(self._element_text(p) for p in paragraphs)
+        
+        return content.strip(), metadata
+    
+    @staticmethod
+    def _sniff_encoding(raw):
+        """Zeichensatz aus <meta charset>, sonst UTF-8 falls gültig (libxml2 nimmt sonst Latin-1 an)"""
+        match = re.search(rb'<meta[^>]+charset=["\']?([\w-]+)', raw[:4096], re.IGNORECASE)
+        if match:
+            return match.group(1).decode('ascii')
+        try:
+            raw.decode('utf-8')
+            return 'utf-8'
+        except UnicodeDecodeError:
+            return None
+    
+    def _element_text(self, element, skip=True):
+        """Text wie BeautifulSoup get_text(strip=True): Textknoten einzeln getrimmt, ohne Trenner.
+        
+        Iterativ mit eigenem Stack, damit tief verschachteltes HTML keinen RecursionError auslöst.
+        """
+        parts = []
+        # Elemente und bereits getrimmte Tail-Texte; oben liegt das nächste in Dokument-Reihenfolge
+        stack = [element]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+                continue
+            if node.text:
+                text = node.text.strip()
+                if text:
+                    parts.append(text)
+            for child in reversed(node):
+                if child.tail:
+                    tail = child.tail.strip()
+                    if tail:
+                        stack.append(tail)
+                tag = child.tag
+                if isinstance(tag, str) and not (skip and tag.lower() in self.SKIP_TAGS):
+                    stack.append(child)
+        return ''.join(parts)
+    
+    def _scrape_result(self, url, entry, cache_status):
+        return {
+            'success': True,
+            'content': entry['content'],
+            'metadata': entry['metadata'],
+            'url': url,
+            'etag': entry.get('etag'),
+            'last_modified': entry.get('last_modified'),
+            'http_cache': cache_status
+        }
+    
     def _extract_content(self, soup):
         """Extrahiert Hauptinhalt aus HTML"""
         # Entferne Störelemente
@@ -567,14 +2955,46 @@ class WebScraper:
         
         return content.strip()
     
-    def _extract_metadata(self, soup, url):
-        """Extrahiert Metadaten aus HTML"""
-        metadata = {
+    def _empty_metadata(self, url):
+        return {
             'title': '',
             'author': '',
             'publication_date': '',
             'domain': urlparse(url).netloc
         }
+    
+    @staticmethod
+    def _apply_meta(metadata, name, property_attr, content):
+        """Übernimmt Autor und Veröffentlichungsdatum aus einem Meta-Tag"""
+        name = (name or '').lower()
+        property_attr = (property_attr or '').lower()
+        content = content or ''
+        
+        # Author
+        if name in ['author', 'article:author'] or property_attr == 'article:author':
+            metadata['author'] = content
+        
+        # Publication Date
+        if (name in ['publish-date', 'article:published_time'] or 
+            property_attr in ['article:published_time', 'article:published']):
+            metadata['publication_date'] = content
+    
+    @staticmethod
+    def _apply_json_ld(metadata, text):
+        """Übernimmt Autor und Datum aus Structured Data (JSON-LD)"""
+        try:
+            data = json.loads(text)
+        except (TypeError, ValueError):
+            return
+        if isinstance(data, dict):
+            if 'author' in data and isinstance(data['author'], dict):
+                metadata['author'] = data['author'].get('name', metadata['author'])
+            if 'datePublished' in data:
+                metadata['publication_date'] = data['datePublished']
+    
+    def _extract_metadata(self, soup, url):
+        """Extrahiert Metadaten aus HTML"""
+        metadata = self._empty_metadata(url)
         
         # Title
         title_elem = soup.find('title')
@@ -583,84 +3003,806 @@ class WebScraper:
         
         # Meta Tags
         for meta in soup.find_all('meta'):
-            name = meta.get('name', '').lower()
-            property_attr = meta.get('property', '').lower()
-            content = meta.get('content', '')
-            
-            # Author
-            if name in ['author', 'article:author'] or property_attr == 'article:author':
-                metadata['author'] = content
-            
-            # Publication Date
-            if (name in ['publish-date', 'article:published_time'] or 
-                property_attr in ['article:published_time', 'article:published']):
-                metadata['publication_date'] = content
+            self._apply_meta(metadata, meta.get('name'), meta.get('property'), meta.get('content'))
         
         # Structured Data (JSON-LD)
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
+        for script in soup.find_all('script', type='application/ld+json'):
+            self._apply_json_ld(metadata, script.string)
+        
+        return metadata
+
+class DomainReputationIndex:
+    """Bewertete Domains als Suffix-Trie über umgekehrte Labels.
+    
+    ``lookup('www.nature.com')`` läuft die Labels ``com`` → ``nature`` → ``www``
+    ab und liefert den längsten passenden Eintrag, also O(Anzahl Labels)
+    unabhängig von der Indexgröße. Ein Eintrag gilt für die Domain selbst und
+    alle Subdomains (``edu`` für jede .edu-Domain, aber nicht für
+    ``fakeedunews.com``). Die Einträge aus ``path`` (CSV oder JSON) ergänzen bzw.
+    überschreiben die Standardliste; Änderungen an der Datei werden spätestens
+    nach ``reload_interval`` Sekunden ohne Neustart übernommen.
+    """
+    
+    # Standardliste: Domain -> (Score-Bonus, Kategorie)
+    DEFAULTS = {
+        'nature.com': (0.3, 'trusted'), 'science.org': (0.3, 'trusted'),
+        'cell.com': (0.3, 'trusted'), 'nejm.org': (0.3, 'trusted'),
+        'bbc.com': (0.3, 'trusted'), 'reuters.com': (0.3, 'trusted'),
+        'ap.org': (0.3, 'trusted'), 'npr.org': (0.3, 'trusted'),
+        'who.int': (0.3, 'trusted'), 'cdc.gov': (0.3, 'trusted'), 'nih.gov': (0.3, 'trusted'),
+        'edu': (0.3, 'academic'),
+        'gov': (0.25, 'government'),
+        'org': (0.1, 'organization')
+    }
+    
+    DOMAIN_PATTERN = re.compile(r'^[a-z0-9_-]+(\.[a-z0-9_-]+)*$')
+    
+    def __init__(self, path=DOMAIN_REPUTATION_PATH, reload_interval=DOMAIN_REPUTATION_RELOAD_INTERVAL):
+        self.path = path
+        self.reload_interval = reload_interval
+        self.stats = {'entries': 0, 'skipped': 0, 'reloads': 0, 'errors': 0, 'lookups': 0, 'hits': 0}
+        self.loaded_at = None
+        # (Trie, Version) werden gemeinsam ausgetauscht
+        self._index = ({}, '')
+        self._mtime = None
+        self._checked = time.monotonic()
+        self._lock = threading.Lock()
+        self.reload(force=True)
+    
+    @property
+    def version(self):
+        """Kurzer Hash der geladenen Einträge (Teil der Cache-Schlüssel)"""
+        self._maybe_reload()
+        return self._index[1]
+    
+    @classmethod
+    def normalize(cls, domain):
+        """Kleinschreibung, ohne Benutzer/Port/abschließenden Punkt, IDN als Punycode"""
+        domain = (domain or '').strip().lower().rsplit('@', 1)[-1]
+        domain = domain.split(':', 1)[0].rstrip('.')
+        try:
+            domain = domain.encode('idna').decode('ascii')
+        except UnicodeError:
+            pass
+        return domain
+    
+    def lookup(self, domain):
+        """Längster passender Eintrag (dict mit score, category, source, matched) oder None"""
+        self._maybe_reload()
+        node = self._index[0]
+        labels = self.normalize(domain).split('.')
+        
+        best, depth = None, 0
+        for label in reversed(labels):
+            node = node.get(label)
+            if node is None:
+                break
+            depth += 1
+            if None in node:
+                best = (node[None], depth)
+        
+        self.stats['lookups'] += 1
+        if best is None:
+            return None
+        self.stats['hits'] += 1
+        entry, depth = best
+        return dict(entry, matched='.'.join(labels[-depth:]))
+    
+    def _maybe_reload(self):
+        """Prüft höchstens alle reload_interval Sekunden, ob sich die Datei geändert hat"""
+        if self.path and time.monotonic() - self._checked >= self.reload_interval:
+            self._checked = time.monotonic()
+            self.reload()
+    
+    def reload(self, force=False):
+        """Baut den Index neu auf, falls die Datei geändert wurde (oder force)"""
+        with self._lock:
             try:
-                data = json.loads(script.string)
+                mtime = os.stat(self.path).st_mtime_ns if self.path else None
+            except OSError:
+                mtime = None
+            if not force and mtime == self._mtime:
+                return False
+            
+            entries = {
+                domain: {'score': score, 'category': category, 'source': 'default'}
+                for domain, (score, category) in self.DEFAULTS.items()
+            }
+            skipped = 0
+            if mtime is not None:
+                try:
+                    file_entries, skipped = self._load_file(self.path)
+                except (OSError, ValueError, TypeError, AttributeError, csv.Error) as e:
+                    # Bisherigen Index behalten (beim Start: Standardliste); erneuter Versuch, sobald sich die Datei ändert
+                    self.stats['errors'] += 1
+                    self._mtime = mtime
+                    logger.error(f"❌ Domain-Reputation konnte nicht geladen werden ({self.path}): {e}")
+                    if self.loaded_at is not None:
+                        return False
+                    file_entries = {}
+                entries.update(file_entries)
+            elif self.path:
+                logger.warning(f"⚠️ Domain-Reputation: Datei {self.path} nicht gefunden, nur Standardliste aktiv")
+            
+            fingerprint = json.dumps(sorted(entries.items()), sort_keys=True)
+            version = hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()[:12]
+            self._index = (self._build(entries), version)
+            
+            if self.loaded_at is not None:
+                self.stats['reloads'] += 1
+            self._mtime = mtime
+            self.loaded_at = time.time()
+            self.stats['entries'] = len(entries)
+            self.stats['skipped'] = skipped
+            logger.info(f"🛡️ Domain-Reputation: {len(entries)} Einträge geladen (Version {version})")
+            return True
+    
+    @staticmethod
+    def _build(entries):
+        """Trie aus umgekehrten Labels; der Eintrag liegt unter dem Schlüssel None"""
+        root = {}
+        for domain, entry in entries.items():
+            node = root
+            for label in reversed(domain.split('.')):
+                node = node.setdefault(label, {})
+            node[None] = entry
+        return root
+    
+    def _load_file(self, path):
+        """Liest CSV (Spalten domain, score, optional category) oder JSON
+        (``{"domain": score}``, ``{"domain": {"score": ..., "category": ...}}``
+        oder eine Liste solcher Objekte mit ``domain``)
+        """
+        source = os.path.basename(path)
+        with open(path, encoding='utf-8', newline='') as f:
+            if path.lower().endswith('.json'):
+                data = json.load(f)
                 if isinstance(data, dict):
-                    if 'author' in data and isinstance(data['author'], dict):
-                        metadata['author'] = data['author'].get('name', metadata['author'])
-                    if 'datePublished' in data:
-                        metadata['publication_date'] = data['datePublished']
-            except (json.JSONDecodeError, AttributeError):
+                    rows = [
+                        dict(value, domain=domain) if isinstance(value, dict) else {'domain': domain, 'score': value}
+                        for domain, value in data.items()
+                    ]
+                elif isinstance(data, list):
+                    rows = [row for row in data if isinstance(row, dict)]
+                else:
+                    raise ValueError('JSON muss ein Objekt oder eine Liste sein')
+            else:
+                reader = csv.DictReader(f)
+                if not {'domain', 'score'} <= set(reader.fieldnames or ()):
+                    raise ValueError('CSV benötigt die Spalten domain und score')
+                rows = list(reader)
+        
+        entries = {}
+        skipped = 0
+        for row in rows:
+            category = row.get('category') or ''
+            if not isinstance(row.get('domain'), str) or not isinstance(category, str):
+                skipped += 1
+                continue
+            domain = self.normalize(row['domain'])
+            try:
+                score = float(row.get('score'))
+            except (TypeError, ValueError):
+                score = None
+            if not self.DOMAIN_PATTERN.match(domain) or score is None or not -1.0 <= score <= 1.0:
+                skipped += 1
                 continue
+            entries[domain] = {'score': score, 'category': category, 'source': source}
+        return entries, skipped
+    
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats['version'] = self._index[1]
+        stats['path'] = self.path or None
+        stats['loaded_at'] = datetime.fromtimestamp(self.loaded_at).isoformat() if self.loaded_at else None
+        return stats
+
+class PatternEngine:
+    """Kompiliert alle Heuristik-Muster einmalig und liefert eine gemeinsame Zähltabelle.
+    
+    Identische Muster aus verschiedenen Indikator-Gruppen werden nur einmal
+    kompiliert und pro Dokument nur einmal gescannt.
+    """
+    
+    URL_PATTERN = r'http[s]?://[^\s]+'
+    
+    # Indikator-Gruppen: Name -> Liste von (Muster, Flags)
+    INDICATORS = {
+        # Quellenangaben (Text-Features)
+        'sources': [
+            (URL_PATTERN, re.IGNORECASE),
+            (r'www\.[^\s]+', re.IGNORECASE),
+            (r'according to', re.IGNORECASE),
+            (r'study shows', re.IGNORECASE),
+            (r'research indicates', re.IGNORECASE)
+        ],
+        # Überprüfbare Behauptungen (Text-Features)
+        'claims': [
+            (r'\b\d+%', re.IGNORECASE),
+            (r'\b\d+\s+(percent|percentage)', re.IGNORECASE),
+            (r'study|research|survey|report', re.IGNORECASE),
+            (r'according to|based on|shows that', re.IGNORECASE)
+        ],
+        # Quellenangaben (Faktische Genauigkeit)
+        'factual_sources': [
+            (r'according to', re.IGNORECASE),
+            (r'study shows', re.IGNORECASE),
+            (r'research indicates', re.IGNORECASE),
+            (r'data from', re.IGNORECASE),
+            (r'source:', re.IGNORECASE),
+            (URL_PATTERN, re.IGNORECASE),
+            (r'\([^()]*\d{4}[^()]*\)', re.IGNORECASE)  # Jahr in Klammern (ohne '(' im Inneren: linear)
+        ],
+        # Präzise Aussagen
+        'precise': [
+            (r'\b\d+(\.\d+)?%', re.IGNORECASE),
+            (r'\b\d+(\,\d{3})*(\.\d+)?\s+(people|users|participants)', re.IGNORECASE),
+            (r'exactly|precisely|specifically', re.IGNORECASE),
+            (r'\b\d{4}\b', re.IGNORECASE)  # Jahreszahlen
+        ],
+        # Vage Aussagen
+        'vague': [
+            (r'many|some|several|few', re.IGNORECASE),
+            (r'might|could|possibly|maybe', re.IGNORECASE),
+            (r'seems|appears|likely', re.IGNORECASE)
+        ],
+        # Detail-Auswertungen
+        'numbers': [(r'\b\d+(?:\.\d+)?%?\b', 0)],
+        'dates': [(r'\b\d{4}\b', re.IGNORECASE)],  # Ziffernmuster: Flag ohne Wirkung, teilt Scan mit 'precise'
+        'urls': [(URL_PATTERN, 0)],
+        'claim_indicators': [(r'study|research|according to', re.IGNORECASE)]
+    }
+    
+    def __init__(self, indicators=None):
+        self.indicators = indicators or self.INDICATORS
+        self.compiled = []
+        self.groups = {}
         
-        return metadata
+        index_by_key = {}
+        for group, patterns in self.indicators.items():
+            indices = []
+            for pattern, flags in patterns:
+                key = (pattern, flags)
+                if key not in index_by_key:
+                    index_by_key[key] = len(self.compiled)
+                    self.compiled.append(re.compile(pattern, flags))
+                indices.append(index_by_key[key])
+            self.groups[group] = indices
+    
+    def scan(self, content):
+        """Zählt alle Muster einmal und liefert die Treffer je Indikator-Gruppe"""
+        pattern_counts = [sum(1 for _ in regex.finditer(content)) for regex in self.compiled]
+        return {
+            group: sum(pattern_counts[index] for index in indices)
+            for group, indices in self.groups.items()
+        }
+
+class ParsedDocument:
+    """Einmal pro Analyse erzeugte Text-Repräsentation (Tokens, Sätze, Muster-Treffer).
+    
+    Lesbarkeit und Sentiment werden beim ersten Zugriff berechnet und danach
+    wiederverwendet.
+    """
+    
+    __slots__ = ('content', 'lower', 'tokens', 'lower_tokens', 'sentence_offsets',
+                 'sentence_word_counts', 'counts', 'model_score', '_readability', '_polarity')
+    
+    _UNSET = object()
+    
+    # Vollständig analysiert (siehe StreamingDocument)
+    coverage = None
+    
+    def __init__(self, content, pattern_engine):
+        self.content = content
+        self.lower = content.lower()
+        self.tokens = content.split()
+        self.lower_tokens = self.lower.split()
+        
+        # Satzgrenzen (vereinfacht: Punkt als Trenner, leere Segmente ignoriert)
+        self.sentence_offsets = []
+        self.sentence_word_counts = []
+        start = 0
+        for segment in content.split('.'):
+            end = start + len(segment)
+            if segment.strip():
+                self.sentence_offsets.append((start, end))
+                self.sentence_word_counts.append(len(segment.split()))
+            start = end + 1
+        
+        self.counts = pattern_engine.scan(content)
+        self.model_score = None
+        self._readability = self._UNSET
+        self._polarity = self._UNSET
+    
+    @property
+    def word_count(self):
+        return len(self.tokens)
+    
+    @property
+    def vocabulary_size(self):
+        return len(set(self.lower_tokens))
+    
+    @property
+    def analyzed_chars(self):
+        return len(self.content)
+    
+    @property
+    def upper_count(self):
+        return sum(map(str.isupper, self.content))
+    
+    @property
+    def sentence_count(self):
+        return len(self.sentence_word_counts)
+    
+    @property
+    def avg_sentence_length(self):
+        return np.mean(self.sentence_word_counts) if self.sentence_word_counts else 0
+    
+    @property
+    def readability(self):
+        """Flesch Reading Ease (None, falls nicht berechenbar)"""
+        if self._readability is self._UNSET:
+            try:
+                self._readability = lazy_import('textstat').flesch_reading_ease(self.content)
+            except Exception:
+                self._readability = None
+        return self._readability
+    
+    @property
+    def polarity(self):
+        """Sentiment-Polarität nach TextBlob"""
+        if self._polarity is self._UNSET:
+            self._polarity = lazy_import('textblob').TextBlob(self.content).sentiment.polarity
+        return self._polarity
+    
+    def sentences(self):
+        """Liefert die Sätze anhand der gespeicherten Offsets"""
+        return [self.content[start:end] for start, end in self.sentence_offsets]
+    
+    def count_terms(self, terms):
+        """Vorkommen der Begriffe im kleingeschriebenen Text"""
+        return sum(self.lower.count(term) for term in terms)
+
+class StreamingDocument:
+    """Chunk-weise Variante von ParsedDocument für sehr lange Texte.
+    
+    Der Text wird in satzbündigen Chunks verarbeitet; Muster-Treffer, Wort- und
+    Satzzahlen, Vokabular sowie die Bestandteile von Lesbarkeit und Sentiment
+    werden über die Chunks zusammengeführt. Tokens und Kopien liegen nur für den
+    aktuellen Chunk im Speicher, und Regex-Backtracking bleibt auf einen Chunk
+    begrenzt. Nach ``max_chars`` Zeichen oder ``time_budget`` Sekunden wird der
+    Rest nicht mehr analysiert (``coverage['truncated']``).
+    """
+    
+    __slots__ = ('content', 'counts', 'model_score', 'word_count', 'vocabulary_size', 'sentence_count',
+                 'avg_sentence_length', 'analyzed_chars', 'upper_count', 'readability', 'polarity',
+                 'coverage', '_term_counts')
+    
+    # Flesch-Reading-Ease-Konstanten von textstat (en_US)
+    FLESCH = (206.835, 1.015, 84.6)
+    
+    # Letztes Satzende (Punkt vor Leerraum) bzw. letzter Leerraum im Fenster
+    SENTENCE_CUT = re.compile(r'.*\.(?=\s)', re.DOTALL)
+    SPACE_CUT = re.compile(r'.*\s', re.DOTALL)
+    
+    def __init__(self, content, pattern_engine, terms=(), chunk_chars=ANALYSIS_STREAM_CHUNK_CHARS,
+                 max_chars=ANALYSIS_MAX_CHARS, time_budget=ANALYSIS_TIME_BUDGET, sentiment=True):
+        self.content = content
+        self.model_score = None
+        
+        textstat = lazy_import('textstat')
+        textblob = lazy_import('textblob') if sentiment else None
+        deadline = time.perf_counter() + time_budget
+        limit = min(len(content), max_chars)
+        truncated = 'size' if limit < len(content) else None
+        
+        counts = collections.Counter()
+        term_counts = dict.fromkeys(terms, 0)
+        vocabulary = set()
+        words = sentences = sentence_words = uppers = chunks = 0
+        lexicon = text_sentences = syllables = 0
+        readable = True
+        polarity_sum = 0.0
+        
+        start = 0
+        while start < limit:
+            end = self._chunk_end(content, start, limit, chunk_chars)
+            chunk = content[start:end]
+            lower = chunk.lower()
+            tokens = lower.split()
+            
+            words += len(tokens)
+            vocabulary.update(tokens)
+            
+            # Satzgrenzen wie in ParsedDocument (Punkt als Trenner)
+            for segment in chunk.split('.'):
+                if segment.strip():
+                    sentences += 1
+                    sentence_words += len(segment.split())
+            
+            counts.update(pattern_engine.scan(chunk))
+            for term in term_counts:
+                term_counts[term] += lower.count(term)
+            uppers += sum(map(str.isupper, chunk))
+            
+            if readable:
+                try:
+                    lexicon += textstat.lexicon_count(chunk)
+                    text_sentences += textstat.sentence_count(chunk)
+                    syllables += textstat.syllable_count(chunk)
+                except Exception:
+                    readable = False
+            
+            # Sentiment je Chunk, nach Wortzahl gewichtet (nur für detailed_analysis)
+            if sentiment:
+                polarity_sum += textblob.TextBlob(chunk).sentiment.polarity * len(tokens)
+            
+            chunks += 1
+            start = end
+            if start < len(content) and time.perf_counter() > deadline:
+                truncated = 'time'
+                break
+        
+        self.counts = {group: counts[group] for group in pattern_engine.groups}
+        self._term_counts = term_counts
+        self.word_count = words
+        self.vocabulary_size = len(vocabulary)
+        self.sentence_count = sentences
+        self.avg_sentence_length = sentence_words / sentences if sentences else 0
+        self.analyzed_chars = start
+        self.upper_count = uppers
+        self.readability = self._flesch(lexicon, text_sentences, syllables) if readable else None
+        self.polarity = (polarity_sum / words if words else 0.0) if sentiment else None
+        self.coverage = {
+            'mode': 'streaming',
+            'chunks': chunks,
+            'analyzed_chars': start,
+            'total_chars': len(content),
+            'truncated': truncated
+        }
+    
+    @classmethod
+    def _chunk_end(cls, content, start, limit, chunk_chars):
+        """Chunk-Ende am letzten Satzende im Fenster, sonst am letzten Leerraum"""
+        end = start + chunk_chars
+        if end >= limit:
+            return limit
+        match = cls.SENTENCE_CUT.match(content, start, end) or cls.SPACE_CUT.match(content, start, end)
+        return match.end() if match else end
+    
+    @classmethod
+    def _flesch(cls, words, sentences, syllables):
+        """Flesch Reading Ease aus zusammengeführten Zählern (Rundung wie textstat)"""
+        base, sentence_weight, syllable_weight = cls.FLESCH
+        sentence_length = round(words / max(sentences, 1), 1)
+        syllables_per_word = round(syllables / words, 1) if words else 0.0
+        return round(base - sentence_weight * sentence_length - syllable_weight * syllables_per_word, 2)
+    
+    def count_terms(self, terms):
+        """Vorkommen der Begriffe (beim Einlesen gezählt)"""
+        return sum(self._term_counts[term] for term in terms)
+
+class InferenceServer:
+    """In-Process-Inferenz mit dynamischem Micro-Batching.
+    
+    Gleichzeitige Anfragen landen in einer Queue; ein Worker-Thread sammelt sie
+    bis zur maximalen Batchgröße oder Wartezeit und schickt sie gemeinsam durch
+    die Pipeline. Jede Anfrage erhält ein Future mit ihrem Einzelergebnis.
+    """
+    
+    def __init__(self, pipeline_provider, max_batch_size=INFERENCE_MAX_BATCH_SIZE,
+                 max_wait_ms=INFERENCE_MAX_WAIT_MS, max_chars=INFERENCE_MAX_CHARS):
+        self.pipeline_provider = pipeline_provider
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_chars = max_chars
+        self.stats = {'requests': 0, 'batches': 0, 'largest_batch': 0, 'errors': 0}
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+    
+    def submit(self, text):
+        """Reiht einen Text zur Inferenz ein und liefert ein Future"""
+        future = Future()
+        self._ensure_worker()
+        # Eingaben kürzen; die Pipeline schneidet zusätzlich auf 512 Tokens ab
+        self._queue.put((text[:self.max_chars], future))
+        return future
+    
+    def _ensure_worker(self):
+        """Startet den Worker-Thread (auch neu nach einem Fork)"""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(target=self._run, name='inference-server', daemon=True)
+                self._thread.start()
+    
+    def _run(self):
+        """Sammelt Anfragen zu Micro-Batches und verarbeitet sie"""
+        work_queue = self._queue
+        while True:
+            batch = [work_queue.get()]
+            deadline = time.perf_counter() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(work_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._process(batch)
+    
+    def _process(self, batch):
+        texts = [text for text, _ in batch]
+        futures = [future for _, future in batch]
+        
+        self.stats['requests'] += len(batch)
+        self.stats['batches'] += 1
+        self.stats['largest_batch'] = max(self.stats['largest_batch'], len(batch))
+        
+        try:
+            pipe = self.pipeline_provider()
+            with self._inference_mode():
+                outputs = pipe(texts, batch_size=len(texts), truncation=True, max_length=512)
+            for future, output in zip(futures, outputs):
+                future.set_result(output)
+        except Exception as e:
+            self.stats['errors'] += 1
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+    
+    def _inference_mode(self):
+        """torch.inference_mode(), falls torch verfügbar ist"""
+        try:
+            return lazy_import('torch').inference_mode()
+        except ImportError:
+            return contextlib.nullcontext()
+
+# Analyzer des Scoring-Prozesses (nur in Worker-Prozessen gesetzt)
+_worker_analyzer = None
+
+def _init_scoring_worker():
+    """Initializer der Scoring-Prozesse: Muster, NLTK, textstat und TextBlob einmalig laden"""
+    global _worker_analyzer
+    _worker_analyzer = CredibilityAnalyzer(mode='lite', backend='inline')
+    # NLTK-Daten liegen bereits auf der Platte (Download im Elternprozess bzw. Build),
+    # hier nur importieren und einmal komplett analysieren
+    lazy_import('nltk')
+    _worker_analyzer.analyze_content(
+        "According to a 2024 study, 87% of participants improved. "
+        "The results were published in a peer-reviewed journal."
+    )
+
+def _score_chunk(items, source_version=None):
+    """Analysiert einen Chunk (content, url, metadata, model_score, detail) im Worker-Prozess.
+    
+    ``source_version`` ist die Version der Domain-Bewertung im Elternprozess
+    (Teil der Cache-Schlüssel); weicht der eigene Index ab, wird er neu geladen.
+    Liefert je Dokument (Ergebnis, Stage-Zeiten in ns) für die Metriken des Elternprozesses.
+    """
+    reputation = _worker_analyzer.domain_reputation
+    if source_version is not None and reputation.version != source_version:
+        reputation.reload(force=True)
+    
+    results = []
+    for content, url, metadata, model_score, detail in items:
+        with metrics.collect() as stages:
+            result = _worker_analyzer.analyze_content(content, url, metadata, model_score=model_score, detail=detail)
+        results.append((result, stages))
+    return results
+
+class ScoringPool:
+    """Prozess-Pool für die CPU-gebundenen Heuristiken (Regex, textstat, TextBlob, NumPy).
+    
+    Jeder Worker-Prozess lädt seine Ressourcen einmalig im Initializer. Die
+    Dokumente werden in Chunks verschickt, damit sich das Pickling über
+    mehrere Analysen verteilt. Das Modell bleibt im Elternprozess; dessen
+    Score wird jedem Dokument mitgegeben.
+    """
+    
+    def __init__(self, max_workers=ANALYSIS_PROCESSES, chunk_size=ANALYSIS_CHUNK_SIZE,
+                 start_method=ANALYSIS_START_METHOD):
+        self.max_workers = max(1, max_workers)
+        self.chunk_size = max(1, chunk_size)
+        self.start_method = start_method
+        self.stats = {'documents': 0, 'chunks': 0, 'errors': 0}
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+    
+    def _get_executor(self):
+        """Startet den Pool (auch neu nach einem Fork)"""
+        if self._executor is not None and self._pid == os.getpid():
+            return self._executor
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                method = self.start_method if self.start_method in multiprocessing.get_all_start_methods() else None
+                self._pid = os.getpid()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(method),
+                    initializer=_init_scoring_worker
+                )
+                logger.info(f"⚙️ Scoring-Pool mit {self.max_workers} Prozessen gestartet")
+            return self._executor
+    
+    def analyze(self, items, source_version=None):
+        """Analysiert (content, url, metadata, model_score, detail)-Tupel; Ergebnisse in Eingabe-Reihenfolge.
+        
+        ``source_version`` (Version der Domain-Bewertung) bringt die Worker auf
+        denselben Stand wie den Elternprozess.
+        """
+        executor = self._get_executor()
+        
+        # Kleine Batches trotzdem auf alle Prozesse verteilen
+        size = min(self.chunk_size, -(-len(items) // self.max_workers)) or 1
+        chunks = [items[start:start + size] for start in range(0, len(items), size)]
+        
+        results = []
+        try:
+            for chunk_results in executor.map(_score_chunk, chunks, [source_version] * len(chunks)):
+                for result, stages in chunk_results:
+                    metrics.record(stages)
+                    results.append(result)
+        except BrokenProcessPool:
+            # Abgestürzten Pool verwerfen, der nächste Aufruf startet ihn neu
+            self.stats['errors'] += 1
+            with self._lock:
+                self._executor = None
+            raise
+        
+        self.stats['documents'] += len(items)
+        self.stats['chunks'] += len(chunks)
+        return results
+    
+    def shutdown(self):
+        if self._executor is not None and self._pid == os.getpid():
+            self._executor.shutdown(wait=False, cancel_futures=True)
 
 class CredibilityAnalyzer:
     """Erweiterte Credibility-Analyse mit mehreren Methoden"""
     
-    def __init__(self):
-        self.quality_analyzer = None
+    # Gewichtung: 40% Content Quality, 35% Factual Accuracy, 25% Source Reliability
+    SCORE_WEIGHTS = (0.4, 0.35, 0.25)
+    
+    # Emotionale Wörter für die Bias-Heuristik
+    EMOTIONAL_WORDS = (
+        'amazing', 'terrible', 'incredible', 'shocking', 'unbelievable',
+        'awesome', 'horrible', 'fantastic', 'disgusting', 'perfect',
+        'brilliant', 'stupid', 'genius', 'idiotic', 'wonderful'
+    )
+    
+    # Detailstufen, jede umfasst die vorherige: nur Scores; plus Kennzahlen,
+    # Empfehlungen und Issues; plus detailed_analysis (u.a. Sentiment)
+    DETAIL_LEVELS = ('score', 'summary', 'full')
+    
+    def __init__(self, mode=ANALYZER_MODE, backend=ANALYSIS_BACKEND, domain_reputation=None):
+        self.mode = mode
+        self.domain_reputation = domain_reputation if domain_reputation is not None else DomainReputationIndex()
         self.fact_checker = None
         self.bias_detector = None
-        self.setup_analyzers()
+        self.pattern_engine = PatternEngine()
+        
+        # Modell und NLTK-Ressourcen werden erst bei Bedarf geladen
+        self._quality_analyzer = None
+        self._analyzers_ready = False
+        self._setup_lock = threading.Lock()
+        self.inference_server = InferenceServer(lambda: self.quality_analyzer)
+        self.scoring_pool = ScoringPool() if backend == 'process' else None
+        
+        # Versionsschlüssel für gecachte Ergebnisse
+        fingerprint = json.dumps([ANALYSIS_VERSION, self.SCORE_WEIGHTS, self.mode,
+                                  repr(self.pattern_engine.indicators)])
+        self.scoring_version = hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()[:16]
+    
+    @property
+    def quality_analyzer(self):
+        """Transformer-Pipeline; wird beim ersten Zugriff geladen"""
+        if not self._analyzers_ready:
+            self.setup_analyzers()
+        return self._quality_analyzer
+    
+    @property
+    def model_loaded(self):
+        """Prüft, ob das Modell geladen ist, ohne es zu laden"""
+        return self._quality_analyzer is not None
     
     def setup_analyzers(self):
-        """Initialisiert alle verfügbaren Analyzer"""
-        # Content Quality Analyzer Setup
-        try:
-            # Verwende ein multilinguals BERT-Modell für Content Quality
-            self.quality_analyzer = pipeline(
-                "text-classification",
-                model="unitary/toxic-bert",  # Fallback für Content Quality
-                top_k=None
-            )
-            logger.info("✅ Content Quality Analyzer geladen")
-        except Exception as e:
-            logger.warning(f"⚠️ Content Quality Setup fehlgeschlagen: {e}")
+        """Initialisiert alle verfügbaren Analyzer (einmalig, thread-sicher)"""
+        with self._setup_lock:
+            if self._analyzers_ready:
+                return
+            
+            # Content Quality Analyzer Setup
+            if self.mode == 'lite':
+                logger.info("ℹ️ Lite-Modus: Content Quality Model wird nicht geladen")
+            else:
+                try:
+                    start = time.perf_counter()
+                    transformers = lazy_import('transformers')
+                    # Verwende ein multilinguals BERT-Modell für Content Quality
+                    self._quality_analyzer = transformers.pipeline(
+                        "text-classification",
+                        model="unitary/toxic-bert",  # Fallback für Content Quality
+                        top_k=None
+                    )
+                    STARTUP_REPORT['lazy_loads']['quality_analyzer'] = round(time.perf_counter() - start, 3)
+                    logger.info("✅ Content Quality Analyzer geladen")
+                except Exception as e:
+                    logger.warning(f"⚠️ Content Quality Setup fehlgeschlagen: {e}")
+            
+            # NLTK für grundlegende Sprachanalyse
+            try:
+                nltk = lazy_import('nltk')
+                nltk.download('vader_lexicon', quiet=True)
+                nltk.download('punkt', quiet=True)
+                nltk.download('stopwords', quiet=True)
+                logger.info("✅ NLTK Resources geladen")
+            except Exception as e:
+                logger.warning(f"⚠️ NLTK Setup fehlgeschlagen: {e}")
+            
+            self._analyzers_ready = True
+    
+    def warm_up(self):
+        """Lädt Modell, Sprachressourcen und Textbibliotheken vorab"""
+        start = time.perf_counter()
+        self.setup_analyzers()
         
-        # NLTK für grundlegende Sprachanalyse
-        try:
-            nltk.download('vader_lexicon', quiet=True)
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-            logger.info("✅ NLTK Resources geladen")
-        except Exception as e:
-            logger.warning(f"⚠️ NLTK Setup fehlgeschlagen: {e}")
+        # Einmal komplett analysieren, damit textstat/TextBlob initialisiert sind
+        self.analyze_content(
+            "According to a 2024 study, 87% of participants improved. "
+            "The results were published in a peer-reviewed journal."
+        )
+        
+        STARTUP_REPORT['warmup_seconds'] = round(time.perf_counter() - start, 3)
+        logger.info(f"🔥 Warm-up abgeschlossen in {STARTUP_REPORT['warmup_seconds']:.2f}s")
     
-    def analyze_content(self, content, url=None, metadata=None):
-        """Führt umfassende Credibility-Analyse durch"""
+    def analyze_content(self, content, url=None, metadata=None, model_score=None, detail='full'):
+        """Führt umfassende Credibility-Analyse durch
+        
+        ``model_score`` ist ein bereits berechneter Modell-Score (z.B. aus dem
+        Elternprozess des Scoring-Pools). ``detail`` (siehe DETAIL_LEVELS)
+        bestimmt, welche Schritte über die Scores hinaus laufen.
+        """
         if not content or len(content.strip()) < 10:
             return self._empty_result()
         
-        start_time = datetime.now()
+        if self.scoring_pool is not None:
+            return self.analyze_batch([content], [url], [metadata], detail=detail)[0]
+        
+        start_ns = time.perf_counter_ns()
+        
+        # Modell-Inferenz anstoßen, läuft parallel zu den Heuristiken
+        model_future = self._submit_model(content) if model_score is None else None
         
-        # Basis-Features extrahieren
-        features = self._extract_text_features(content)
+        # Tokens, Sätze und Muster-Treffer einmalig erzeugen
+        with metrics.span('text_parse'):
+            doc = self.parse(content, detail)
         
-        # Content Quality Analysis
-        quality_score = self._analyze_content_quality(content)
+        # Basis-Features extrahieren (nur für Kennzahlen, Empfehlungen und Issues)
+        features = None
+        if detail != 'score':
+            with metrics.span('features'):
+                features = self._extract_text_features(doc)
         
         # Factual Accuracy Analysis
-        factual_score = self._analyze_factual_accuracy(content)
+        with metrics.span('factual'):
+            factual_score = self._analyze_factual_accuracy(doc)
         
         # Source Reliability Analysis
-        source_score = self._analyze_source_reliability(content, url, metadata)
+        with metrics.span('source'):
+            source_score = self._analyze_source_reliability(doc, url, metadata)
+        
+        # Content Quality Analysis (inkl. Modell-Score, falls verfügbar)
+        doc.model_score = model_score if model_score is not None else self._await_model(model_future)
+        with metrics.span('quality'):
+            quality_score = self._analyze_content_quality(doc)
         
         # Kombiniere Ergebnisse
         final_score, confidence = self._combine_scores(quality_score, factual_score, source_score)
@@ -668,11 +3810,126 @@ class CredibilityAnalyzer:
         # Klassifikation
         classification = self._classify_credibility(final_score, confidence)
         
-        # Recommendations & Issues
-        recommendations = self._generate_recommendations(quality_score, factual_score, source_score, features)
-        issues = self._detect_issues(content, features)
+        return self._build_result(doc, url, metadata, features,
+                                  quality_score, factual_score, source_score,
+                                  final_score, confidence, classification, start_ns, detail)
+    
+    def analyze_batch(self, contents, urls=None, metadata_list=None, detail='full'):
+        """Analysiert mehrere Inhalte in einem Durchlauf.
         
-        processing_time = (datetime.now() - start_time).total_seconds()
+        Die textbasierten Scores werden pro Dokument berechnet, die Kombination
+        und Klassifikation erfolgt vektorisiert über die gesamte Score-Matrix.
+        """
+        urls = urls or [None] * len(contents)
+        metadata_list = metadata_list or [None] * len(contents)
+        results = [None] * len(contents)
+        
+        valid_indices = []
+        for index, content in enumerate(contents):
+            if isinstance(content, str) and len(content.strip()) >= 10:
+                valid_indices.append(index)
+            else:
+                results[index] = self._empty_result()
+        
+        if not valid_indices:
+            return results
+        
+        # Alle Texte vorab einreihen, damit der Inference-Server volle Batches bildet
+        model_futures = [self._submit_model(contents[index]) for index in valid_indices]
+        
+        if self.scoring_pool is not None:
+            # Modell im Elternprozess, Heuristiken im Prozess-Pool
+            items = [(contents[index], urls[index], metadata_list[index], self._await_model(model_future), detail)
+                     for index, model_future in zip(valid_indices, model_futures)]
+            for index, result in zip(valid_indices, self.scoring_pool.analyze(items, self.domain_reputation.version)):
+                results[index] = result
+            return results
+        
+        partials = []
+        for index, model_future in zip(valid_indices, model_futures):
+            start_ns = time.perf_counter_ns()
+            url, metadata = urls[index], metadata_list[index]
+            with metrics.span('text_parse'):
+                doc = self.parse(contents[index], detail)
+            features = None
+            if detail != 'score':
+                with metrics.span('features'):
+                    features = self._extract_text_features(doc)
+            with metrics.span('factual'):
+                factual_score = self._analyze_factual_accuracy(doc)
+            with metrics.span('source'):
+                source_score = self._analyze_source_reliability(doc, url, metadata)
+            doc.model_score = self._await_model(model_future)
+            with metrics.span('quality'):
+                quality_score = self._analyze_content_quality(doc)
+            partials.append((start_ns, doc, features, quality_score, factual_score, source_score))
+        
+        # Score-Matrix (n x 3): Quality, Factual, Source
+        score_matrix = np.array([partial[3:] for partial in partials], dtype=float)
+        final_scores, confidences = self._combine_scores_batch(score_matrix)
+        classifications = self._classify_credibility_batch(final_scores, confidences)
+        
+        for row, index in enumerate(valid_indices):
+            start_ns, doc, features, quality_score, factual_score, source_score = partials[row]
+            results[index] = self._build_result(
+                doc, urls[index], metadata_list[index], features,
+                quality_score, factual_score, source_score,
+                float(final_scores[row]), float(confidences[row]), str(classifications[row]),
+                start_ns, detail
+            )
+        
+        return results
+    
+    def parse(self, content, detail='full'):
+        """Erzeugt die gemeinsame Text-Repräsentation für alle Analyse-Schritte"""
+        if len(content) > ANALYSIS_STREAM_THRESHOLD:
+            # Sentiment wird nur für detailed_analysis gebraucht
+            return StreamingDocument(content, self.pattern_engine, terms=self.EMOTIONAL_WORDS,
+                                     sentiment=detail == 'full')
+        return ParsedDocument(content, self.pattern_engine)
+    
+    def _submit_model(self, content):
+        """Reiht den Text beim Inference-Server ein (None ohne Modell)"""
+        if self.mode == 'lite' or self.quality_analyzer is None:
+            return None
+        return self.inference_server.submit(content)
+    
+    def _await_model(self, model_future):
+        """Wartet auf die Modell-Ausgabe (als Schritt 'model' gemessen)"""
+        if model_future is None:
+            return None
+        with metrics.span('model'):
+            return self._model_score(model_future)
+    
+    def _model_score(self, model_future):
+        """Wandelt die Modell-Ausgabe in einen Qualitäts-Faktor um (1 - max. Toxizität)"""
+        if model_future is None:
+            return None
+        try:
+            output = model_future.result(timeout=INFERENCE_TIMEOUT)
+            return 1.0 - max(label['score'] for label in output)
+        except Exception as e:
+            logger.warning(f"⚠️ Modell-Inferenz fehlgeschlagen: {e}")
+            return None
+    
+    def _build_result(self, doc, url, metadata, features, quality_score, factual_score,
+                      source_score, final_score, confidence, classification, start_ns, detail='full'):
+        """Baut das Ergebnis-Dictionary einer Analyse zusammen (Umfang je nach Detailstufe)"""
+        if detail != 'score':
+            with metrics.span('details'):
+                # Recommendations & Issues
+                recommendations = self._generate_recommendations(quality_score, factual_score, source_score, features)
+                issues = self._detect_issues(doc, features)
+                if detail == 'full':
+                    detailed_analysis = {
+                        'quality': self._get_quality_details(doc),
+                        'factual': self._get_factual_details(doc),
+                        'sources': self._get_source_details(doc, url)
+                    }
+                    if doc.coverage:
+                        detailed_analysis['coverage'] = doc.coverage
+        
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         result = {
             'credibility_score': final_score,
@@ -681,6 +3938,14 @@ class CredibilityAnalyzer:
             'source_reliability_score': source_score,
             'classification': classification,
             'confidence': confidence,
+            'processing_time': processing_time,
+            'content': doc.content,
+            'url': url or ''
+        }
+        if detail == 'score':
+            return result
+        
+        result.update({
             'word_count': features['word_count'],
             'sentence_count': features['sentence_count'],
             'char_count': features['char_count'],
@@ -688,145 +3953,81 @@ class CredibilityAnalyzer:
             'claims_verified': features['claims_verified'],
             'readability_score': features['readability_score'],
             'bias_level': features['bias_level'],
-            'processing_time': processing_time,
-            'content': content,
-            'url': url or '',
             'title': metadata.get('title', '') if metadata else '',
             'author': metadata.get('author', '') if metadata else '',
             'domain': metadata.get('domain', '') if metadata else '',
             'publication_date': metadata.get('publication_date', '') if metadata else '',
             'recommendations': recommendations,
-            'issues_detected': issues,
-            'detailed_analysis': {
-                'quality': self._get_quality_details(content),
-                'factual': self._get_factual_details(content),
-                'sources': self._get_source_details(content, url)
-            }
-        }
+            'issues_detected': issues
+        })
+        if detail == 'full':
+            result['detailed_analysis'] = detailed_analysis
         
         return result
     
-    def _extract_text_features(self, content):
+    def _extract_text_features(self, doc):
         """Extrahiert grundlegende Text-Features"""
-        words = content.split()
-        sentences = [s.strip() for s in content.split('.') if s.strip()]
-        
-        # Source counting (einfache Heuristik)
-        source_patterns = [
-            r'http[s]?://[^\s]+',
-            r'www\.[^\s]+',
-            r'according to',
-            r'study shows',
-            r'research indicates'
-        ]
-        sources_found = sum(len(re.findall(pattern, content, re.IGNORECASE)) for pattern in source_patterns)
-        
-        # Claims verification (einfache Heuristik)
-        claim_patterns = [
-            r'\b\d+%',
-            r'\b\d+\s+(percent|percentage)',
-            r'study|research|survey|report',
-            r'according to|based on|shows that'
-        ]
-        claims_verified = sum(len(re.findall(pattern, content, re.IGNORECASE)) for pattern in claim_patterns)
+        # Source counting und Claims verification (einfache Heuristiken)
+        sources_found = doc.counts['sources']
+        claims_verified = doc.counts['claims']
         
         # Readability Score
-        try:
-            readability_score = textstat.flesch_reading_ease(content) / 100.0
-        except:
-            readability_score = 0.5
+        readability_score = doc.readability / 100.0 if doc.readability is not None else 0.5
         
         # Bias Level (einfache Heuristik basierend auf emotionalen Wörtern)
-        emotional_words = [
-            'amazing', 'terrible', 'incredible', 'shocking', 'unbelievable',
-            'awesome', 'horrible', 'fantastic', 'disgusting', 'perfect',
-            'brilliant', 'stupid', 'genius', 'idiotic', 'wonderful'
-        ]
-        emotional_count = sum(content.lower().count(word) for word in emotional_words)
-        bias_level = min(emotional_count / max(len(words), 1), 1.0)
+        emotional_count = doc.count_terms(self.EMOTIONAL_WORDS)
+        bias_level = min(emotional_count / max(doc.word_count, 1), 1.0)
         
         return {
-            'word_count': len(words),
-            'sentence_count': len(sentences),
-            'char_count': len(content),
-            'avg_sentence_length': np.mean([len(s.split()) for s in sentences]) if sentences else 0,
+            'word_count': doc.word_count,
+            'sentence_count': doc.sentence_count,
+            'char_count': len(doc.content),
+            'avg_sentence_length': doc.avg_sentence_length,
             'sources_found': sources_found,
             'claims_verified': claims_verified,
             'readability_score': readability_score,
             'bias_level': bias_level
         }
     
-    def _analyze_content_quality(self, content):
+    def _analyze_content_quality(self, doc):
         """Analysiert die Qualität des Inhalts"""
-        # Grammatik und Rechtschreibung (vereinfacht)
-        blob = TextBlob(content)
-        
         # Länge und Struktur
-        sentences = content.split('.')
-        avg_sentence_length = np.mean([len(s.split()) for s in sentences if s.strip()])
+        avg_sentence_length = doc.avg_sentence_length
         
         # Wortschatz-Vielfalt
-        words = content.lower().split()
-        unique_words = len(set(words))
-        vocabulary_diversity = unique_words / len(words) if words else 0
+        word_count = doc.word_count
+        vocabulary_diversity = doc.vocabulary_size / word_count if word_count else 0
         
         # Lesbarkeit
-        try:
-            readability = textstat.flesch_reading_ease(content) / 100.0
-        except:
-            readability = 0.5
+        readability = doc.readability / 100.0 if doc.readability is not None else 0.5
         
         # Kombiniere Metriken
         quality_factors = [
             min(avg_sentence_length / 20, 1.0),  # Optimale Satzlänge um 20 Wörter
             vocabulary_diversity,
             readability,
-            min(len(words) / 500, 1.0)  # Längere Texte tendieren zu höherer Qualität
+            min(word_count / 500, 1.0)  # Längere Texte tendieren zu höherer Qualität
         ]
         
+        # Modell-Score (1 - Toxizität) als zusätzlicher Faktor
+        if doc.model_score is not None:
+            quality_factors.append(doc.model_score)
+        
         return np.mean(quality_factors)
     
-    def _analyze_factual_accuracy(self, content):
+    def _analyze_factual_accuracy(self, doc):
         """Analysiert die faktische Genauigkeit"""
-        # Quellenangaben zählen
-        source_indicators = [
-            r'according to',
-            r'study shows',
-            r'research indicates',
-            r'data from',
-            r'source:',
-            r'http[s]?://[^\s]+',
-            r'\([^)]*\d{4}[^)]*\)'  # Jahr in Klammern
-        ]
-        
-        source_count = sum(len(re.findall(pattern, content, re.IGNORECASE)) 
-                          for pattern in source_indicators)
-        
-        # Präzise vs. vage Aussagen
-        precise_indicators = [
-            r'\b\d+(\.\d+)?%',
-            r'\b\d+(\,\d{3})*(\.\d+)?\s+(people|users|participants)',
-            r'exactly|precisely|specifically',
-            r'\b\d{4}\b'  # Jahreszahlen
-        ]
-        
-        vague_indicators = [
-            r'many|some|several|few',
-            r'might|could|possibly|maybe',
-            r'seems|appears|likely'
-        ]
-        
-        precise_count = sum(len(re.findall(pattern, content, re.IGNORECASE)) 
-                           for pattern in precise_indicators)
-        vague_count = sum(len(re.findall(pattern, content, re.IGNORECASE)) 
-                         for pattern in vague_indicators)
+        # Quellenangaben sowie präzise vs. vage Aussagen
+        source_count = doc.counts['factual_sources']
+        precise_count = doc.counts['precise']
+        vague_count = doc.counts['vague']
         
         # Faktische Dichte
-        words = content.split()
-        factual_density = (source_count + precise_count) / max(len(words), 1)
+        word_count = doc.word_count
+        factual_density = (source_count + precise_count) / max(word_count, 1)
         
         # Konsistenz (vereinfacht: weniger vage Aussagen = konsistenter)
-        consistency = 1.0 - min(vague_count / max(len(words), 1), 1.0)
+        consistency = 1.0 - min(vague_count / max(word_count, 1), 1.0)
         
         return np.mean([
             min(factual_density * 100, 1.0),  # Normalisiere faktische Dichte
@@ -834,27 +4035,15 @@ class CredibilityAnalyzer:
             min(source_count / 5, 1.0)  # Mindestens 5 Quellen für volle Punkte
         ])
     
-    def _analyze_source_reliability(self, content, url=None, metadata=None):
+    def _analyze_source_reliability(self, doc, url=None, metadata=None):
         """Analysiert die Quellenvertrauenswürdigkeit"""
         reliability_score = 0.5  # Basis-Score
         
-        # Domain-basierte Bewertung
+        # Domain-basierte Bewertung (längster passender Suffix im Reputations-Index)
         if url:
-            domain = urlparse(url).netloc.lower()
-            
-            # Hochvertrauenswürdige Domains
-            trusted_domains = [
-                'nature.com', 'science.org', 'cell.com', 'nejm.org',
-                'bbc.com', 'reuters.com', 'ap.org', 'npr.org',
-                'who.int', 'cdc.gov', 'nih.gov', 'edu'
-            ]
-            
-            if any(trusted in domain for trusted in trusted_domains):
-                reliability_score += 0.3
-            elif domain.endswith('.edu') or domain.endswith('.gov'):
-                reliability_score += 0.25
-            elif domain.endswith('.org'):
-                reliability_score += 0.1
+            reputation = self.domain_reputation.lookup(urlparse(url).netloc)
+            if reputation is not None:
+                reliability_score += reputation['score']
         
         # Autor-Information
         if metadata and metadata.get('author'):
@@ -872,19 +4061,18 @@ class CredibilityAnalyzer:
                 pass
         
         # Externe Links und Referenzen
-        external_links = len(re.findall(r'http[s]?://[^\s]+', content))
+        external_links = doc.counts['urls']
         if external_links > 3:
             reliability_score += 0.1
         
-        return min(reliability_score, 1.0)
+        # Negative Bewertungen aus Reputations-Feeds können unter 0 führen
+        return min(max(reliability_score, 0.0), 1.0)
     
     def _combine_scores(self, quality_score, factual_score, source_score):
         """Kombiniert die verschiedenen Scores zu einem Gesamt-Score"""
-        # Gewichtung: 40% Content Quality, 35% Factual Accuracy, 25% Source Reliability
-        weights = [0.4, 0.35, 0.25]
         scores = [quality_score, factual_score, source_score]
         
-        final_score = np.average(scores, weights=weights)
+        final_score = np.average(scores, weights=self.SCORE_WEIGHTS)
         
         # Konfidenz basierend auf der Varianz der Scores
         confidence = 1.0 - np.var(scores)
@@ -892,6 +4080,12 @@ class CredibilityAnalyzer:
         
         return final_score, confidence
     
+    def _combine_scores_batch(self, score_matrix):
+        """Vektorisierte Variante von _combine_scores für eine (n x 3) Score-Matrix"""
+        final_scores = np.average(score_matrix, axis=1, weights=self.SCORE_WEIGHTS)
+        confidences = np.clip(1.0 - np.var(score_matrix, axis=1), 0.1, 1.0)
+        return final_scores, confidences
+    
     def _classify_credibility(self, score, confidence):
         """Klassifiziert Credibility basierend auf Score und Confidence"""
         if confidence < 0.3:
@@ -905,6 +4099,14 @@ class CredibilityAnalyzer:
         else:
             return 'questionable'
     
+    def _classify_credibility_batch(self, scores, confidences):
+        """Vektorisierte Variante von _classify_credibility"""
+        return np.select(
+            [confidences < 0.3, scores > 0.75, scores > 0.55, scores > 0.35],
+            ['questionable', 'high', 'medium', 'low'],
+            default='questionable'
+        )
+    
     def _generate_recommendations(self, quality_score, factual_score, source_score, features):
         """Generiert Verbesserungsempfehlungen"""
         recommendations = []
@@ -929,7 +4131,7 @@ class CredibilityAnalyzer:
         
         return recommendations
     
-    def _detect_issues(self, content, features):
+    def _detect_issues(self, doc, features):
         """Erkennt potenzielle Probleme im Inhalt"""
         issues = []
         
@@ -946,42 +4148,42 @@ class CredibilityAnalyzer:
             issues.append("Schwer verständliche Sprache")
         
         # Caps Lock Detection
-        caps_ratio = sum(1 for c in content if c.isupper()) / max(len(content), 1)
+        caps_ratio = doc.upper_count / max(doc.analyzed_chars, 1)
         if caps_ratio > 0.1:
             issues.append("Übermäßige Verwendung von Großbuchstaben")
         
+        if doc.coverage and doc.coverage['truncated']:
+            issues.append("Dokument nur teilweise analysiert (Größen- oder Zeitlimit erreicht)")
+        
         return issues
     
-    def _get_quality_details(self, content):
+    def _get_quality_details(self, doc):
         """Detaillierte Qualitätsanalyse"""
-        blob = TextBlob(content)
         return {
-            'readability': textstat.flesch_reading_ease(content),
-            'word_count': len(content.split()),
-            'avg_sentence_length': np.mean([len(s.split()) for s in content.split('.') if s.strip()]),
-            'polarity': blob.sentiment.polarity
+            'readability': doc.readability,
+            'word_count': doc.word_count,
+            'avg_sentence_length': doc.avg_sentence_length,
+            'polarity': doc.polarity,
+            'model_score': doc.model_score
         }
     
-    def _get_factual_details(self, content):
+    def _get_factual_details(self, doc):
         """Detaillierte Faktenanalyse"""
-        numbers = re.findall(r'\b\d+(?:\.\d+)?%?\b', content)
-        dates = re.findall(r'\b\d{4}\b', content)
-        sources = re.findall(r'http[s]?://[^\s]+', content)
-        
         return {
-            'numbers_found': len(numbers),
-            'dates_found': len(dates), 
-            'urls_found': len(sources),
-            'claim_indicators': len(re.findall(r'study|research|according to', content, re.IGNORECASE))
+            'numbers_found': doc.counts['numbers'],
+            'dates_found': doc.counts['dates'], 
+            'urls_found': doc.counts['urls'],
+            'claim_indicators': doc.counts['claim_indicators']
         }
     
-    def _get_source_details(self, content, url):
+    def _get_source_details(self, doc, url):
         """Detaillierte Quellenanalyse"""
         domain = urlparse(url).netloc if url else 'unknown'
+        content = doc.content
         return {
             'domain': domain,
             'is_https': url.startswith('https://') if url else False,
-            'external_links': len(re.findall(r'http[s]?://[^\s]+', content)),
+            'external_links': doc.counts['urls'],
             'reference_style': 'academic' if '(' in content and ')' in content else 'informal'
         }
     
@@ -994,10 +4196,412 @@ class CredibilityAnalyzer:
             'error': 'Inhalt zu kurz oder ungültig'
         }
 
+# Scoring-Prozesse (forkserver/spawn) importieren dieses Modul erneut; sie
+# brauchen nur _init_scoring_worker/_score_chunk, aber weder Datenbank noch
+# Queues, Caches oder einen eigenen Prozess-Pool. Der Import geschieht beim
+# Entpacken des Prozess-Objekts, also bevor parent_process() gesetzt ist;
+# multiprocessing markiert diese Phase mit ``_inheriting``.
+IS_SCORING_WORKER = (multiprocessing.parent_process() is not None or
+                     getattr(multiprocessing.current_process(), '_inheriting', False))
+
+# Ungültige Standard-Detailstufe würde jede Anfrage ohne ``detail`` mit 400 ablehnen
+if ANALYSIS_DETAIL_LEVEL not in CredibilityAnalyzer.DETAIL_LEVELS:
+    logger.warning(f"⚠️ Unbekannte ANALYSIS_DETAIL_LEVEL '{ANALYSIS_DETAIL_LEVEL}', verwende 'full'")
+    ANALYSIS_DETAIL_LEVEL = 'full'
+
 # Globale Instanzen
-db_manager = DatabaseManager()
-credibility_analyzer = CredibilityAnalyzer()
-web_scraper = WebScraper()
+if not IS_SCORING_WORKER:
+    db_manager = DatabaseManager()
+    domain_reputation = DomainReputationIndex()
+    credibility_analyzer = CredibilityAnalyzer(domain_reputation=domain_reputation)
+    web_scraper = WebScraper(cache=HttpCache() if SCRAPER_CACHE_PATH else None)
+    
+    result_cache = ResultCache(db_manager, credibility_analyzer.scoring_version,
+                               source_version=lambda: domain_reputation.version)
+    write_behind = WriteBehindQueue(db_manager)
+    job_manager = JobManager(db_manager)
+    atexit.register(write_behind.shutdown)
+    if credibility_analyzer.scoring_pool is not None:
+        atexit.register(credibility_analyzer.scoring_pool.shutdown)
+    
+    if WARMUP_ON_START:
+        credibility_analyzer.warm_up()
+
+def get_idempotency_key(data):
+    """Idempotenz-Schlüssel aus Request-Body oder Header"""
+    return data.get('idempotency_key') or request.headers.get('Idempotency-Key')
+
+def persist_analysis(result, idempotency_key=None):
+    """Speichert eine Analyse (Write-Behind oder synchron) und liefert die Speicher-Felder"""
+    if WRITE_BEHIND_ENABLED:
+        key = write_behind.submit(result, idempotency_key)
+        return {'saved': True, 'saved_id': None, 'save_status': 'queued', 'idempotency_key': key}
+    
+    key = idempotency_key or uuid.uuid4().hex
+    analysis_id = db_manager.save_analysis(dict(result, idempotency_key=key))
+    return {
+        'saved': analysis_id is not None,
+        'saved_id': analysis_id,
+        'save_status': 'saved' if analysis_id is not None else 'failed',
+        'idempotency_key': key
+    }
+
+def get_output_options(data, save_result=False):
+    """Detailstufe und Text-Echo aus Body bzw. Query (``detail``, ``include_content``).
+    
+    Ungültige Stufen und Speichern mit ``detail=score`` (ohne Kennzahlen) lösen ``ValueError`` aus.
+    """
+    detail = data.get('detail') or request.args.get('detail') or ANALYSIS_DETAIL_LEVEL
+    if detail not in CredibilityAnalyzer.DETAIL_LEVELS:
+        raise ValueError(f"detail muss {', '.join(CredibilityAnalyzer.DETAIL_LEVELS)} sein")
+    if save_result and detail == 'score':
+        raise ValueError('Speichern erfordert detail=summary oder detail=full')
+    
+    # Nur echtes true bzw. '1'/'true'; der JSON-String "false" darf den Text nicht zurückgeben
+    include_content = data.get('include_content', request.args.get('include_content'))
+    return detail, include_content is True or include_content in ('1', 'true')
+
+def public_result(result, include_content=False):
+    """Ergebnis für die Antwort: ohne den analysierten Text, sofern nicht angefordert"""
+    if include_content or 'content' not in result:
+        return result
+    return {key: value for key, value in result.items() if key != 'content'}
+
+def analyze_batch_cached(contents, urls=None, metadata_list=None, detail='full'):
+    """Batch-Analyse, bei der nur Cache-Fehltreffer neu berechnet werden"""
+    urls = urls or [None] * len(contents)
+    metadata_list = metadata_list or [None] * len(contents)
+    results = [None] * len(contents)
+    
+    misses = []
+    for index, content in enumerate(contents):
+        if not isinstance(content, str):
+            continue
+        content = normalize_content(content)
+        cache_key = result_cache.content_key(content, urls[index], detail)
+        result = result_cache.get(cache_key)
+        if result is not None:
+            result['content'] = content
+            result['cached'] = True
+            results[index] = result
+        else:
+            misses.append((index, content, cache_key))
+    
+    computed = credibility_analyzer.analyze_batch(
+        [content for _, content, _ in misses],
+        urls=[urls[index] for index, _, _ in misses],
+        metadata_list=[metadata_list[index] for index, _, _ in misses],
+        detail=detail
+    )
+    for (index, _, cache_key), result in zip(misses, computed):
+        result_cache.set(cache_key, result)
+        results[index] = result
+    
+    # Ungültige Einträge (keine Strings)
+    for index, result in enumerate(results):
+        if result is None:
+            results[index] = credibility_analyzer._empty_result()
+    
+    return results
+
+def analyze_cached(content, cache_key=None, url=None, metadata=None, detail='full'):
+    """Analysiert normalisierten Inhalt und nutzt dabei den Ergebnis-Cache"""
+    content = normalize_content(content)
+    cache_key = cache_key or result_cache.content_key(content, url, detail)
+    
+    with metrics.span('result_cache'):
+        result = result_cache.get(cache_key)
+    if result is not None:
+        result['content'] = content
+        result['cached'] = True
+        return result
+    
+    result = credibility_analyzer.analyze_content(content, url=url, metadata=metadata, detail=detail)
+    result_cache.set(cache_key, result)
+    return result
+
+def analyze_scraped(url, scrape_result, detail='full'):
+    """Analysiert einen gescrapten Artikel (Cache über URL + ETag/Last-Modified/Inhalts-Hash)"""
+    validator = (scrape_result.get('etag') or scrape_result.get('last_modified') or
+                 hashlib.sha256(scrape_result['content'].encode('utf-8')).hexdigest())
+    result = analyze_cached(
+        scrape_result['content'],
+        cache_key=result_cache.url_key(url, validator, detail),
+        url=url,
+        metadata=scrape_result['metadata'],
+        detail=detail
+    )
+    result['scraped'] = True
+    return result
+
+def analyze_url_list(urls, save_result=False, idempotency_keys=None, language='de', progress=None,
+                     detail='full', include_content=False):
+    """Lädt und analysiert mehrere URLs; Ergebnisse in Eingabe-Reihenfolge"""
+    results = [None] * len(urls)
+    
+    # Positionen je URL (Duplikate werden nur einmal geladen)
+    positions = {}
+    for index, url in enumerate(urls):
+        url = url.strip() if isinstance(url, str) else ''
+        if not (url.startswith('http://') or url.startswith('https://')):
+            results[index] = {'url': urls[index], 'error': 'Ungültige URL. Verwenden Sie http:// oder https://'}
+        else:
+            positions.setdefault(url, []).append(index)
+    
+    for done, (url, scrape_result) in enumerate(web_scraper.scrape_many(list(positions)), 1):
+        if scrape_result['success']:
+            result = analyze_scraped(url, scrape_result, detail)
+            result['language'] = language
+        else:
+            result = {'url': url, 'error': scrape_result['error']}
+        
+        for index in positions[url]:
+            item = dict(result)
+            # Optional: Ergebnisse in Datenbank speichern
+            if save_result and 'error' not in item:
+                key = idempotency_keys[index] if idempotency_keys else None
+                item.update(persist_analysis(item, key))
+            results[index] = public_result(item, include_content)
+        
+        if progress:
+            progress(done, len(positions))
+    
+    return results
+
+def run_analysis_job(content, save_result, idempotency_key, language, detail, include_content, progress):
+    """Job: Text-Analyse"""
+    result = analyze_cached(content, detail=detail)
+    result['language'] = language
+    if save_result:
+        result.update(persist_analysis(result, idempotency_key))
+    return public_result(result, include_content)
+
+def run_url_job(url, save_result, idempotency_key, language, detail, include_content, progress):
+    """Job: URL laden und analysieren"""
+    scrape_result = web_scraper.scrape_article(url)
+    if not scrape_result['success']:
+        raise ValueError(scrape_result['error'])
+    
+    result = analyze_scraped(url, scrape_result, detail)
+    result['language'] = language
+    if save_result:
+        result.update(persist_analysis(result, idempotency_key))
+    return public_result(result, include_content)
+
+def run_urls_job(urls, save_result, idempotency_keys, language, detail, include_content, progress):
+    """Job: Bulk-URL-Analyse mit Fortschritt"""
+    results = analyze_url_list(urls, save_result, idempotency_keys, language, progress, detail, include_content)
+    failed = sum(1 for result in results if 'error' in result)
+    return {'results': results, 'total': len(results), 'succeeded': len(results) - failed, 'failed': failed}
+
+def add_timings(payload):
+    """Hängt bei ?timings=1 die Zeiten je Verarbeitungsschritt (ms) an die Antwort an"""
+    if request.args.get('timings') in ('1', 'true'):
+        timings = metrics.breakdown()
+        timings['total'] = round((time.perf_counter_ns() - g.request_start_ns) / 1e6, 3)
+        payload['timings'] = timings
+    return payload
+
+def encode_cursor(position):
+    """Kodiert eine Keyset-Position als URL-sicheren Cursor"""
+    return base64.urlsafe_b64encode(json.dumps(position, separators=(',', ':')).encode('utf-8')).decode('ascii')
+
+def int_arg(name, default=None):
+    """Liest einen ganzzahligen Query-Parameter; ValueError bei ungültigen Werten (statt still den Standard)"""
+    value = request.args.get(name)
+    if value is None or value.strip() == '':
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f'{name} muss eine ganze Zahl sein')
+
+def decode_cursor(token):
+    """Dekodiert einen Cursor; ValueError bei ungültigen Werten"""
+    try:
+        position = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+    except Exception:
+        raise ValueError('Ungültiger Cursor')
+    if not isinstance(position, dict):
+        raise ValueError('Ungültiger Cursor')
+    return position
+
+class _StreamBuffer:
+    """Datei-ähnlicher Puffer, dessen geschriebene Bytes schrittweise gestreamt werden"""
+    
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+    
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+    
+    def tell(self):
+        return self._position
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        self.closed = True
+    
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+class AnalysisExporter:
+    """Serialisiert einen Analyse-Iterator als JSON, NDJSON, CSV oder Parquet-Stream"""
+    
+    FORMATS = {
+        'json': 'application/json',
+        'ndjson': 'application/x-ndjson',
+        'csv': 'text/csv',
+        'parquet': 'application/vnd.apache.parquet'
+    }
+    
+    def __init__(self, rows, order, limit=None, columns=None):
+        self.rows = rows
+        self.order = order
+        self.limit = limit
+        self.columns = columns
+        self.count = 0
+        self.last_row = None
+    
+    def next_cursor(self):
+        """Cursor zum Fortsetzen, falls der Export durch ``limit`` begrenzt wurde"""
+        if self.limit is None or self.count < self.limit or self.last_row is None:
+            return None
+        position = {'id': self.last_row['id']}
+        if self.order == 'created_at':
+            position['created_at'] = self.last_row['created_at']
+        return encode_cursor(position)
+    
+    def _tracked(self):
+        for row in self.rows:
+            self.count += 1
+            self.last_row = row
+            yield row
+    
+    def stream(self, export_format):
+        return getattr(self, f'_stream_{export_format}')()
+    
+    def _stream_json(self):
+        yield '{"export_date": ' + json.dumps(datetime.now().isoformat()) + ', "data": ['
+        for index, row in enumerate(self._tracked()):
+            yield (',' if index else '') + json.dumps(row)
+        yield '], "total_records": ' + json.dumps(self.count) + ', "next_cursor": ' + json.dumps(self.next_cursor()) + '}'
+    
+    def _stream_ndjson(self):
+        for row in self._tracked():
+            yield json.dumps(row) + '\n'
+        # Abschlusszeile mit Cursor zum Fortsetzen
+        yield json.dumps({'_export': {'records': self.count, 'next_cursor': self.next_cursor()}}) + '\n'
+    
+    def _stream_csv(self):
+        buffer = io.StringIO()
+        writer = None
+        for row in self._tracked():
+            if writer is None:
+                writer = csv.DictWriter(buffer, fieldnames=list(row.keys()))
+                writer.writeheader()
+            writer.writerow(row)
+            if buffer.tell() > 64 * 1024:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+    
+    def _stream_parquet(self):
+        pa = lazy_import('pyarrow')
+        pq = lazy_import('pyarrow.parquet')
+        
+        type_map = {'INTEGER': pa.int64(), 'REAL': pa.float64()}
+        schema = pa.schema([
+            (name, type_map.get(declared, pa.string()))
+            for name, declared in db_manager.get_column_types().items()
+            if self.columns is None or name in self.columns
+        ])
+        
+        sink = _StreamBuffer()
+        writer = pq.ParquetWriter(sink, schema)
+        batch = []
+        for row in self._tracked():
+            batch.append(row)
+            if len(batch) >= EXPORT_BATCH_SIZE:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                batch = []
+                yield sink.drain()
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+        writer.close()
+        yield sink.drain()
+
+@app.before_request
+def start_request_metrics():
+    """Startzeit und Stage-Aufschlüsselung des Requests"""
+    g.request_start_ns = time.perf_counter_ns()
+    metrics.start_breakdown()
+
+@app.teardown_request
+def finish_request_metrics(exc):
+    start_ns = g.pop('request_start_ns', None)
+    if start_ns is not None:
+        metrics.observe(request.endpoint or 'unknown', time.perf_counter_ns() - start_ns, family='request')
+    metrics.stop_breakdown()
+
+def profiling_authorized():
+    """Profiling ist aktiviert und der Token (X-Profile-Token = PROFILING_TOKEN) stimmt.
+    
+    Nur als Header: Query-Parameter landen in Access-Logs und Profilpfaden.
+    """
+    if not PROFILING_ENABLED or not PROFILING_TOKEN:
+        return False
+    token = request.headers.get('X-Profile-Token', '')
+    return hmac.compare_digest(token.encode('utf-8'), PROFILING_TOKEN.encode('utf-8'))
+
+@app.before_request
+def start_request_profile():
+    """Profiliert den Request bei X-Profile-Header bzw. ?profile=1|cprofile|sample"""
+    if not PROFILING_ENABLED:
+        return
+    flag = request.headers.get('X-Profile') or request.args.get('profile')
+    if flag and flag not in ('0', 'false') and profiling_authorized():
+        g.profile = request_profiler.start(flag.lower())
+
+PROFILE_QUERY_PARAMS = ('profile', 'profile_token')
+
+def profile_path():
+    """Request-Pfad für Profil und Log, ohne die Profiling-Parameter"""
+    args = [(key, value) for key, value in request.args.items(multi=True) if key not in PROFILE_QUERY_PARAMS]
+    return f'{request.path}?{urlencode(args)}' if args else request.path
+
+@app.after_request
+def finish_request_profile(response):
+    """Behält das Profil und verweist per Header darauf"""
+    profile = g.pop('profile', None)
+    if profile is not None:
+        profile_id = request_profiler.stop(
+            profile,
+            method=request.method,
+            path=profile_path(),
+            endpoint=request.endpoint,
+            status=response.status_code,
+            stages=metrics.breakdown()
+        )
+        response.headers['X-Profile-Id'] = profile_id
+        response.headers['X-Profile-Url'] = url_for('get_profile', profile_id=profile_id)
+    return response
+
+@app.teardown_request
+def discard_request_profile(exc):
+    # Profil ohne Antwort (Fehler vor after_request) trotzdem beenden
+    profile = g.pop('profile', None)
+    if profile is not None:
+        request_profiler.cancel(profile)
 
 def get_language():
     """Ermittelt die aktuelle Sprache aus der Session"""
@@ -1076,24 +4680,92 @@ def analyze_credibility():
         if not isinstance(content, str) or len(content.strip()) < 10:
             return jsonify({'error': 'Inhalt ist zu kurz (mindestens 10 Zeichen erforderlich)'}), 400
         
-        # Credibility-Analyse durchführen
-        result = credibility_analyzer.analyze_content(content)
+        try:
+            detail, include_content = get_output_options(data, save_result)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Credibility-Analyse durchführen (mit Ergebnis-Cache)
+        result = analyze_cached(content, detail=detail)
         result['language'] = get_language()
         
         # Optional: Ergebnis in Datenbank speichern
         if save_result:
-            analysis_id = db_manager.save_analysis(result)
-            result['saved_id'] = analysis_id
-            result['saved'] = True
+            result.update(persist_analysis(result, get_idempotency_key(data)))
         
         logger.info(f"📊 Credibility analysiert - Score: {result.get('credibility_score', 0):.2f}, Klassifikation: {result.get('classification', 'unknown')}")
         
-        return jsonify(result)
+        return jsonify(add_timings(public_result(result, include_content)))
     
     except Exception as e:
         logger.error(f"❌ Fehler in analyze_credibility: {str(e)}")
         return jsonify({'error': f'Server-Fehler: {str(e)}'}), 500
 
+@app.route('/api/analyze_batch', methods=['POST'])
+def analyze_batch():
+    """Batch-Analyse mehrerer Inhalte in einer Anfrage"""
+    try:
+        data = request.get_json()
+        
+        if not data or 'contents' not in data:
+            return jsonify({'error': 'Keine Inhalte in der Anfrage gefunden'}), 400
+        
+        contents = data['contents']
+        urls = data.get('urls')
+        save_result = data.get('save', False)
+        idempotency_keys = data.get('idempotency_keys')
+        
+        if not isinstance(contents, list) or not contents:
+            return jsonify({'error': 'contents muss eine nicht-leere Liste sein'}), 400
+        
+        if len(contents) > MAX_BATCH_SIZE:
+            return jsonify({'error': f'Zu viele Inhalte (maximal {MAX_BATCH_SIZE} pro Anfrage)'}), 400
+        
+        if urls is not None and (not isinstance(urls, list) or len(urls) != len(contents)):
+            return jsonify({'error': 'urls muss eine Liste gleicher Länge wie contents sein'}), 400
+        
+        if urls is not None and not all(url is None or isinstance(url, str) for url in urls):
+            return jsonify({'error': 'urls darf nur Zeichenketten oder null enthalten'}), 400
+        
+        if idempotency_keys is not None and (not isinstance(idempotency_keys, list) or
+                                             len(idempotency_keys) != len(contents)):
+            return jsonify({'error': 'idempotency_keys muss eine Liste gleicher Länge wie contents sein'}), 400
+        
+        try:
+            detail, include_content = get_output_options(data, save_result)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Quell-URLs optional: Domain-Bewertung ohne Scraping
+        metadata_list = None
+        if urls:
+            metadata_list = [{'domain': urlparse(url).netloc} if url else None for url in urls]
+        
+        start_time = datetime.now()
+        results = analyze_batch_cached(contents, urls=urls, metadata_list=metadata_list, detail=detail)
+        language = get_language()
+        
+        for index, result in enumerate(results):
+            result['language'] = language
+            
+            # Optional: Ergebnisse in Datenbank speichern
+            if save_result and 'error' not in result:
+                key = idempotency_keys[index] if idempotency_keys else None
+                result.update(persist_analysis(result, key))
+        
+        processing_time = (datetime.now() - start_time).total_seconds()
+        logger.info(f"📦 Batch analysiert - {len(results)} Inhalte in {processing_time:.2f}s")
+        
+        return jsonify(add_timings({
+            'results': [public_result(result, include_content) for result in results],
+            'total': len(results),
+            'processing_time': processing_time
+        }))
+    
+    except Exception as e:
+        logger.error(f"❌ Fehler in analyze_batch: {str(e)}")
+        return jsonify({'error': f'Server-Fehler: {str(e)}'}), 500
+
 @app.route('/api/analyze_url', methods=['POST'])
 def analyze_url():
     """URL-Analyse durchführen"""
@@ -1109,6 +4781,11 @@ def analyze_url():
         if not url or not (url.startswith('http://') or url.startswith('https://')):
             return jsonify({'error': 'Ungültige URL. Verwenden Sie http:// oder https://'}), 400
         
+        try:
+            detail, include_content = get_output_options(data, save_result)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
         # Web-Scraping durchführen
         scrape_result = web_scraper.scrape_article(url)
         
@@ -1116,57 +4793,238 @@ def analyze_url():
             return jsonify({'error': scrape_result['error']}), 400
         
         # Credibility-Analyse des gescrapten Inhalts
-        result = credibility_analyzer.analyze_content(
-            scrape_result['content'],
-            url=url,
-            metadata=scrape_result['metadata']
-        )
+        result = analyze_scraped(url, scrape_result, detail)
         result['language'] = get_language()
-        result['scraped'] = True
         
         # Optional: Ergebnis in Datenbank speichern
         if save_result:
-            analysis_id = db_manager.save_analysis(result)
-            result['saved_id'] = analysis_id
-            result['saved'] = True
+            result.update(persist_analysis(result, get_idempotency_key(data)))
         
         logger.info(f"🌐 URL analysiert - {url} - Score: {result.get('credibility_score', 0):.2f}")
         
-        return jsonify(result)
+        return jsonify(add_timings(public_result(result, include_content)))
     
     except Exception as e:
         logger.error(f"❌ Fehler in analyze_url: {str(e)}")
         return jsonify({'error': f'Server-Fehler: {str(e)}'}), 500
 
+@app.route('/api/analyze_urls', methods=['POST'])
+def analyze_urls():
+    """Bulk-URL-Analyse: paralleles Laden, Analyse sobald eine Seite vorliegt"""
+    try:
+        data = request.get_json()
+        
+        if not data or 'urls' not in data:
+            return jsonify({'error': 'Keine URLs in der Anfrage gefunden'}), 400
+        
+        urls = data['urls']
+        save_result = data.get('save', False)
+        idempotency_keys = data.get('idempotency_keys')
+        
+        if not isinstance(urls, list) or not urls:
+            return jsonify({'error': 'urls muss eine nicht-leere Liste sein'}), 400
+        
+        if len(urls) > MAX_URL_BATCH_SIZE:
+            return jsonify({'error': f'Zu viele URLs (maximal {MAX_URL_BATCH_SIZE} pro Anfrage)'}), 400
+        
+        if idempotency_keys is not None and (not isinstance(idempotency_keys, list) or
+                                             len(idempotency_keys) != len(urls)):
+            return jsonify({'error': 'idempotency_keys muss eine Liste gleicher Länge wie urls sein'}), 400
+        
+        try:
+            detail, include_content = get_output_options(data, save_result)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        start_time = datetime.now()
+        results = analyze_url_list(urls, save_result, idempotency_keys, get_language(),
+                                   detail=detail, include_content=include_content)
+        
+        failed = sum(1 for result in results if 'error' in result)
+        processing_time = (datetime.now() - start_time).total_seconds()
+        logger.info(f"🌐 {len(urls)} URLs analysiert ({failed} Fehler) in {processing_time:.2f}s")
+        
+        return jsonify(add_timings({
+            'results': results,
+            'total': len(results),
+            'succeeded': len(results) - failed,
+            'failed': failed,
+            'processing_time': processing_time
+        }))
+    
+    except Exception as e:
+        logger.error(f"❌ Fehler in analyze_urls: {str(e)}")
+        return jsonify({'error': f'Server-Fehler: {str(e)}'}), 500
+
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    """Startet eine Analyse im Hintergrund und liefert sofort die Job-ID (202)"""
+    try:
+        data = request.get_json()
+        
+        if not data or data.get('type') not in ('analyze', 'analyze_url', 'analyze_urls'):
+            return jsonify({'error': 'type muss analyze, analyze_url oder analyze_urls sein'}), 400
+        
+        kind = data['type']
+        save_result = data.get('save', False)
+        language = get_language()
+        
+        try:
+            detail, include_content = get_output_options(data, save_result)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        if kind == 'analyze':
+            content = data.get('content')
+            if not isinstance(content, str) or len(content.strip()) < 10:
+                return jsonify({'error': 'Inhalt ist zu kurz (mindestens 10 Zeichen erforderlich)'}), 400
+            args = (run_analysis_job, content, save_result, get_idempotency_key(data), language)
+        
+        elif kind == 'analyze_url':
+            url = data.get('url').strip() if isinstance(data.get('url'), str) else ''
+            if not (url.startswith('http://') or url.startswith('https://')):
+                return jsonify({'error': 'Ungültige URL. Verwenden Sie http:// oder https://'}), 400
+            args = (run_url_job, url, save_result, get_idempotency_key(data), language)
+        
+        else:
+            urls = data.get('urls')
+            idempotency_keys = data.get('idempotency_keys')
+            if not isinstance(urls, list) or not urls:
+                return jsonify({'error': 'urls muss eine nicht-leere Liste sein'}), 400
+            if len(urls) > MAX_URL_BATCH_SIZE:
+                return jsonify({'error': f'Zu viele URLs (maximal {MAX_URL_BATCH_SIZE} pro Anfrage)'}), 400
+            if idempotency_keys is not None and (not isinstance(idempotency_keys, list) or
+                                                 len(idempotency_keys) != len(urls)):
+                return jsonify({'error': 'idempotency_keys muss eine Liste gleicher Länge wie urls sein'}), 400
+            args = (run_urls_job, urls, save_result, idempotency_keys, language)
+        
+        try:
+            job_id = job_manager.submit(kind, *args, detail, include_content)
+        except queue.Full:
+            return jsonify({'error': 'Zu viele wartende Jobs, bitte später erneut versuchen'}), 503, {'Retry-After': '5'}
+        
+        status_url = url_for('get_job', job_id=job_id)
+        logger.info(f"🧵 Job {job_id} ({kind}) eingereiht")
+        
+        response = {
+            'job_id': job_id,
+            'status': 'queued',
+            'status_url': status_url
+        }
+        if JOB_EVENTS_ENABLED:
+            response['events_url'] = url_for('job_events', job_id=job_id)
+        return jsonify(response), 202, {'Location': status_url}
+    
+    except Exception as e:
+        logger.error(f"❌ Fehler in create_job: {str(e)}")
+        return jsonify({'error': f'Server-Fehler: {str(e)}'}), 500
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Status, Fortschritt und (wenn fertig) Ergebnis eines Jobs"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job nicht gefunden'}), 404
+    return jsonify(job)
+
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """Server-Sent Events für einen Job (status, result, failed); nur mit JOB_EVENTS=1"""
+    if not JOB_EVENTS_ENABLED:
+        return jsonify({'error': 'Server-Sent Events sind deaktiviert (JOB_EVENTS=1); Status über /api/jobs/<job_id> abfragen'}), 404
+    if job_manager.get(job_id, include_result=False) is None:
+        return jsonify({'error': 'Job nicht gefunden'}), 404
+    return Response(
+        stream_with_context(job_manager.events(job_id)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/api/domains/<domain>', methods=['GET'])
+def domain_reputation_lookup(domain):
+    """Reputation einer Domain (längster passender Eintrag im Index)"""
+    try:
+        normalized = DomainReputationIndex.normalize(domain)
+        if not DomainReputationIndex.DOMAIN_PATTERN.match(normalized):
+            return jsonify({'error': 'Ungültige Domain'}), 400
+        
+        entry = domain_reputation.lookup(normalized)
+        return jsonify({
+            'domain': normalized,
+            'rated': entry is not None,
+            'matched': entry['matched'] if entry else None,
+            'score': entry['score'] if entry else 0.0,
+            'category': entry['category'] if entry else None,
+            'source': entry['source'] if entry else None,
+            'version': domain_reputation.version
+        })
+    
+    except Exception as e:
+        logger.error(f"❌ Fehler in domain_reputation_lookup: {str(e)}")
+        return jsonify({'error': f'Server-Fehler: {str(e)}'}), 500
+
 @app.route('/api/search', methods=['GET'])
 def search_content():
     """Suche in gespeicherten Inhalten"""
     try:
         query = request.args.get('q', '').strip()
         
-        # Erweiterte Filter (optional für zukünftige Entwicklung)
+        # Erweiterte Filter
         filters = {
-            'credibility': request.args.get('credibility'),
-            'date_from': request.args.get('date_from'),
-            'date_to': request.args.get('date_to'),
-            'min_words': request.args.get('min_words'),
-            'max_words': request.args.get('max_words')
+            key: request.args.get(key)
+            for key in ('credibility', 'date_from', 'date_to', 'min_words', 'max_words',
+                        'min_score', 'max_score', 'domain')
         }
         
-        results = db_manager.search_content(query, filters)
+        try:
+            limit = int_arg('limit', DatabaseManager.SEARCH_LIMIT)
+            if not 1 <= limit <= SEARCH_MAX_LIMIT:
+                raise ValueError(f'limit muss zwischen 1 und {SEARCH_MAX_LIMIT} liegen')
+            
+            # Folgeseite über den Cursor der vorherigen Antwort
+            after = decode_cursor(request.args['cursor']) if request.args.get('cursor') else None
+            # Listenansicht oder explizite Feldauswahl (fields=id,title,content,...)
+            columns = db_manager.resolve_fields(request.args.get('fields'), DatabaseManager.LIST_COLUMNS)
+            results = db_manager.search_content(query, filters, limit=limit, after=after, columns=columns)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        next_cursor = None
+        if len(results) == limit:
+            next_cursor = encode_cursor(db_manager.search_position(results[-1], query))
         
         logger.info(f"🔍 Suche nach '{query}' - {len(results)} Ergebnisse")
         
-        return jsonify({
+        return jsonify(add_timings({
             'query': query,
             'results': results,
-            'total': len(results)
-        })
+            'total': len(results),
+            'next_cursor': next_cursor
+        }))
     
     except Exception as e:
         logger.error(f"❌ Suchfehler: {str(e)}")
         return jsonify({'error': f'Suchfehler: {str(e)}'}), 500
 
+@app.route('/api/analysis/<int:analysis_id>', methods=['GET'])
+def analysis_detail(analysis_id):
+    """Detailansicht einer gespeicherten Analyse inkl. Text und Empfehlungen"""
+    try:
+        try:
+            columns = db_manager.resolve_fields(request.args.get('fields'), DatabaseManager.ANALYSIS_COLUMNS)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        analysis = db_manager.get_analysis(analysis_id, columns)
+        if analysis is None:
+            return jsonify({'error': 'Analyse nicht gefunden'}), 404
+        
+        return jsonify(analysis)
+    
+    except Exception as e:
+        logger.error(f"❌ Fehler beim Laden der Analyse {analysis_id}: {str(e)}")
+        return jsonify({'error': f'Server-Fehler: {str(e)}'}), 500
+
 @app.route('/api/save', methods=['POST'])
 def save_analysis():
     """Speichert eine Analyse nachträglich"""
@@ -1176,13 +5034,18 @@ def save_analysis():
         if not data:
             return jsonify({'error': 'Keine Daten erhalten'}), 400
         
-        analysis_id = db_manager.save_analysis(data)
+        if not all(field in data for field in ('content', 'credibility_score', 'classification', 'confidence')):
+            return jsonify({'error': 'Unvollständige Analyse-Daten'}), 400
         
-        if analysis_id:
+        save_info = persist_analysis(data, get_idempotency_key(data))
+        
+        if save_info['saved']:
             return jsonify({
                 'success': True,
                 'message': 'Analyse erfolgreich gespeichert',
-                'id': analysis_id
+                'id': save_info['saved_id'],
+                'status': save_info['save_status'],
+                'idempotency_key': save_info['idempotency_key']
             })
         else:
             return jsonify({'error': 'Fehler beim Speichern'}), 500
@@ -1191,6 +5054,20 @@ def save_analysis():
         logger.error(f"❌ Speicherfehler: {str(e)}")
         return jsonify({'error': f'Speicherfehler: {str(e)}'}), 500
 
+@app.route('/api/saved/<idempotency_key>')
+def get_saved_analysis(idempotency_key):
+    """Liefert die ID einer (ggf. noch in der Queue wartenden) gespeicherten Analyse"""
+    analysis_id = db_manager.get_analysis_id(idempotency_key)
+    
+    if analysis_id is not None:
+        return jsonify({'status': 'saved', 'id': analysis_id, 'idempotency_key': idempotency_key})
+    if write_behind.is_pending(idempotency_key):
+        return jsonify({'status': 'queued', 'id': None, 'idempotency_key': idempotency_key}), 202
+    if WRITE_BEHIND_ENABLED:
+        # Kann noch in der Queue eines anderen Worker-Prozesses liegen
+        return jsonify({'status': 'unknown', 'id': None, 'idempotency_key': idempotency_key}), 202, {'Retry-After': '1'}
+    return jsonify({'error': 'Keine Analyse mit diesem Schlüssel gefunden'}), 404
+
 @app.route('/api/example/<example_type>')
 def get_example_content(example_type):
     """Beispiel-Inhalt für die aktuelle Sprache abrufen"""
@@ -1214,16 +5091,65 @@ def get_statistics():
 
 @app.route('/api/export')
 def export_data():
-    """Exportiert alle Analysen als JSON"""
+    """Exportiert Analysen gestreamt (JSON, NDJSON, CSV oder Parquet)"""
     try:
-        all_analyses = db_manager.search_content('', {})
+        export_format = request.args.get('format', 'json').lower()
+        order = request.args.get('order', 'id')
+        try:
+            limit = int_arg('limit')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        return jsonify({
-            'export_date': datetime.now().isoformat(),
-            'total_records': len(all_analyses),
-            'data': all_analyses
-        })
+        if export_format not in AnalysisExporter.FORMATS:
+            return jsonify({'error': f'Unbekanntes Format: {export_format}'}), 400
+        
+        if order not in DatabaseManager.EXPORT_ORDERS:
+            return jsonify({'error': f'Unbekannte Sortierung: {order}'}), 400
+        
+        if limit is not None and limit <= 0:
+            return jsonify({'error': 'limit muss positiv sein'}), 400
+        
+        if export_format == 'parquet':
+            try:
+                lazy_import('pyarrow.parquet')
+            except ImportError:
+                return jsonify({'error': 'Parquet-Export erfordert das Paket pyarrow'}), 400
+        
+        # Fortsetzen über Cursor (aus einem vorherigen Export) oder after_id
+        after = None
+        if request.args.get('cursor'):
+            after = decode_cursor(request.args['cursor'])
+        elif request.args.get('after_id'):
+            after = {'id': request.args.get('after_id', type=int) or 0}
+        
+        # Bei Sortierung nach created_at gehört dessen Wert zur Position
+        if order == 'created_at' and after and 'created_at' not in after:
+            anchor = db_manager.get_analysis(after.get('id', 0), columns=('id', 'created_at'))
+            if anchor is None:
+                return jsonify({'error': f"Analyse {after.get('id')} für after_id nicht gefunden"}), 400
+            after['created_at'] = anchor['created_at']
+        
+        # Optionale Feldauswahl, z.B. fields=id,url,credibility_score
+        columns = db_manager.resolve_fields(
+            request.args.get('fields'), DatabaseManager.ANALYSIS_COLUMNS,
+            ('id', 'created_at') if order == 'created_at' else ('id',)
+        )
+        
+        rows = db_manager.iter_analyses(after=after, order=order, limit=limit, columns=columns)
+        exporter = AnalysisExporter(rows, order, limit, columns)
+        
+        filename = f"credibility_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+        
+        logger.info(f"📤 Export gestartet - Format: {export_format}, Sortierung: {order}")
+        
+        return Response(
+            stream_with_context(exporter.stream(export_format)),
+            mimetype=AnalysisExporter.FORMATS[export_format],
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
+        )
     
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"❌ Exportfehler: {str(e)}")
         return jsonify({'error': f'Exportfehler: {str(e)}'}), 500
@@ -1235,18 +5161,134 @@ def health_check():
     
     return jsonify({
         'status': 'healthy',
+        'analyzer_mode': credibility_analyzer.mode,
         'analyzers_available': {
-            'content_quality': credibility_analyzer.quality_analyzer is not None,
+            'content_quality': credibility_analyzer.model_loaded,
             'web_scraper': True,
             'fact_checker': True
         },
         'database_status': 'connected',
         'total_analyses': stats.get('total_analyses', 0),
         'supported_languages': list(LANGUAGES.keys()),
+        'inference': credibility_analyzer.inference_server.stats,
+        'scoring_pool': credibility_analyzer.scoring_pool.stats if credibility_analyzer.scoring_pool else None,
+        'cache': result_cache.get_stats(),
+        'write_behind': write_behind.get_stats(),
+        'scraper': web_scraper.stats,
+        'domain_reputation': domain_reputation.get_stats(),
+        'jobs': job_manager.get_stats(),
+        'profiling': request_profiler.get_stats(),
+        'http_cache': web_scraper.cache.get_stats() if web_scraper.cache else None,
+        'startup': STARTUP_REPORT,
         'timestamp': datetime.now().isoformat(),
         'version': '1.0-credibility-analysis'
     })
 
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Latenz-Histogramme und Komponenten-Kennzahlen im Prometheus-Textformat"""
+    scoring_pool = credibility_analyzer.scoring_pool
+    # Komponente -> (Objekt mit ``stats``-Zählern, Kennzahlen)
+    components = {
+        'cache': (result_cache, result_cache.get_stats()),
+        'write_behind': (write_behind, write_behind.get_stats()),
+        'scraper': (web_scraper, web_scraper.stats),
+        'http_cache': (web_scraper.cache, web_scraper.cache.get_stats() if web_scraper.cache else {}),
+        'jobs': (job_manager, job_manager.get_stats()),
+        'inference': (credibility_analyzer.inference_server, credibility_analyzer.inference_server.stats),
+        'scoring_pool': (scoring_pool, scoring_pool.stats if scoring_pool else {}),
+        'domain_reputation': (domain_reputation, domain_reputation.get_stats()),
+        'profiling': (request_profiler, request_profiler.get_stats())
+    }
+    
+    # Einträge in ``stats`` sind monoton steigende Zähler, außer diesen Momentwerten;
+    # alles Abgeleitete (Tiefe, Raten, Größen) ist ein Gauge
+    current_values = {'entries', 'skipped', 'largest_batch'}
+    
+    # Numerische Kennzahlen, verschachtelte Werte (z.B. p95) eine Ebene tief
+    gauges = {}
+    counters = {}
+    for component, (source, stats) in components.items():
+        counter_keys = set(getattr(source, 'stats', {})) - current_values
+        for key, value in stats.items():
+            values = value.items() if isinstance(value, dict) else [('', value)]
+            for suffix, number in values:
+                if isinstance(number, (int, float)) and not isinstance(number, bool):
+                    name = '_'.join(part for part in ('credibility', component, key, suffix) if part)
+                    target = counters if key in counter_keys else gauges
+                    target[name] = (f'{component}.{key}{"." + suffix if suffix else ""}', number)
+    
+    return Response(metrics.render(gauges, counters), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+def profiles_access_error():
+    """Fehlerantwort, falls die Profil-Endpoints nicht verfügbar sind"""
+    if not PROFILING_ENABLED:
+        return jsonify({'error': 'Profiling ist deaktiviert (PROFILING_ENABLED=1 und PROFILING_TOKEN)'}), 404
+    if not profiling_authorized():
+        return jsonify({'error': 'Ungültiger Profiling-Token'}), 403
+    return None
+
+@app.route('/api/admin/profiles', methods=['GET'])
+def list_profiles():
+    """Die langsamsten profilierten Requests mit ihren teuersten Funktionen"""
+    error = profiles_access_error()
+    if error:
+        return error
+    
+    limit = request.args.get('limit', PROFILING_KEEP, type=int)
+    if limit < 1:
+        return jsonify({'error': 'limit muss mindestens 1 sein'}), 400
+    
+    profiles = request_profiler.list(limit)
+    for profile in profiles:
+        profile['artifact_url'] = url_for('get_profile', profile_id=profile['id'])
+    return jsonify({'profiles': profiles, 'total': len(profiles), 'stats': request_profiler.get_stats()})
+
+@app.route('/api/admin/profiles/<profile_id>', methods=['GET'])
+def get_profile(profile_id):
+    """Profil-Artefakt: format=raw (pstats-Dump bzw. Collapsed Stacks), text oder json"""
+    error = profiles_access_error()
+    if error:
+        return error
+    
+    profile = request_profiler.get(profile_id)
+    if profile is None:
+        return jsonify({'error': 'Profil nicht gefunden'}), 404
+    entry, artifact, report = profile
+    
+    output_format = request.args.get('format', 'raw')
+    if output_format == 'json':
+        return jsonify(entry)
+    if output_format == 'text':
+        return Response(report, content_type='text/plain; charset=utf-8')
+    if output_format == 'raw':
+        content_type = 'application/octet-stream' if entry['mode'] == 'cprofile' else 'text/plain; charset=utf-8'
+        return Response(artifact, content_type=content_type, headers={
+            'Content-Disposition': f'attachment; filename={RequestProfiler.filename(entry)}'
+        })
+    return jsonify({'error': 'format muss raw, text oder json sein'}), 400
+
+@app.cli.command('rebuild-stats')
+def rebuild_stats_command():
+    """Baut die Statistik-Aggregate aus allen gespeicherten Analysen neu auf"""
+    db_manager.rebuild_statistics()
+
+@app.cli.command('migrate-documents')
+@click.option('--batch-size', default=EXPORT_BATCH_SIZE, show_default=True, help='Analysen pro Transaktion')
+@click.option('--vacuum', is_flag=True, help='Datenbankdatei anschließend verkleinern')
+def migrate_documents_command(batch_size, vacuum):
+    """Überführt gespeicherte Texte in die deduplizierte, komprimierte documents-Tabelle"""
+    report = db_manager.migrate_documents(batch_size=batch_size, vacuum=vacuum)
+    click.echo(json.dumps(report, indent=2))
+
+@app.cli.command('warmup')
+def warmup_command():
+    """Lädt Modell und NLTK-Ressourcen (z.B. beim Docker-Build)"""
+    credibility_analyzer.warm_up()
+
+STARTUP_REPORT['module_load_seconds'] = round(time.perf_counter() - _MODULE_LOAD_START, 3)
+logger.info(f"⏱️ App geladen in {STARTUP_REPORT['module_load_seconds']:.2f}s (Modus: {ANALYZER_MODE})")
+
 if __name__ == '__main__':
     logger.info("🚀 Starte CredibilityGuard Flask App mit 4-Sprachen-Support...")
     
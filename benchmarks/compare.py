@@ -0,0 +1,105 @@
+"""Vergleicht zwei Ergebnisse von benchmarks/suite.py (z.B. zweier Commits).
+
+Alle numerischen Messwerte werden über ihren Pfad (``analyzer.words=1000.p99_ms``)
+gegenübergestellt. Raten (``*_per_second``) sollen steigen, Latenzen, Dauern
+und Speicher (``*_ms``, ``*_seconds*``, ``*_mb``) sinken. Verschlechtert sich
+ein Wert um mehr als ``--threshold`` Prozent, endet das Skript mit Exit-Code 1;
+Latenzen unterhalb von ``--min-ms`` gelten als Messrauschen.
+
+    python benchmarks/compare.py baseline.json results.json --threshold 10
+"""
+
+import argparse
+import json
+import sys
+
+# Listeneinträge werden über diese Felder statt über ihre Position zugeordnet
+KEYS = ('words', 'rows')
+
+
+def direction(name):
+    """+1: höher ist besser, -1: niedriger ist besser, 0: kein Messwert"""
+    if name.endswith('_per_second'):
+        return 1
+    if name.endswith(('_ms', '_mb')) or '_seconds' in name:
+        return -1
+    return 0
+
+
+def flatten(node, prefix=''):
+    """Pfad -> Zahl für alle Messwerte außerhalb von ``meta``"""
+    values = {}
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key != 'meta':
+                values.update(flatten(value, f'{prefix}{key}.'))
+    elif isinstance(node, list):
+        for index, item in enumerate(node):
+            key = next((f'{name}={item[name]}' for name in KEYS if isinstance(item, dict) and name in item), index)
+            values.update(flatten(item, f'{prefix}{key}.'))
+    elif isinstance(node, (int, float)) and not isinstance(node, bool):
+        values[prefix.rstrip('.')] = node
+    return values
+
+
+def compare(baseline, current, threshold, min_ms=0.0):
+    before = flatten(baseline)
+    after = flatten(current)
+    rows = []
+    for path in sorted(before.keys() & after.keys()):
+        sign = direction(path.rsplit('.', 1)[-1])
+        if not sign and '.stages_mean_ms.' in path:
+            sign = -1
+        if not sign or not before[path]:
+            continue
+        change = (after[path] - before[path]) / abs(before[path]) * 100
+        noise = '_ms' in path and max(before[path], after[path]) < min_ms
+        rows.append({
+            'metric': path,
+            'baseline': before[path],
+            'current': after[path],
+            'change_percent': round(change, 1),
+            'regression': change * sign < -threshold and not noise
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Toleranz in Prozent')
+    parser.add_argument('--min-ms', type=float, default=1.0,
+                        help='Latenzen unterhalb dieses Werts (ms) nicht als Verschlechterung werten')
+    parser.add_argument('--json', action='store_true', help='Vergleich als JSON ausgeben')
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.current, encoding='utf-8') as f:
+        current = json.load(f)
+
+    rows = compare(baseline, current, args.threshold, args.min_ms)
+    regressions = [row for row in rows if row['regression']]
+
+    if args.json:
+        print(json.dumps({
+            'baseline': baseline.get('meta', {}).get('commit'),
+            'current': current.get('meta', {}).get('commit'),
+            'threshold_percent': args.threshold,
+            'min_ms': args.min_ms,
+            'metrics': rows,
+            'regressions': len(regressions)
+        }, indent=2))
+    else:
+        print(f"{baseline.get('meta', {}).get('commit')} -> {current.get('meta', {}).get('commit')}")
+        for row in rows:
+            marker = '!!' if row['regression'] else '  '
+            print(f"{marker} {row['metric']:<60} {row['baseline']:>12} {row['current']:>12} {row['change_percent']:>+8.1f}%")
+        print(f'{len(regressions)} Verschlechterung(en) über {args.threshold:g}%')
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
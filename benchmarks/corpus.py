@@ -0,0 +1,125 @@
+"""Synthetischer Korpus aus den Beispieltexten (EXAMPLE_CONTENT).
+
+Erzeugt Dokumente kontrollierter Länge und Sprache, indem Sätze der
+Beispieltexte (hohe, mittlere, niedrige Qualität) gemischt und Zahlen variiert
+werden. Mit gleichem Seed entsteht derselbe Korpus. Optional werden die
+Dokumente zusätzlich als HTML-Seiten (Fixtures für die Extraktion) abgelegt.
+
+    python benchmarks/corpus.py --documents 1000 --words 500 --language de --output corpus.jsonl
+    python benchmarks/corpus.py --documents 200 --words 800 --html-dir fixtures/
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CREDIBILITY_MODE', 'lite')
+os.environ.setdefault('DATABASE_PATH', os.path.join(tempfile.gettempdir(), 'credibility_bench_import.db'))
+
+import app  # noqa: E402
+
+LANGUAGES = tuple(app.EXAMPLE_CONTENT)
+QUALITIES = ('high_quality', 'medium_quality', 'low_quality')
+
+SENTENCE_SPLIT = re.compile(r'(?<!\bDr\.)(?<=[.!?])\s+')
+NUMBER = re.compile(r'\d+')
+
+
+def sentence_pool():
+    """Sprache -> Qualität -> Sätze der Beispieltexte"""
+    return {
+        language: {quality: SENTENCE_SPLIT.split(texts[quality].strip()) for quality in QUALITIES}
+        for language, texts in app.EXAMPLE_CONTENT.items()
+    }
+
+
+def perturb(rng, number):
+    """Zufallszahl mit derselben Stellenzahl (Jahreszahlen bleiben vierstellig)"""
+    digits = len(number)
+    return str(rng.randint(10 ** (digits - 1) if digits > 1 else 1, 10 ** digits - 1))
+
+
+def generate_document(rng, pool, words, language, quality):
+    """Dokument mit mindestens ``words`` Wörtern; Zahlen werden zufällig ersetzt"""
+    sentences = pool[language][quality]
+    parts = []
+    count = 0
+    while count < words:
+        sentence = NUMBER.sub(lambda match: perturb(rng, match.group()), rng.choice(sentences))
+        parts.append(sentence)
+        count += len(sentence.split())
+    return ' '.join(parts)
+
+
+def generate_corpus(documents, words, language='mixed', quality='mixed', seed=7):
+    """Liste von dicts (language, quality, content); 'mixed' wechselt reihum"""
+    rng = random.Random(seed)
+    pool = sentence_pool()
+    corpus = []
+    for index in range(documents):
+        doc_language = LANGUAGES[index % len(LANGUAGES)] if language == 'mixed' else language
+        doc_quality = QUALITIES[index % len(QUALITIES)] if quality == 'mixed' else quality
+        corpus.append({
+            'language': doc_language,
+            'quality': doc_quality,
+            'content': generate_document(rng, pool, words, doc_language, doc_quality)
+        })
+    return corpus
+
+
+def render_html(document, index):
+    """Nachrichtenseite mit Navigation, Skripten und dem Dokument als Haupttext"""
+    sentences = SENTENCE_SPLIT.split(document['content'])
+    paragraphs = ''.join(
+        f'<p>{" ".join(sentences[start:start + 4])}</p>\n' for start in range(0, len(sentences), 4)
+    )
+    menu = ''.join(f'<li><a href="/s{i}">Section {i}</a></li>' for i in range(30))
+    scripts = ''.join(f'<script>var tracker{i} = {{id: {i}}};</script>' for i in range(5))
+    json_ld = json.dumps({'@type': 'NewsArticle', 'author': {'name': f'Author {index}'},
+                          'datePublished': f'2024-03-{index % 28 + 1:02d}'})
+    return f"""<!DOCTYPE html>
+<html lang="{document['language']}"><head><meta charset="utf-8">
+<title>{document['quality']} {index} | Benchmark News</title>
+<meta name="author" content="Meta Author {index}">
+<script type="application/ld+json">{json_ld}</script>{scripts}</head>
+<body><nav><ul>{menu}</ul></nav>
+<article><h1>Headline {index}</h1>
+{paragraphs}</article>
+<footer><p>Impressum</p></footer></body></html>""".encode('utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--documents', type=int, default=100)
+    parser.add_argument('--words', type=int, default=500, help='Mindestlänge je Dokument in Wörtern')
+    parser.add_argument('--language', choices=LANGUAGES + ('mixed',), default='mixed')
+    parser.add_argument('--quality', choices=QUALITIES + ('mixed',), default='mixed')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', help='JSONL-Datei (Standard: stdout)')
+    parser.add_argument('--html-dir', help='Dokumente zusätzlich als HTML-Fixtures ablegen')
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.documents, args.words, args.language, args.quality, args.seed)
+
+    if args.html_dir:
+        os.makedirs(args.html_dir, exist_ok=True)
+        for index, document in enumerate(corpus):
+            with open(os.path.join(args.html_dir, f'page-{index:05d}.html'), 'wb') as f:
+                f.write(render_html(document, index))
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for document in corpus:
+            out.write(json.dumps(document, ensure_ascii=False) + '\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""Schreib-Contention-Benchmark für DatabaseManager.
+
+Startet mehrere Writer-Prozesse (wie gunicorn-Worker), die fortlaufend
+Analysen speichern, während Reader-Prozesse Statistiken und Suchen abfragen.
+Ausgegeben werden Inserts/s und Reads/s für die gepoolte WAL-Konfiguration
+und zum Vergleich für das frühere Verhalten (neue Verbindung pro Aufruf,
+Rollback-Journal).
+
+    python benchmarks/db_write_contention.py --writers 4 --readers 4 --seconds 10
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CREDIBILITY_MODE', 'lite')
+os.environ.setdefault('DATABASE_PATH', os.path.join(tempfile.gettempdir(), 'credibility_bench_import.db'))
+
+import app  # noqa: E402
+
+
+class LegacyDatabaseManager(app.DatabaseManager):
+    """Früheres Verhalten: neue Verbindung pro Aufruf, Standard-Journal"""
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=app.SQLITE_BUSY_TIMEOUT_MS / 1000.0)
+        conn.execute('PRAGMA journal_mode=DELETE')
+        self._register_functions(conn)
+        return conn
+
+    @contextlib.contextmanager
+    def connection(self):
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def sample_analysis(worker, index):
+    content = app.EXAMPLE_CONTENT['en']['medium_quality']
+    return {
+        'content': f'{content} [{worker}-{index}]',
+        'url': f'https://example.com/{worker}/{index}',
+        'title': f'Benchmark {worker}-{index}',
+        'domain': 'example.com',
+        'credibility_score': (index % 100) / 100.0,
+        'content_quality_score': 0.5,
+        'factual_accuracy_score': 0.5,
+        'source_reliability_score': 0.5,
+        'classification': ('high', 'medium', 'low', 'questionable')[index % 4],
+        'confidence': 0.9,
+        'word_count': 80 + index % 400,
+        'sentence_count': 7,
+        'char_count': len(content),
+        'sources_found': index % 5,
+        'recommendations': ['Benchmark'],
+        'issues_detected': []
+    }
+
+
+def writer(manager_cls, db_path, worker, deadline, results):
+    manager = manager_cls(db_path)
+    count = 0
+    while time.time() < deadline:
+        if manager.save_analysis(sample_analysis(worker, count)):
+            count += 1
+    results.put(('insert', count))
+
+
+def reader(manager_cls, db_path, deadline, results):
+    manager = manager_cls(db_path)
+    count = 0
+    while time.time() < deadline:
+        manager.get_statistics()
+        manager.search_content('meditation', {})
+        count += 1
+    results.put(('read', count))
+
+
+def run(manager_cls, writers, readers, seconds):
+    fd, db_path = tempfile.mkstemp(suffix='.db', prefix='credibility_bench_')
+    os.close(fd)
+    os.unlink(db_path)
+    manager_cls(db_path)  # Schema anlegen
+
+    results = multiprocessing.Queue()
+    deadline = time.time() + seconds
+    processes = [
+        multiprocessing.Process(target=writer, args=(manager_cls, db_path, worker, deadline, results))
+        for worker in range(writers)
+    ] + [
+        multiprocessing.Process(target=reader, args=(manager_cls, db_path, deadline, results))
+        for _ in range(readers)
+    ]
+    for process in processes:
+        process.start()
+
+    totals = {'insert': 0, 'read': 0}
+    for _ in processes:
+        kind, count = results.get()
+        totals[kind] += count
+    for process in processes:
+        process.join()
+
+    for suffix in ('', '-wal', '-shm'):
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(db_path + suffix)
+
+    return {
+        'inserts_per_second': round(totals['insert'] / seconds, 1),
+        'reads_per_second': round(totals['read'] / seconds, 1),
+        'writers': writers,
+        'readers': readers,
+        'seconds': seconds
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--mode', choices=['pooled', 'legacy', 'both'], default='both')
+    args = parser.parse_args()
+
+    report = {}
+    if args.mode in ('pooled', 'both'):
+        report['pooled_wal'] = run(app.DatabaseManager, args.writers, args.readers, args.seconds)
+    if args.mode in ('legacy', 'both'):
+        report['legacy'] = run(LegacyDatabaseManager, args.writers, args.readers, args.seconds)
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
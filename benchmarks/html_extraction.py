@@ -0,0 +1,122 @@
+"""HTML-Extraktions-Benchmark: BeautifulSoup (html.parser) gegen lxml-Einzeldurchlauf.
+
+Misst pro Pfad die Zeit pro Seite und den Durchsatz über einen lokalen Korpus
+gespeicherter HTML-Seiten und prüft, ob beide Pfade denselben Inhalt und
+dieselben Metadaten liefern. Ohne ``--corpus`` wird ein synthetischer
+Nachrichten-Korpus erzeugt.
+
+    python benchmarks/html_extraction.py --corpus ./saved_pages --repeat 3
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CREDIBILITY_MODE', 'lite')
+os.environ.setdefault('DATABASE_PATH', os.path.join(tempfile.gettempdir(), 'credibility_bench_import.db'))
+
+import app  # noqa: E402
+
+WORDS = ('study research according data percent university report experts results analysis '
+         'published journal evidence participants significant climate health policy economy').split()
+
+LAYOUTS = ('article', 'role-main', 'post-content', 'main', 'paragraphs')
+
+
+def sentence(rng):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(8, 20))]
+    return ' '.join(words).capitalize() + '.'
+
+
+def synthetic_page(rng, index):
+    """Nachrichtenseite mit Navigation, Skripten, Werbung, JSON-LD und Haupttext"""
+    layout = LAYOUTS[index % len(LAYOUTS)]
+    paragraphs = ''.join(
+        f'<p>{sentence(rng)} <a href="/l{i}">{rng.choice(WORDS)}</a> {sentence(rng)} &amp; {rng.randint(1, 99)}%</p>\n'
+        for i in range(rng.randint(5, 60))
+    )
+    body = {
+        'article': f'<article><h1>Headline {index}</h1>{paragraphs}<aside>Related</aside></article>',
+        'role-main': f'<div role="main"><h1>Headline {index}</h1>{paragraphs}</div>',
+        'post-content': f'<div class="entry post-content"><!-- ad slot -->{paragraphs}</div>',
+        'main': f'<main><section>{paragraphs}</section><nav>Next</nav></main>',
+        'paragraphs': f'<div id="wrap">{paragraphs}</div>'
+    }[layout]
+    json_ld = json.dumps({'@type': 'NewsArticle', 'author': {'name': f'Author {index}'},
+                          'datePublished': f'2024-01-{index % 28 + 1:02d}'})
+    menu = ''.join(f'<li><a href="/s{i}">Section {i}</a></li>' for i in range(40))
+    scripts = ''.join(f'<script>var tracker{i} = {{id: {i}, data: "{"x" * 200}"}};</script>' for i in range(10))
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Page {index} | Example News</title>
+<meta name="author" content="Meta Author {index}">
+<meta property="article:published_time" content="2024-02-{index % 28 + 1:02d}">
+<script type="application/ld+json">{json_ld}</script>
+<style>body {{ font-family: sans-serif; }}</style>{scripts}</head>
+<body><nav><ul>{menu}</ul></nav><header><h2>Example News</h2></header>
+{body}
+<advertisement>Buy now</advertisement><footer><p>Impressum</p></footer></body></html>""".encode('utf-8')
+
+
+def load_corpus(path, pages, seed):
+    if path:
+        files = sorted(glob.glob(os.path.join(path, '**', '*.htm*'), recursive=True))
+        return [(os.path.relpath(name, path), open(name, 'rb').read()) for name in files]
+    rng = random.Random(seed)
+    return [(f'synthetic-{index}.html', synthetic_page(rng, index)) for index in range(pages)]
+
+
+def measure(scraper, corpus, parser, repeat):
+    timings = []
+    outputs = {}
+    for _ in range(repeat):
+        for name, raw in corpus:
+            started = time.perf_counter()
+            outputs[name] = scraper.extract(raw, f'https://example.com/{name}', parser=parser)
+            timings.append(time.perf_counter() - started)
+    total_bytes = sum(len(raw) for _, raw in corpus) * repeat
+    return outputs, {
+        'pages_per_second': round(len(timings) / sum(timings), 1),
+        'mb_per_second': round(total_bytes / sum(timings) / 1e6, 2),
+        'median_ms': round(statistics.median(timings) * 1000, 3),
+        'p99_ms': round(sorted(timings)[int(len(timings) * 0.99) - 1] * 1000, 3)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--corpus', help='Verzeichnis mit gespeicherten .html-Seiten')
+    parser.add_argument('--pages', type=int, default=200, help='Seiten im synthetischen Korpus')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, args.pages, args.seed)
+    if not corpus:
+        parser.error('Keine HTML-Seiten gefunden')
+
+    scraper = app.WebScraper(cache=None)
+    bs4_outputs, bs4_report = measure(scraper, corpus, 'bs4', args.repeat)
+    lxml_outputs, lxml_report = measure(scraper, corpus, 'lxml', args.repeat)
+
+    mismatches = [name for name, _ in corpus if bs4_outputs[name] != lxml_outputs[name]]
+    report = {
+        'pages': len(corpus),
+        'corpus_bytes': sum(len(raw) for _, raw in corpus),
+        'bs4': bs4_report,
+        'lxml': lxml_report,
+        'speedup': round(lxml_report['pages_per_second'] / bs4_report['pages_per_second'], 2),
+        'identical_output': round(1 - len(mismatches) / len(corpus), 4),
+        'mismatches': mismatches[:20]
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
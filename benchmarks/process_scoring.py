@@ -0,0 +1,77 @@
+"""Scoring-Benchmark: Heuristiken im Request-Thread gegen den Prozess-Pool.
+
+Analysiert einen Batch aus den Beispieltexten einmal inline und anschließend
+mit ``ANALYSIS_BACKEND=process`` für jede angegebene Prozessanzahl. Ausgegeben
+werden Dokumente/s, Speedup gegenüber inline und die Effizienz pro Prozess.
+Der erste Batch je Pool dient als Warm-up (Prozessstart, Initializer).
+
+    python benchmarks/process_scoring.py --documents 2000 --processes 1 4 16 32
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CREDIBILITY_MODE', 'lite')
+os.environ.setdefault('DATABASE_PATH', os.path.join(tempfile.gettempdir(), 'credibility_bench_import.db'))
+
+import app  # noqa: E402
+
+
+def corpus(documents):
+    """Beispieltexte aller Sprachen, durch Suffixe unterscheidbar"""
+    samples = [text for language in app.EXAMPLE_CONTENT.values() for text in language.values()]
+    return [f'{samples[index % len(samples)]} [{index}]' for index in range(documents)]
+
+
+def measure(analyzer, texts, repeat):
+    analyzer.analyze_batch(texts[:len(texts) // 10 or 1])  # Warm-up
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        analyzer.analyze_batch(texts)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--documents', type=int, default=1000)
+    parser.add_argument('--processes', type=int, nargs='+', default=[os.cpu_count() or 1])
+    parser.add_argument('--chunk-size', type=int, default=app.ANALYSIS_CHUNK_SIZE)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    texts = corpus(args.documents)
+    inline_seconds = measure(app.CredibilityAnalyzer(mode='lite', backend='inline'), texts, args.repeat)
+    report = {
+        'documents': args.documents,
+        'cpu_count': os.cpu_count(),
+        'inline': {'seconds': round(inline_seconds, 3), 'docs_per_second': round(args.documents / inline_seconds, 1)},
+        'process': []
+    }
+
+    for processes in args.processes:
+        analyzer = app.CredibilityAnalyzer(mode='lite', backend='process')
+        analyzer.scoring_pool = app.ScoringPool(max_workers=processes, chunk_size=args.chunk_size)
+        seconds = measure(analyzer, texts, args.repeat)
+        analyzer.scoring_pool.shutdown()
+        speedup = inline_seconds / seconds
+        report['process'].append({
+            'processes': processes,
+            'seconds': round(seconds, 3),
+            'docs_per_second': round(args.documents / seconds, 1),
+            'speedup': round(speedup, 2),
+            'efficiency': round(speedup / processes, 2)
+        })
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
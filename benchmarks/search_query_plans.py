@@ -0,0 +1,134 @@
+"""Query-Plan- und Latenz-Check für die gefilterte Suche.
+
+Füllt eine temporäre Datenbank mit synthetischen Analysen, gibt für typische
+Dashboard-Filter den Plan (EXPLAIN QUERY PLAN) und die Median-Latenz aus und
+beendet sich mit Exit-Code 1, wenn eine reine Filter-Abfrage die Tabelle ohne
+Index durchsucht.
+
+    python benchmarks/search_query_plans.py --rows 1000000 --repeat 20
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CREDIBILITY_MODE', 'lite')
+os.environ.setdefault('DATABASE_PATH', os.path.join(tempfile.gettempdir(), 'credibility_bench_import.db'))
+
+import app  # noqa: E402
+
+DOMAINS = ['example.com', 'www.nature.com', 'news.example.org', 'blog.example.net', 'uni-example.de']
+
+CASES = [
+    ('ohne Filter', '', {}),
+    ('Klassifikation', '', {'credibility': 'high'}),
+    ('Klassifikation + Zeitraum', '', {'credibility': 'low', 'date_from': '2024-01-01', 'date_to': '2024-03-31'}),
+    ('Zeitraum', '', {'date_from': '2024-02-01', 'date_to': '2024-02-07'}),
+    ('Wortanzahl', '', {'min_words': '1500', 'max_words': '1600'}),
+    ('Domain', '', {'domain': 'nature.com'}),
+    ('Score-Bereich', '', {'min_score': '0.95'}),
+    ('Kombiniert', '', {'credibility': 'high', 'min_score': '0.8', 'min_words': '500', 'domain': 'example.com'}),
+    ('Volltext + Klassifikation', 'meditation', {'credibility': 'high'})
+]
+
+
+def synthetic_rows(count, seed=42):
+    rng = random.Random(seed)
+    start = time.mktime((2024, 1, 1, 0, 0, 0, 0, 0, -1))
+    for index in range(count):
+        score = rng.random()
+        yield {
+            'content': f'Synthetic article {index} about {"meditation" if index % 50 == 0 else "science"}',
+            'title': f'Article {index}',
+            'domain': rng.choice(DOMAINS),
+            'credibility_score': score,
+            'classification': ('questionable', 'low', 'medium', 'high')[min(int(score * 4), 3)],
+            'confidence': 0.8,
+            'word_count': rng.randint(50, 3000),
+            'created_at': time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(start + index * 30))
+        }
+
+
+def populate(manager, rows, batch=5000):
+    """Schreibt die Zeilen direkt (inkl. created_at) in Batches"""
+    with manager.connection() as conn:
+        cursor = conn.cursor()
+        pending = []
+        for row in synthetic_rows(rows):
+            pending.append((row['content'], row['title'], row['domain'], row['credibility_score'],
+                            row['classification'], row['confidence'], row['word_count'], row['created_at']))
+            if len(pending) >= batch:
+                cursor.executemany('''
+                INSERT INTO credibility_analyses (
+                    content, title, domain, credibility_score, classification, confidence, word_count, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', pending)
+                pending = []
+        if pending:
+            cursor.executemany('''
+            INSERT INTO credibility_analyses (
+                content, title, domain, credibility_score, classification, confidence, word_count, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', pending)
+        conn.commit()
+        cursor.execute('ANALYZE')
+        conn.commit()
+
+
+def full_scan(plan):
+    return any(line.startswith('SCAN credibility_analyses') and 'USING' not in line for line in plan)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    fd, db_path = tempfile.mkstemp(suffix='.db', prefix='credibility_search_')
+    os.close(fd)
+    os.unlink(db_path)
+    manager = app.DatabaseManager(db_path)
+
+    started = time.perf_counter()
+    populate(manager, args.rows)
+    report = {'rows': args.rows, 'populate_seconds': round(time.perf_counter() - started, 2), 'cases': []}
+
+    failed = False
+    for name, query, filters in CASES:
+        plan = manager.explain_search(query, filters)
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            results = manager.search_content(query, filters)
+            timings.append((time.perf_counter() - started) * 1000)
+        scan = not query and full_scan(plan)
+        failed = failed or scan
+        report['cases'].append({
+            'name': name,
+            'filters': filters,
+            'query': query,
+            'results': len(results),
+            'median_ms': round(statistics.median(timings), 2),
+            'plan': plan,
+            'full_table_scan': scan
+        })
+
+    manager.close()
+    for suffix in ('', '-wal', '-shm'):
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(db_path + suffix)
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,277 @@
+"""Reproduzierbare Benchmark-Suite: Analyzer, Datenbank und HTML-Extraktion.
+
+Alle Eingaben stammen aus dem synthetischen Korpus (benchmarks/corpus.py) mit
+festem Seed. Gemessen werden:
+
+* analyzer: Dokumente/s, p50/p99-Latenz, Spitzen-RSS und mittlere Kosten pro
+  Pipeline-Schritt (StageMetrics) je Dokumentgröße
+* database: Insert-Rate (Batches über save_analyses), Volltext- und
+  Filtersuche sowie get_statistics, jeweils nach Erreichen der Zeilenzahlen
+* scraper: Extraktion über gespeicherte HTML-Fixtures (``--fixtures``) oder
+  erzeugte Seiten
+
+Das Ergebnis ist JSON mit Commit, Python-Version und Parametern und lässt sich
+mit benchmarks/compare.py gegen einen früheren Lauf vergleichen.
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --sections database --rows 10000 1000000 --output db.json
+"""
+
+import argparse
+import contextlib
+import datetime
+import glob
+import json
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('CREDIBILITY_MODE', 'lite')
+os.environ.setdefault('DATABASE_PATH', os.path.join(tempfile.gettempdir(), 'credibility_bench_import.db'))
+
+import app  # noqa: E402
+import corpus  # noqa: E402
+
+SECTIONS = ('analyzer', 'database', 'scraper')
+
+SEARCH_TERMS = ('study', 'Studie', 'université', 'investigación', 'percent', 'shocking')
+
+
+def percentile(values, fraction):
+    """Nächster Rang; ``values`` muss sortiert sein"""
+    return values[max(0, math.ceil(len(values) * fraction) - 1)]
+
+
+def latency(timings):
+    """p50/p99/Mittel in Millisekunden aus Sekunden-Messwerten"""
+    timings = sorted(timings)
+    return {
+        'p50_ms': round(percentile(timings, 0.5) * 1000, 3),
+        'p99_ms': round(percentile(timings, 0.99) * 1000, 3),
+        'mean_ms': round(sum(timings) / len(timings) * 1000, 3)
+    }
+
+
+def peak_rss_mb():
+    """Bisherige Spitzen-RSS des Prozesses (ru_maxrss: KB unter Linux, Bytes unter macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def git_revision():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=root, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=root,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'dirty': None}
+    return {'commit': commit, 'dirty': dirty}
+
+
+def bench_analyzer(args):
+    analyzer = app.CredibilityAnalyzer(mode='lite', backend='inline')
+    analyzer.analyze_content(app.EXAMPLE_CONTENT['en']['high_quality'])  # Warm-up (Lazy Imports)
+
+    report = []
+    for words in args.sizes:
+        documents = max(args.min_documents, args.word_budget // words)
+        texts = [document['content'] for document in
+                 corpus.generate_corpus(documents, words, args.language, seed=args.seed)]
+
+        timings = []
+        stages = {}
+        for text in texts:
+            with app.metrics.collect() as collected:
+                started = time.perf_counter()
+                analyzer.analyze_content(text, detail=args.detail)
+                timings.append(time.perf_counter() - started)
+            for stage, duration_ns in collected.items():
+                stages[stage] = stages.get(stage, 0) + duration_ns
+
+        total = sum(timings)
+        report.append({
+            'words': words,
+            'documents': documents,
+            'docs_per_second': round(documents / total, 2),
+            'words_per_second': round(sum(len(text.split()) for text in texts) / total, 1),
+            **latency(timings),
+            'peak_rss_mb': peak_rss_mb(),
+            'stages_mean_ms': {stage: round(duration_ns / documents / 1e6, 3)
+                               for stage, duration_ns in sorted(stages.items())}
+        })
+    return report
+
+
+def analysis_rows(documents, start, count):
+    """Gespeicherte Analysen; Texte aus dem Korpus, durch die Zeilennummer eindeutig"""
+    rows = []
+    for index in range(start, start + count):
+        document = documents[index % len(documents)]
+        content = f"{document['content']} [{index}]"
+        rows.append({
+            'content': content,
+            'url': f'https://news{index % 500}.example.com/{index}',
+            'title': f'Benchmark {index}',
+            'domain': f'news{index % 500}.example.com',
+            'credibility_score': (index * 37 % 100) / 100.0,
+            'content_quality_score': 0.5,
+            'factual_accuracy_score': 0.5,
+            'source_reliability_score': 0.5,
+            'classification': app.DatabaseManager.CLASSIFICATIONS[index % 4],
+            'confidence': 0.9,
+            'word_count': len(content.split()),
+            'sentence_count': content.count('.'),
+            'char_count': len(content),
+            'sources_found': index % 5,
+            'language': document['language'],
+            'recommendations': ['Benchmark'],
+            'issues_detected': []
+        })
+    return rows
+
+
+def timed(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return latency(timings)
+
+
+def bench_database(args):
+    fd, db_path = tempfile.mkstemp(suffix='.db', prefix='credibility_bench_')
+    os.close(fd)
+    os.unlink(db_path)
+    manager = app.DatabaseManager(db_path)
+    documents = corpus.generate_corpus(997, args.row_words, seed=args.seed)
+
+    report = []
+    try:
+        rows = 0
+        insert_seconds = 0.0
+        for target in sorted(args.rows):
+            started_rows = rows
+            started = time.perf_counter()
+            while rows < target:
+                batch = min(args.batch_size, target - rows)
+                manager.save_analyses(analysis_rows(documents, rows, batch))
+                rows += batch
+            elapsed = time.perf_counter() - started
+            insert_seconds += elapsed
+
+            report.append({
+                'rows': target,
+                'insert_rows_per_second': round((rows - started_rows) / elapsed, 1) if elapsed else None,
+                'insert_seconds_total': round(insert_seconds, 2),
+                'database_mb': round(sum(os.path.getsize(db_path + suffix) for suffix in ('', '-wal')
+                                         if os.path.exists(db_path + suffix)) / 1e6, 1),
+                'search_fulltext': timed(
+                    lambda: [manager.search_content(term, {}) for term in SEARCH_TERMS], args.repeat),
+                'search_filtered': timed(
+                    lambda: manager.search_content('', {'credibility': 'high', 'min_score': '0.5'}), args.repeat),
+                'statistics': timed(manager.get_statistics, args.repeat)
+            })
+    finally:
+        manager.close()
+        for suffix in ('', '-wal', '-shm'):
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(db_path + suffix)
+    return report
+
+
+def load_fixtures(args):
+    if args.fixtures:
+        pages = []
+        for path in sorted(glob.glob(os.path.join(args.fixtures, '*.html'))):
+            with open(path, 'rb') as f:
+                pages.append((os.path.basename(path), f.read()))
+        return pages
+    documents = corpus.generate_corpus(args.pages, args.page_words, seed=args.seed)
+    return [(f'page-{index}', corpus.render_html(document, index)) for index, document in enumerate(documents)]
+
+
+def bench_scraper(args):
+    pages = load_fixtures(args)
+    if not pages:
+        raise SystemExit(f'Keine .html-Dateien in {args.fixtures}')
+    scraper = app.WebScraper()
+    for name, raw in pages[:10]:  # Warm-up
+        scraper.extract(raw, f'https://example.com/{name}')
+
+    timings = []
+    for _ in range(args.repeat):
+        for name, raw in pages:
+            started = time.perf_counter()
+            scraper.extract(raw, f'https://example.com/{name}')
+            timings.append(time.perf_counter() - started)
+
+    total = sum(timings)
+    return {
+        'pages': len(pages),
+        'source': args.fixtures or 'synthetic',
+        'pages_per_second': round(len(timings) / total, 1),
+        'mb_per_second': round(sum(len(raw) for _, raw in pages) * args.repeat / total / 1e6, 2),
+        **latency(timings)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sections', nargs='+', choices=SECTIONS, default=list(SECTIONS))
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', help='JSON-Datei (zusätzlich zur Ausgabe auf stdout)')
+    analyzer = parser.add_argument_group('analyzer')
+    analyzer.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000, 100000],
+                          help='Dokumentgrößen in Wörtern')
+    analyzer.add_argument('--language', choices=corpus.LANGUAGES + ('mixed',), default='mixed')
+    analyzer.add_argument('--word-budget', type=int, default=300000,
+                          help='Wörter je Größe; daraus folgt die Dokumentanzahl')
+    analyzer.add_argument('--min-documents', type=int, default=5)
+    analyzer.add_argument('--detail', choices=app.CredibilityAnalyzer.DETAIL_LEVELS, default='full')
+    database = parser.add_argument_group('database')
+    database.add_argument('--rows', type=int, nargs='+', default=[10000],
+                          help='Messpunkte (Zeilen), z.B. 10000 1000000')
+    database.add_argument('--batch-size', type=int, default=1000)
+    database.add_argument('--row-words', type=int, default=120)
+    scraper = parser.add_argument_group('scraper')
+    scraper.add_argument('--fixtures', help='Verzeichnis mit gespeicherten .html-Seiten')
+    scraper.add_argument('--pages', type=int, default=200, help='Seiten ohne --fixtures')
+    scraper.add_argument('--page-words', type=int, default=800)
+    parser.add_argument('--repeat', type=int, default=20, help='Wiederholungen für DB-Abfragen und Extraktion')
+    args = parser.parse_args()
+
+    report = {
+        'meta': {
+            **git_revision(),
+            'analysis_version': app.ANALYSIS_VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'args': vars(args)
+        }
+    }
+    benchmarks = {'analyzer': bench_analyzer, 'database': bench_database, 'scraper': bench_scraper}
+    for section in args.sections:
+        started = time.perf_counter()
+        report[section] = benchmarks[section](args)
+        print(f'{section}: {time.perf_counter() - started:.1f}s', file=sys.stderr)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    print(output)
+
+
+if __name__ == '__main__':
+    main()